@@ -8,16 +8,187 @@ Usage from record-tour.py:
     from colab.colab_dispatcher import ColabTTSDispatcher
     dispatcher = ColabTTSDispatcher(drive_base="~/Google Drive/autonomous-recording/tts-jobs")
     step_audio = dispatcher.dispatch_and_wait(spec, audio_dir)
+
+From async code, await the coroutine directly so several jobs can run at once:
+    step_audio = await dispatcher.dispatch_and_wait_async(spec, audio_dir)
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import shutil
+import tempfile
 import time
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import aclosing, contextmanager
 from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+# Filesystem types whose changes made on the remote side never reach inotify.
+# rclone and google-drive-ocamlfuse both mount as fuse.*; these must be polled.
+_POLLING_FS_TYPES = ("fuse", "nfs", "cifs", "smb")
+
+# With event-driven waits, wake up at least this often to log progress and
+# enforce the job timeout even when nothing on disk changes.
+_WATCH_TICK_MS = 10_000
+
+# Max concurrent result copies from Drive. FUSE mounts serve parallel reads
+# well, but unbounded fan-out just queues up behind the sync daemon.
+_COPY_CONCURRENCY = 8
+
+# How many times to re-check a WAV whose size doesn't yet match the
+# done.marker manifest (Drive can surface the marker before the audio).
+_MANIFEST_RETRIES = 5
+
+# Per-candidate budget when probing Drive mount points. A cold Drive FUSE
+# mount can block a stat for seconds; treat anything slower as unavailable.
+_PROBE_TIMEOUT = 0.2
+
+
+@lru_cache(maxsize=None)
+def _exists_fast(path: str) -> bool:
+    """Cached os.path.exists(); each stat on Drive FUSE is a round trip."""
+    return os.path.exists(path)
+
+
+def _first_available(candidates: list[Path]) -> Path | None:
+    """Return the first candidate whose parent directory exists.
+
+    Parents are probed concurrently and any stat that hasn't answered within
+    _PROBE_TIMEOUT is treated as missing, so a cold mount can't stall startup.
+    Candidate order is preserved among the probes that did answer.
+    """
+    pool = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        futures = [pool.submit(_exists_fast, str(c.parent)) for c in candidates]
+        wait(futures, timeout=_PROBE_TIMEOUT)
+        for candidate, future in zip(candidates, futures):
+            if future.done() and future.result():
+                return candidate
+        return None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _is_network_mount(path: Path) -> bool:
+    """Return True if path lives on a FUSE/network mount (Linux only)."""
+    try:
+        with open("/proc/mounts", "r", encoding="utf-8") as f:
+            mounts = [line.split()[1:3] for line in f if line.strip()]
+    except OSError:
+        return False
+
+    path_str = str(path)
+    best_mount = ""
+    best_type = ""
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace("\\040", " ")
+        prefix = mount_point.rstrip("/") + "/"
+        if path_str == mount_point or path_str.startswith(prefix):
+            if len(mount_point) > len(best_mount):
+                best_mount, best_type = mount_point, fs_type
+    return best_type.startswith(_POLLING_FS_TYPES)
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _list_names(directory: Path) -> set[str]:
+    """Return entry names in directory from one read (empty if missing).
+
+    On Drive FUSE every stat is a round trip, so checking both markers via a
+    single listing is cheaper than two Path.exists() calls.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+def _count_wavs(directory: Path) -> int:
+    """Count *.wav entries with a single directory read (no per-file stat)."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".wav"))
+    except FileNotFoundError:
+        return 0
+
+
+def _write_request(path: Path, request: dict[str, Any]) -> None:
+    """Write a job's request.json compactly (read once by the worker).
+
+    Uses orjson when it is installed, otherwise the stdlib C encoder.
+    """
+    try:
+        import orjson
+    except ImportError:
+        data = json.dumps(request, separators=(",", ":")).encode("utf-8")
+    else:
+        data = orjson.dumps(request)
+    with path.open("wb") as f:
+        f.write(data)
+
+
+@contextmanager
+def _staged_job_dir(drive_base: Path, job_id: str) -> Iterator[Path]:
+    """Yield a staging dir that is renamed to drive_base/job_id on success.
+
+    Workers start on any job dir containing request.json, so inputs are
+    written into a hidden sibling of drive_base (same mount, outside the
+    watched directory) and the finished job appears with a single rename.
+    """
+    staging = Path(
+        tempfile.mkdtemp(prefix=f".staging-{job_id}-", dir=drive_base.parent)
+    )
+    try:
+        yield staging
+        os.replace(staging, drive_base / job_id)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+async def _watch_job_dir(
+    job_dir: Path, poll_interval: float, use_polling: bool
+) -> AsyncIterator[None]:
+    """Yield whenever the job directory may have changed.
+
+    Uses OS change notification via watchfiles when it is installed, waking
+    at least every _WATCH_TICK_MS. Without watchfiles, falls back to sleeping
+    poll_interval seconds between yields.
+    """
+    try:
+        from watchfiles import awatch
+    except ImportError:
+        while True:
+            yield
+            await asyncio.sleep(poll_interval)
+
+    # Markers may already exist before the watcher is armed
+    yield
+    async for _changes in awatch(
+        job_dir,
+        debounce=400,
+        step=50,
+        rust_timeout=_WATCH_TICK_MS,
+        yield_on_timeout=True,
+        force_polling=use_polling,
+        poll_delay_ms=int(poll_interval * 1000),
+    ):
+        yield
+
 
 @dataclass
 class ColabTTSConfig:
@@ -41,6 +212,10 @@ class ColabTTSConfig:
     # How long to wait for Drive sync after writing job (seconds)
     sync_delay: float = 10.0
 
+    # Poll instead of waiting for filesystem events. None = auto-detect
+    # (True on FUSE/network mounts, where inotify misses remote changes).
+    use_polling: bool | None = None
+
 
 class ColabTTSError(Exception):
     """Raised when Colab TTS dispatch fails."""
@@ -58,15 +233,23 @@ class ColabTTSDispatcher:
         4. Colab writes job_dir/<job-id>/done.marker
         5. Google Drive syncs back to local
         6. Local reads WAV files from job_dir/<job-id>/audio/
+
+    Subclasses change the request payload by overriding _build_request().
     """
 
+    # Used in log lines, e.g. "Creating TTS job: ..."
+    job_kind = "TTS"
+
     def __init__(self, config: ColabTTSConfig) -> None:
         self.config = config
         self.drive_base = Path(os.path.expanduser(str(config.drive_base))).resolve()
+        self.use_polling = (
+            config.use_polling
+            if config.use_polling is not None
+            else _is_network_mount(self.drive_base)
+        )
 
     def _log(self, message: str) -> None:
-        from datetime import datetime
-
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{now}] [colab-tts] {message}", flush=True)
 
@@ -74,6 +257,14 @@ class ColabTTSDispatcher:
         self,
         spec: dict[str, Any],
         audio_dir: Path,
+    ) -> dict[str, dict[str, Any]]:
+        """Blocking wrapper around dispatch_and_wait_async()."""
+        return asyncio.run(self.dispatch_and_wait_async(spec, audio_dir))
+
+    async def dispatch_and_wait_async(
+        self,
+        spec: dict[str, Any],
+        audio_dir: Path,
     ) -> dict[str, dict[str, Any]]:
         """Dispatch TTS job to Colab and wait for results.
 
@@ -86,7 +277,7 @@ class ColabTTSDispatcher:
             (same format as prerender_tts)
         """
         # Validate Drive directory is accessible
-        if not self.drive_base.parent.exists():
+        if not _exists_fast(str(self.drive_base.parent)):
             raise ColabTTSError(
                 f"Google Drive sync directory not found: {self.drive_base.parent}\n"
                 "Make sure Google Drive is mounted/synced on this machine.\n"
@@ -97,12 +288,8 @@ class ColabTTSDispatcher:
 
         # Create job
         job_id = self._create_job_id()
-        job_dir = self.drive_base / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-
-        self._log(f"Creating TTS job: {job_id}")
+        self._log(f"Creating {self.job_kind} job: {job_id}")
 
-        # Build request
         settings = spec["settings"]
         items = spec.get("steps") or spec.get("segments", [])
 
@@ -115,83 +302,97 @@ class ColabTTSDispatcher:
         if not steps_data:
             raise ColabTTSError("No narration text found in spec")
 
-        request = {
-            "voice": str(settings.get("voice", "am_michael")),
-            "speed": float(settings.get("speech_speed", 1.0)),
-            "language": str(settings.get("language", "en-us")),
-            "steps": steps_data,
-        }
-
-        # Write request file
-        request_path = job_dir / "request.json"
-        with request_path.open("w", encoding="utf-8") as f:
-            json.dump(request, f, indent=2)
+        # Build and write request file, then publish the job dir in one rename
+        with _staged_job_dir(self.drive_base, job_id) as staging:
+            request = self._build_request(settings, steps_data, staging)
+            _write_request(staging / "request.json", request)
+        job_dir = self.drive_base / job_id
 
         self._log(f"Job {job_id}: {len(steps_data)} steps dispatched to Drive")
         self._log(f"Waiting {self.config.sync_delay:.0f}s for Drive sync...")
-        time.sleep(self.config.sync_delay)
+        await asyncio.sleep(self.config.sync_delay)
 
         # Wait for completion
-        step_audio = self._wait_for_completion(job_id, job_dir, audio_dir, items)
+        step_audio = await self._wait_for_completion(job_id, job_dir, audio_dir, items)
         return step_audio
 
     def _create_job_id(self) -> str:
-        """Generate a unique job ID based on timestamp."""
-        from datetime import datetime
+        """Generate a unique job ID: timestamp plus a random suffix, so jobs
+        dispatched concurrently within the same microsecond still differ."""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        return f"job-{stamp}-{uuid.uuid4().hex[:8]}"
+
+    def _build_request(
+        self,
+        settings: dict[str, Any],
+        steps_data: list[dict[str, str]],
+        job_dir: Path,
+    ) -> dict[str, Any]:
+        """Build the request.json payload.
 
-        return datetime.now().strftime("job-%Y%m%d-%H%M%S")
+        job_dir is the (staging) job directory; extra input files the worker
+        needs can be copied into it.
+        """
+        return {
+            "voice": str(settings.get("voice", "am_michael")),
+            "speed": float(settings.get("speech_speed", 1.0)),
+            "language": str(settings.get("language", "en-us")),
+            "steps": steps_data,
+        }
 
-    def _wait_for_completion(
+    async def _wait_for_completion(
         self,
         job_id: str,
         job_dir: Path,
         audio_dir: Path,
         items: list[dict[str, Any]],
     ) -> dict[str, dict[str, Any]]:
-        """Poll for job completion and copy results."""
+        """Wait for job completion and copy results."""
         done_marker = job_dir / "done.marker"
         error_marker = job_dir / "error.marker"
         remote_audio_dir = job_dir / "audio"
 
-        deadline = time.time() + self.config.timeout
+        started = time.time()
         last_status = ""
 
         self._log(f"Waiting for Colab worker (timeout: {self.config.timeout:.0f}s)...")
 
-        while time.time() < deadline:
-            # Check for error
-            if error_marker.exists():
-                try:
-                    with error_marker.open("r") as f:
-                        error_info = json.load(f)
-                    raise ColabTTSError(
-                        f"Colab worker reported error: {error_info.get('error', 'unknown')}"
-                    )
-                except json.JSONDecodeError:
-                    raise ColabTTSError(
-                        "Colab worker reported error (could not read details)"
-                    )
-
-            # Check for completion
-            if done_marker.exists():
-                self._log("Job completed by Colab worker!")
-                break
-
-            # Status update
-            elapsed = self.config.timeout - (deadline - time.time())
-            status = f"waiting... ({elapsed:.0f}s elapsed)"
-            if status != last_status:
-                # Check if any WAVs have appeared (progress indicator)
-                wav_count = 0
-                if remote_audio_dir.exists():
-                    wav_count = len(list(remote_audio_dir.glob("*.wav")))
-                if wav_count > 0:
-                    status = f"generating... ({wav_count} WAVs so far, {elapsed:.0f}s elapsed)"
-                self._log(status)
-                last_status = status
-
-            time.sleep(self.config.poll_interval)
-        else:
+        try:
+            async with asyncio.timeout(self.config.timeout), aclosing(
+                _watch_job_dir(job_dir, self.config.poll_interval, self.use_polling)
+            ) as changes:
+                async for _ in changes:
+                    names = _list_names(job_dir)
+
+                    # Check for error
+                    if error_marker.name in names:
+                        try:
+                            with error_marker.open("r") as f:
+                                error_info = json.load(f)
+                            raise ColabTTSError(
+                                f"Colab worker reported error: {error_info.get('error', 'unknown')}"
+                            )
+                        except json.JSONDecodeError:
+                            raise ColabTTSError(
+                                "Colab worker reported error (could not read details)"
+                            )
+
+                    # Check for completion
+                    if done_marker.name in names:
+                        self._log("Job completed by Colab worker!")
+                        break
+
+                    # Status update
+                    elapsed = time.time() - started
+                    status = f"waiting... ({elapsed:.0f}s elapsed)"
+                    if status != last_status:
+                        # Check if any WAVs have appeared (progress indicator)
+                        wav_count = _count_wavs(remote_audio_dir)
+                        if wav_count > 0:
+                            status = f"generating... ({wav_count} WAVs so far, {elapsed:.0f}s elapsed)"
+                        self._log(status)
+                        last_status = status
+        except TimeoutError:
             raise ColabTTSError(
                 f"Timeout waiting for Colab worker ({self.config.timeout:.0f}s).\n"
                 "Check that:\n"
@@ -199,9 +400,10 @@ class ColabTTSDispatcher:
                 "  2. The watcher cell (cell 8) is executing\n"
                 "  3. Google Drive sync is working on both ends\n"
                 f"  Job directory: {job_dir}"
-            )
+            ) from None
 
         # Read completion metadata
+        completion: dict[str, Any] = {}
         try:
             with done_marker.open("r") as f:
                 completion = json.load(f)
@@ -213,50 +415,108 @@ class ColabTTSDispatcher:
             pass
 
         # Copy WAV files to local audio directory
-        return self._copy_results(job_dir, audio_dir, items)
+        return await self._copy_results(
+            job_dir, audio_dir, items, completion.get("files", [])
+        )
 
-    def _copy_results(
+    async def _copy_results(
         self,
         job_dir: Path,
         audio_dir: Path,
         items: list[dict[str, Any]],
+        manifest: list[dict[str, Any]] | None = None,
     ) -> dict[str, dict[str, Any]]:
-        """Copy WAV files from Drive job dir to local audio dir."""
+        """Copy WAV files from Drive job dir to local audio dir.
+
+        When done.marker carries a files manifest (name, size, sha256), each
+        WAV is only copied once its size matches, and the copy is verified.
+        """
         import soundfile as sf
 
+        expected_files = {str(entry["name"]): entry for entry in manifest or []}
+
         remote_audio_dir = job_dir / "audio"
         audio_dir.mkdir(parents=True, exist_ok=True)
 
-        step_audio: dict[str, dict[str, Any]] = {}
-        total_duration = 0.0
-
+        copies: list[tuple[str, Path, Path]] = []
         for item in items:
             step_id = str(item["id"])
             narration = str(item.get("narration", "")).strip()
             if not narration:
                 continue
+            copies.append(
+                (
+                    step_id,
+                    remote_audio_dir / f"step-{step_id}.wav",
+                    audio_dir / f"step-{step_id}.wav",
+                )
+            )
 
-            remote_wav = remote_audio_dir / f"step-{step_id}.wav"
-            local_wav = audio_dir / f"step-{step_id}.wav"
+        def fetch(remote_wav: Path, local_wav: Path) -> None:
+            expected = expected_files.get(remote_wav.name)
+            if expected is None:
+                # Older workers don't write a manifest; trust done.marker
+                if not remote_wav.exists():
+                    raise ColabTTSError(f"Expected WAV file not found: {remote_wav}")
+                shutil.copyfile(remote_wav, local_wav)
+                return
 
-            if not remote_wav.exists():
-                raise ColabTTSError(
-                    f"Expected WAV file not found: {remote_wav}\n"
-                    "The Colab worker may not have generated all steps."
-                )
+            for _ in range(_MANIFEST_RETRIES):
+                try:
+                    size = os.path.getsize(remote_wav)
+                except FileNotFoundError:
+                    size = -1
+                if size == int(expected["size"]):
+                    shutil.copyfile(remote_wav, local_wav)
+                    sha256 = expected.get("sha256")
+                    if not sha256 or _sha256_file(local_wav) == sha256:
+                        return
+                time.sleep(self.config.poll_interval)
+
+            raise ColabTTSError(
+                f"{remote_wav.name} does not match the done.marker manifest "
+                f"after {_MANIFEST_RETRIES} checks (Drive may still be syncing)"
+            )
 
+        def copy_one(remote_wav: Path, local_wav: Path) -> float:
             # Copy to local audio directory
-            shutil.copy2(remote_wav, local_wav)
+            fetch(remote_wav, local_wav)
 
-            # Read duration
-            data, sample_rate = sf.read(str(local_wav), always_2d=False)
-            sample_count = data.shape[0] if hasattr(data, "shape") else len(data)
-            duration = float(sample_count) / float(sample_rate)
+            # Read duration from the header; no need to decode the samples
+            info = sf.info(str(local_wav))
+            return float(info.frames) / float(info.samplerate)
 
-            step_audio[step_id] = {"path": local_wav, "duration": duration}
-            total_duration += duration
+        semaphore = asyncio.Semaphore(_COPY_CONCURRENCY)
 
-            self._log(f"  ✓ {local_wav.name} ({duration:.2f}s)")
+        async def copy_bounded(remote_wav: Path, local_wav: Path) -> float:
+            async with semaphore:
+                return await asyncio.to_thread(copy_one, remote_wav, local_wav)
+
+        outcomes = await asyncio.gather(
+            *(copy_bounded(remote, local) for _, remote, local in copies),
+            return_exceptions=True,
+        )
+
+        step_audio: dict[str, dict[str, Any]] = {}
+        total_duration = 0.0
+        failures: list[str] = []
+
+        for (step_id, _, local_wav), outcome in zip(copies, outcomes):
+            if isinstance(outcome, BaseException):
+                failures.append(f"  step {step_id}: {outcome}")
+                continue
+
+            step_audio[step_id] = {"path": local_wav, "duration": outcome}
+            total_duration += outcome
+
+            self._log(f"  ✓ {local_wav.name} ({outcome:.2f}s)")
+
+        if failures:
+            raise ColabTTSError(
+                f"Failed to copy {len(failures)} WAV file(s):\n"
+                + "\n".join(failures)
+                + "\nThe Colab worker may not have generated all steps."
+            )
 
         self._log(f"Total: {total_duration:.2f}s of audio copied to {audio_dir}")
         return step_audio
@@ -291,16 +551,8 @@ def create_dispatcher_from_args(
             / "autonomous-recording"
             / "tts-jobs",
         ]
-        # Also check for rclone-style mounts
-        for candidate in candidates:
-            if candidate.parent.exists():
-                drive_path = str(candidate)
-                break
-
-        if drive_path is None:
-            drive_path = str(
-                Path.home() / "gdrive" / "autonomous-recording" / "tts-jobs"
-            )
+        found = _first_available(candidates)
+        drive_path = str(found or candidates[0])
 
     config = ColabTTSConfig(
         drive_base=Path(drive_path),
@@ -320,41 +572,15 @@ class ColabF5TTSDispatcher(ColabTTSDispatcher):
     - nfe_step: number of flow-matching steps (quality vs speed)
     """
 
-    def dispatch_and_wait(
-        self,
-        spec: dict[str, Any],
-        audio_dir: Path,
-    ) -> dict[str, dict[str, Any]]:
-        """Dispatch F5-TTS job to Colab and wait for results."""
-        if not self.drive_base.parent.exists():
-            raise ColabTTSError(
-                f"Google Drive sync directory not found: {self.drive_base.parent}\n"
-                "Make sure Google Drive is mounted/synced on this machine.\n"
-                "See colab/README.md for setup instructions."
-            )
-
-        self.drive_base.mkdir(parents=True, exist_ok=True)
-
-        job_id = self._create_job_id()
-        job_dir = self.drive_base / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-
-        self._log(f"Creating F5-TTS job: {job_id}")
-
-        # Build request
-        settings = spec["settings"]
-        items = spec.get("steps") or spec.get("segments", [])
-
-        steps_data = []
-        for item in items:
-            narration = str(item.get("narration", "")).strip()
-            if narration:
-                steps_data.append({"id": str(item["id"]), "narration": narration})
-
-        if not steps_data:
-            raise ColabTTSError("No narration text found in spec")
+    job_kind = "F5-TTS"
 
-        # F5-TTS specific fields
+    def _build_request(
+        self,
+        settings: dict[str, Any],
+        steps_data: list[dict[str, str]],
+        job_dir: Path,
+    ) -> dict[str, Any]:
+        """Build the F5-TTS request, shipping the reference clip with the job."""
         ref_audio = str(settings.get("f5_ref_audio", ""))
         ref_text = str(settings.get("f5_ref_text", ""))
         seed = settings.get("f5_seed", None)
@@ -368,7 +594,8 @@ class ColabF5TTSDispatcher(ColabTTSDispatcher):
             ref_audio = ref_path.name  # Just the filename in the job dir
             self._log(f"Copied reference audio: {ref_path.name}")
 
-        request = {
+        self._log(f"F5-TTS settings: ref={ref_audio or 'default'}, nfe={nfe_step}")
+        return {
             "ref_audio": ref_audio,
             "ref_text": ref_text,
             "speed": float(settings.get("speech_speed", 1.0)),
@@ -377,20 +604,6 @@ class ColabF5TTSDispatcher(ColabTTSDispatcher):
             "steps": steps_data,
         }
 
-        request_path = job_dir / "request.json"
-        with request_path.open("w", encoding="utf-8") as f:
-            json.dump(request, f, indent=2)
-
-        self._log(
-            f"Job {job_id}: {len(steps_data)} steps dispatched "
-            f"(ref={ref_audio or 'default'}, nfe={nfe_step})"
-        )
-        self._log(f"Waiting {self.config.sync_delay:.0f}s for Drive sync...")
-        time.sleep(self.config.sync_delay)
-
-        step_audio = self._wait_for_completion(job_id, job_dir, audio_dir, items)
-        return step_audio
-
 
 def create_f5_dispatcher_from_args(
     drive_path: str | None = None,
@@ -410,15 +623,8 @@ def create_f5_dispatcher_from_args(
             / "autonomous-recording"
             / "f5-tts-jobs",
         ]
-        for candidate in candidates:
-            if candidate.parent.exists():
-                drive_path = str(candidate)
-                break
-
-        if drive_path is None:
-            drive_path = str(
-                Path.home() / "gdrive" / "autonomous-recording" / "f5-tts-jobs"
-            )
+        found = _first_available(candidates)
+        drive_path = str(found or candidates[0])
 
     config = ColabTTSConfig(
         drive_base=Path(drive_path),
@@ -436,6 +642,7 @@ class ColabNVENCConfig:
     timeout: float = 1200.0
     poll_interval: float = 10.0
     sync_delay: float = 15.0
+    use_polling: bool | None = None
 
 
 class ColabNVENCError(Exception):
@@ -450,18 +657,21 @@ class ColabNVENCDispatcher:
     def __init__(self, config: ColabNVENCConfig) -> None:
         self.config = config
         self.drive_base = Path(os.path.expanduser(str(config.drive_base))).resolve()
+        self.use_polling = (
+            config.use_polling
+            if config.use_polling is not None
+            else _is_network_mount(self.drive_base)
+        )
 
     def _log(self, message: str) -> None:
-        from datetime import datetime
-
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{now}] [colab-nvenc] {message}", flush=True)
 
     def _create_job_id(self) -> str:
-        """Generate a unique job ID based on timestamp."""
-        from datetime import datetime
-
-        return datetime.now().strftime("job-%Y%m%d-%H%M%S")
+        """Generate a unique job ID: timestamp plus a random suffix, so jobs
+        dispatched concurrently within the same microsecond still differ."""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        return f"job-{stamp}-{uuid.uuid4().hex[:8]}"
 
     def dispatch_encode_job(
         self,
@@ -469,9 +679,23 @@ class ColabNVENCDispatcher:
         input_files: dict[str, Path],
         output_dir: Path,
         output_format: dict[str, object] | None = None,
+    ) -> dict[str, Path]:
+        """Blocking wrapper around dispatch_encode_job_async()."""
+        return asyncio.run(
+            self.dispatch_encode_job_async(
+                operations, input_files, output_dir, output_format
+            )
+        )
+
+    async def dispatch_encode_job_async(
+        self,
+        operations: list[dict[str, object]],
+        input_files: dict[str, Path],
+        output_dir: Path,
+        output_format: dict[str, object] | None = None,
     ) -> dict[str, Path]:
         """Dispatch an encode job to Colab and wait for completed output files."""
-        if not self.drive_base.parent.exists():
+        if not _exists_fast(str(self.drive_base.parent)):
             raise ColabNVENCError(
                 f"Google Drive sync directory not found: {self.drive_base.parent}\n"
                 "Make sure Google Drive is mounted/synced on this machine."
@@ -483,11 +707,7 @@ class ColabNVENCDispatcher:
         self.drive_base.mkdir(parents=True, exist_ok=True)
 
         job_id = self._create_job_id()
-        job_dir = self.drive_base / job_id
-        job_dir.mkdir(parents=True, exist_ok=True)
-
         self._log(f"Creating NVENC encode job: {job_id}")
-        self._copy_input_files(input_files, job_dir)
 
         request = {
             "input_files": sorted(input_files.keys()),
@@ -505,18 +725,21 @@ class ColabNVENCDispatcher:
             "operations": operations,
         }
 
-        request_path = job_dir / "request.json"
-        with request_path.open("w", encoding="utf-8") as f:
-            json.dump(request, f, indent=2)
+        with _staged_job_dir(self.drive_base, job_id) as staging:
+            await asyncio.to_thread(self._copy_input_files, input_files, staging)
+            _write_request(staging / "request.json", request)
+        job_dir = self.drive_base / job_id
 
         self._log(
             f"Job {job_id}: {len(input_files)} input file(s), {len(operations)} operation(s)"
         )
         self._log(f"Waiting {self.config.sync_delay:.0f}s for Drive sync...")
-        time.sleep(self.config.sync_delay)
+        await asyncio.sleep(self.config.sync_delay)
 
-        self._wait_for_completion(job_id, job_dir)
-        return self._copy_results(job_dir, output_dir, operations)
+        await self._wait_for_completion(job_id, job_dir)
+        return await asyncio.to_thread(
+            self._copy_results, job_dir, output_dir, operations
+        )
 
     def _copy_input_files(self, input_files: dict[str, Path], job_dir: Path) -> None:
         """Copy source files into the job directory on Drive."""
@@ -532,12 +755,12 @@ class ColabNVENCDispatcher:
             _ = shutil.copy2(src, dest)
             self._log(f"Copied input: {src.name} -> {dest.name}")
 
-    def _wait_for_completion(self, job_id: str, job_dir: Path) -> None:
-        """Poll for done.marker or error.marker from Colab worker."""
+    async def _wait_for_completion(self, job_id: str, job_dir: Path) -> None:
+        """Wait for done.marker or error.marker from Colab worker."""
         done_marker = job_dir / "done.marker"
         error_marker = job_dir / "error.marker"
 
-        deadline = time.time() + self.config.timeout
+        started = time.time()
         last_status = ""
 
         self._log(
@@ -545,44 +768,48 @@ class ColabNVENCDispatcher:
             f"(timeout: {self.config.timeout:.0f}s)..."
         )
 
-        while time.time() < deadline:
-            if error_marker.exists():
-                try:
-                    with error_marker.open("r", encoding="utf-8") as f:
-                        error_info = json.load(f)
-                    raise ColabNVENCError(
-                        f"Colab worker reported error: {error_info.get('error', 'unknown')}"
-                    )
-                except json.JSONDecodeError:
-                    raise ColabNVENCError(
-                        "Colab worker reported error (could not read details)"
-                    )
-
-            if done_marker.exists():
-                self._log("Job completed by Colab worker!")
-                break
-
-            elapsed = self.config.timeout - (deadline - time.time())
-            status = f"waiting... ({elapsed:.0f}s elapsed)"
-            if status != last_status:
-                output_count = 0
-                for path in job_dir.glob("**/*"):
-                    if path.is_file() and path.name not in {
-                        "request.json",
-                        "done.marker",
-                        "error.marker",
-                    }:
-                        output_count += 1
-                if output_count > 0:
-                    status = (
-                        f"processing... ({output_count} file(s) present, "
-                        f"{elapsed:.0f}s elapsed)"
-                    )
-                self._log(status)
-                last_status = status
-
-            time.sleep(self.config.poll_interval)
-        else:
+        try:
+            async with asyncio.timeout(self.config.timeout), aclosing(
+                _watch_job_dir(job_dir, self.config.poll_interval, self.use_polling)
+            ) as changes:
+                async for _ in changes:
+                    names = _list_names(job_dir)
+
+                    if error_marker.name in names:
+                        try:
+                            with error_marker.open("r", encoding="utf-8") as f:
+                                error_info = json.load(f)
+                            raise ColabNVENCError(
+                                f"Colab worker reported error: {error_info.get('error', 'unknown')}"
+                            )
+                        except json.JSONDecodeError:
+                            raise ColabNVENCError(
+                                "Colab worker reported error (could not read details)"
+                            )
+
+                    if done_marker.name in names:
+                        self._log("Job completed by Colab worker!")
+                        break
+
+                    elapsed = time.time() - started
+                    status = f"waiting... ({elapsed:.0f}s elapsed)"
+                    if status != last_status:
+                        output_count = 0
+                        for path in job_dir.glob("**/*"):
+                            if path.is_file() and path.name not in {
+                                "request.json",
+                                "done.marker",
+                                "error.marker",
+                            }:
+                                output_count += 1
+                        if output_count > 0:
+                            status = (
+                                f"processing... ({output_count} file(s) present, "
+                                f"{elapsed:.0f}s elapsed)"
+                            )
+                        self._log(status)
+                        last_status = status
+        except TimeoutError:
             raise ColabNVENCError(
                 f"Timeout waiting for Colab worker ({self.config.timeout:.0f}s).\n"
                 "Check that:\n"
@@ -590,7 +817,7 @@ class ColabNVENCDispatcher:
                 "  2. The watcher cell (cell 13) is executing\n"
                 "  3. Google Drive sync is working on both ends\n"
                 f"  Job directory: {job_dir}"
-            )
+            ) from None
 
         try:
             with done_marker.open("r", encoding="utf-8") as f:
@@ -630,7 +857,7 @@ class ColabNVENCDispatcher:
                 )
 
             local_path = output_dir / Path(name).name
-            _ = shutil.copy2(remote_path, local_path)
+            _ = shutil.copyfile(remote_path, local_path)
             copied[name] = local_path
 
             size_mb = local_path.stat().st_size / (1024 * 1024)
@@ -668,15 +895,8 @@ def create_nvenc_dispatcher_from_args(
             / "autonomous-recording"
             / "encode-jobs",
         ]
-        for candidate in candidates:
-            if candidate.parent.exists():
-                drive_path = str(candidate)
-                break
-
-        if drive_path is None:
-            drive_path = str(
-                Path.home() / "gdrive" / "autonomous-recording" / "encode-jobs"
-            )
+        found = _first_available(candidates)
+        drive_path = str(found or candidates[0])
 
     config = ColabNVENCConfig(
         drive_base=Path(drive_path),
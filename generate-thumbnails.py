@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Generate YouTube thumbnails for Bubble Sort, Methods, and Array Sum tutorials."""
 
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import groupby
 from PIL import Image, ImageDraw, ImageFont
 import os
 
@@ -9,6 +12,7 @@ W, H = 1280, 720
 
 
 # Font paths
+@lru_cache(maxsize=32)
 def load_font(path, size):
     try:
         return ImageFont.truetype(path, size)
@@ -39,10 +43,15 @@ def draw_shadow_text(
     draw.text(pos, text, font=font, fill=color)
 
 
+@lru_cache(maxsize=32)
+def text_size(text, font_path, size):
+    bbox = load_font(font_path, size).getbbox(text)
+    return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+
 def draw_badge(draw, x, y, text, accent):
     f = load_font(FONT_SANS, 34)
-    bbox = draw.textbbox((0, 0), text, font=f)
-    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    tw, th = text_size(text, FONT_SANS, 34)
     pad_x, pad_y = 20, 10
     rx0, ry0 = x, y
     rx1, ry1 = x + tw + pad_x * 2, y + th + pad_y * 2
@@ -59,22 +68,25 @@ def draw_code_panel(draw, x, y, w, h, lines_data, font_size=24):
 
     f = load_font(FONT_MONO, font_size)
     line_h = font_size + 8
+    # multiline_text advances by the height of "A" plus spacing; pick the
+    # spacing that keeps the same line_h pitch as drawing line by line
+    spacing = line_h - f.getbbox("A")[3]
     cy = y + 46
-    for text, color in lines_data:
-        draw.text((x + 18, cy), text, font=f, fill=color)
-        cy += line_h
+    # Draw runs of same-colored lines in one call
+    for color, group in groupby(lines_data, key=lambda line: line[1]):
+        texts = [text for text, _ in group]
+        draw.multiline_text((x + 18, cy), "\n".join(texts), font=f, fill=color, spacing=spacing)
+        cy += len(texts) * line_h
 
 
 def make_thumbnail(path, accent, title_lines, code_lines, bottom_label):
-    img = Image.new("RGB", (W, H), BG)
+    # Background gradient (subtle) — build one column, stretch it to full width
+    column = Image.new("RGB", (1, H))
+    shades = [int(row / H * 30) // 3 for row in range(H)]
+    column.putdata([(0x0D + s, 0x11 + s, 0x17 + s) for s in shades])
+    img = column.resize((W, H), Image.Resampling.NEAREST)
     draw = ImageDraw.Draw(img)
 
-    # Background gradient (subtle)
-    for row in range(H):
-        alpha = int(row / H * 30)
-        r, g, b = 0x0D + alpha // 3, 0x11 + alpha // 3, 0x17 + alpha // 3
-        draw.line([(0, row), (W, row)], fill=(r, g, b))
-
     # Left accent stripe
     draw.rectangle([(0, 0), (18, H)], fill=accent)
 
@@ -118,7 +130,7 @@ bs_code = [
     ("// Output: {11,12,22,25,34,64,90}", COMMENT_CLR),
 ]
 
-make_thumbnail(
+bs_job = dict(
     path=f"{OUT}/bubblesort-thumbnail.png",
     accent="#F7C948",
     title_lines=[
@@ -145,7 +157,7 @@ mt_code = [
     ("}", BASE_COLOR),
 ]
 
-make_thumbnail(
+mt_job = dict(
     path=f"{OUT}/methods-thumbnail.png",
     accent="#3FB950",
     title_lines=[
@@ -172,7 +184,7 @@ as_code = [
     ("// O(n) Linear Time", COMMENT_CLR),
 ]
 
-make_thumbnail(
+as_job = dict(
     path=f"{OUT}/arrays-total-thumbnail.png",
     accent="#58A6FF",
     title_lines=[
@@ -182,3 +194,16 @@ make_thumbnail(
     code_lines=as_code,
     bottom_label="O(n) Linear Time \u00b7 Accumulator Pattern",
 )
+
+JOBS = [bs_job, mt_job, as_job]
+
+
+def _render_one(job):
+    make_thumbnail(**job)
+
+
+# Each render is independent and CPU-bound (text raster + PNG deflate),
+# so give each thumbnail its own process.
+if __name__ == "__main__":
+    with ProcessPoolExecutor(max_workers=len(JOBS)) as ex:
+        list(ex.map(_render_one, JOBS))
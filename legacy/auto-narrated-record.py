@@ -8,92 +8,158 @@ wf-recorder captures fullscreen + audio simultaneously.
 """
 
 import argparse
+import collections
+import ctypes
+import errno
 import json
 import os
+import select
 import signal
+import socket
+import struct
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 AUDIO_MONITOR = "alsa_output.pci-0000_05_00.6.analog-stereo.monitor"
 TTS_PLAY_DIR = "/tmp/tts-playback"
 TTS_WATCH_DIR = "/tmp/openclaw"
+TTS_RATE = 48000
+TTS_CHANNELS = 2
+# Explicit node latency for the TTS client. Left to negotiate, a client can
+# drag PipeWire's global quantum down and glitch every other audio stream.
+# Only the TTS node is affected; the AUDIO_MONITOR capture is independent.
+TTS_LATENCY = f"1024/{TTS_RATE}"
 OPENCLAW_ENV = os.path.expanduser("~/.openclaw/.env")
 
 
+def _json_loads(data):
+    """Parse JSON from bytes, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
 # ---------------------------------------------------------------------------
 # Recording infrastructure
 # ---------------------------------------------------------------------------
 
 
+class HyprIPC:
+    """Talk to Hyprland's request socket directly instead of forking hyprctl.
+
+    Hyprland answers one request per connection, so each call connects anew;
+    only the socket path lookup is shared.
+    """
+
+    def __init__(self):
+        sig = os.environ.get("HYPRLAND_INSTANCE_SIGNATURE")
+        if not sig:
+            raise RuntimeError("HYPRLAND_INSTANCE_SIGNATURE not set (not under Hyprland?)")
+        runtime = os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")
+        self.path = f"{runtime}/hypr/{sig}/.socket.sock"
+        if not os.path.exists(self.path):
+            self.path = f"/tmp/hypr/{sig}/.socket.sock"  # Hyprland < 0.40
+
+    def request(self, command):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.path)
+            sock.sendall(command.encode())
+            chunks = []
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+        return b"".join(chunks)
+
+    def json(self, command):
+        return _json_loads(self.request(f"j/{command}"))
+
+    def dispatch(self, *args):
+        return self.request(" ".join(["dispatch", *args]))
+
+
+_hypr = None
+
+
+def hypr():
+    global _hypr
+    if _hypr is None:
+        _hypr = HyprIPC()
+    return _hypr
+
+
 def get_monitor_geometry():
-    result = subprocess.run(
-        ["hyprctl", "monitors", "-j"], capture_output=True, text=True
-    )
-    monitors = json.loads(result.stdout)
+    monitors = hypr().json("monitors")
     for m in monitors:
         if m.get("focused"):
             x, y = m["x"], m["y"]
             w = int(m["width"] / m.get("scale", 1))
             h = int(m["height"] / m.get("scale", 1))
             return f"{x},{y} {w}x{h}"
-    result = subprocess.run(
-        ["hyprctl", "activewindow", "-j"], capture_output=True, text=True
-    )
-    w = json.loads(result.stdout)
+    w = hypr().json("activewindow")
     x, y = w["at"]
     width, height = w["size"]
     return f"{x},{y} {width}x{height}"
 
 
-_idle_watchdog = None
+def _spawn_quiet(argv, wait=True):
+    """Start a helper with stdout/stderr on /dev/null via posix_spawn.
 
+    Skips fork()'s copy-on-write setup of this process. Exit status is
+    ignored, as with the capture_output=True calls this replaces.
+    """
+    devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+    pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=devnull)
+    if wait:
+        os.waitpid(pid, 0)
+    return pid
 
-def _watchdog_loop():
-    while True:
-        subprocess.run(["killall", "-9", "hyprlock"], capture_output=True)
-        subprocess.run(["killall", "-9", "hypridle"], capture_output=True)
-        subprocess.run(["loginctl", "unlock-session"], capture_output=True)
-        time.sleep(10)
+
+_idle_inhibitor = None
 
 
 def inhibit_idle():
-    global _idle_watchdog
-    subprocess.run(["killall", "-9", "hypridle"], capture_output=True)
-    subprocess.run(["killall", "-9", "hyprlock"], capture_output=True)
-    subprocess.run(["loginctl", "unlock-session"], capture_output=True)
-    subprocess.run(["hyprctl", "dispatch", "dpms", "on"], capture_output=True)
-    _idle_watchdog = threading.Thread(target=_watchdog_loop, daemon=True)
-    _idle_watchdog.start()
+    global _idle_inhibitor
+    _spawn_quiet(["killall", "-9", "hypridle", "hyprlock"])
+    _spawn_quiet(["loginctl", "unlock-session"])
+    hypr().dispatch("dpms", "on")
+    # Hold a logind inhibitor lock for the whole recording instead of
+    # re-killing the idle daemons on a timer
+    _idle_inhibitor = subprocess.Popen(
+        [
+            "systemd-inhibit",
+            "--what=idle:sleep",
+            "--who=auto-narrated-record",
+            "--why=Screen recording in progress",
+            "sleep",
+            "infinity",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
     print("  [infra] Idle inhibitor active")
 
 
 def restore_idle():
-    global _idle_watchdog
-    _idle_watchdog = None
-    subprocess.Popen(["hypridle"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    global _idle_inhibitor
+    if _idle_inhibitor is not None:
+        _idle_inhibitor.terminate()
+        _idle_inhibitor.wait()
+        _idle_inhibitor = None
+    _spawn_quiet(["hypridle"], wait=False)
     print("  [infra] hypridle restarted")
 
 
 def ensure_fullscreen(window_selector, selector_type="class"):
-    if selector_type == "pid":
-        subprocess.run(
-            ["hyprctl", "dispatch", "focuswindow", f"pid:{window_selector}"],
-            capture_output=True,
-        )
-    elif selector_type == "class":
-        subprocess.run(
-            ["hyprctl", "dispatch", "focuswindow", f"class:{window_selector}"],
-            capture_output=True,
-        )
+    if selector_type in ("pid", "class"):
+        hypr().dispatch("focuswindow", f"{selector_type}:{window_selector}")
     time.sleep(0.3)
-    result = subprocess.run(
-        ["hyprctl", "activewindow", "-j"], capture_output=True, text=True
-    )
-    w = json.loads(result.stdout)
+    w = hypr().json("activewindow")
     if w.get("fullscreen", 0) == 0:
-        subprocess.run(["hyprctl", "dispatch", "fullscreen", "0"], capture_output=True)
+        hypr().dispatch("fullscreen", "0")
         time.sleep(0.5)
     print(f"  [infra] Fullscreen: {selector_type}:{window_selector}")
 
@@ -134,101 +200,408 @@ def stop_recorder(proc):
 # ---------------------------------------------------------------------------
 
 
-_tts_watcher_stop = threading.Event()
-_tts_played_files = set()
+# inotify(7) constants (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# MP3s found when a tts-* dir is first watched may still be open for writing.
+# Give their IN_CLOSE_WRITE this long to arrive before assuming they're done.
+TTS_CLOSE_GRACE = 0.5
+
+
+class Inotify:
+    """Minimal non-blocking inotify wrapper (libc via ctypes)."""
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._dirs = {}  # watch descriptor -> watched directory
+
+    def add_watch(self, path, mask):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        self._dirs[wd] = path
+        return wd
+
+    def read_events(self):
+        """Drain all pending events as (directory, mask, name) tuples."""
+        events = []
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _cookie, length = _INOTIFY_EVENT.unpack_from(buf, offset)
+                offset += _INOTIFY_EVENT.size
+                name = os.fsdecode(buf[offset : offset + length].rstrip(b"\0"))
+                offset += length
+                if mask & IN_IGNORED:
+                    self._dirs.pop(wd, None)
+                elif mask & IN_Q_OVERFLOW:
+                    print("  [tts] inotify queue overflowed, events lost")
+                elif wd in self._dirs:
+                    events.append((self._dirs[wd], mask, name))
+
+    def close(self):
+        os.close(self.fd)
+
+
+_tts_inotify = None
+_tts_stop_fd = None
+_tts_signal_pipe = None  # (read, write) fds; write end is the signal wakeup fd
+_tts_prev_wakeup_fd = -1
+_tts_watcher_thread = None
+_tts_player = None
 _tts_play_count = 0
 
 
-def _collect_tts_files():
-    found = set()
+def _list_mp3s(subdir):
+    """MP3s already in one tts-* subdirectory."""
     try:
-        for entry in os.scandir(TTS_WATCH_DIR):
-            if entry.is_dir() and entry.name.startswith("tts-"):
-                for f in os.scandir(entry.path):
-                    if f.name.endswith(".mp3") and f.is_file():
-                        found.add(f.path)
+        with os.scandir(subdir) as entries:
+            return {f.path for f in entries if f.name.endswith(".mp3") and f.is_file()}
     except FileNotFoundError:
-        pass
-    return found
+        return set()
+
+
+def _watch_tts_subdir(inotify, path):
+    try:
+        inotify.add_watch(path, IN_CLOSE_WRITE | IN_MOVED_TO | IN_ONLYDIR)
+    except OSError as exc:
+        print(f"  [tts] Cannot watch {path}: {exc}")
 
 
-def _wait_for_stable_file(path, timeout=30):
-    """Wait for file to have non-zero size that stops changing."""
-    prev_size = -1
-    stable_count = 0
-    for _ in range(timeout * 10):
+# errnos meaning "this kernel copy path can't handle these files"
+_NO_KERNEL_COPY = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+# Buffer for userspace copies; larger than shutil's 64 KiB default, which
+# matters most when /tmp or the source is on a network filesystem.
+COPY_BUFSIZE = 256 * 1024
+
+
+def _fastcopy(src, dst):
+    """Copy file contents in-kernel (copy_file_range, then sendfile).
+
+    Falls back to a userspace copy. Metadata isn't copied; playback doesn't
+    need it. Returns the number of bytes copied.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        copied = 0
         try:
-            size = os.path.getsize(path)
-        except OSError:
-            time.sleep(0.1)
-            continue
-        if size > 0 and size == prev_size:
-            stable_count += 1
-            if stable_count >= 3:
-                return True
-        else:
-            stable_count = 0
-        prev_size = size
-        time.sleep(0.1)
-    return False
+            while n := os.copy_file_range(infd, outfd, 1 << 20):
+                copied += n
+            return copied
+        except OSError as exc:
+            if copied or exc.errno not in _NO_KERNEL_COPY:
+                raise
+        try:
+            while n := os.sendfile(outfd, infd, copied, 1 << 20):
+                copied += n
+            return copied
+        except OSError as exc:
+            if copied or exc.errno not in _NO_KERNEL_COPY:
+                raise
+        import shutil
+
+        shutil.copyfileobj(fsrc, fdst, length=COPY_BUFSIZE)
+        return fdst.tell()
+
+
+def _start_tts_player():
+    """One long-lived PipeWire client that plays raw PCM from stdin."""
+    return subprocess.Popen(
+        [
+            "pw-cat",
+            "--playback",
+            "--raw",
+            "--format=s16",
+            f"--rate={TTS_RATE}",
+            f"--channels={TTS_CHANNELS}",
+            "-",
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env={**os.environ, "PIPEWIRE_LATENCY": TTS_LATENCY},
+    )
 
 
-def _tts_watcher_loop():
-    import shutil
+def _start_decoder(path):
+    """ffmpeg decoding path to s16le PCM in the player's format."""
+    return subprocess.Popen(
+        [
+            "ffmpeg",
+            "-loglevel",
+            "quiet",
+            "-i",
+            path,
+            "-f",
+            "s16le",
+            "-ar",
+            str(TTS_RATE),
+            "-ac",
+            str(TTS_CHANNELS),
+            "-",
+        ],
+        stdout=subprocess.PIPE,
+        bufsize=0,
+    )
 
-    global _tts_play_count
-    os.makedirs(TTS_PLAY_DIR, exist_ok=True)
-    while not _tts_watcher_stop.is_set():
-        current = _collect_tts_files()
-        new_files = sorted(current - _tts_played_files)
-        for mp3 in new_files:
-            _tts_played_files.add(mp3)
-            if not _wait_for_stable_file(mp3, timeout=30):
-                print(f"  [tts] File never stabilized: {mp3}")
-                continue
+
+def _stop_tts_player():
+    if _tts_player is None or _tts_player.poll() is not None:
+        return
+    try:
+        _tts_player.stdin.close()
+    except OSError:
+        pass
+    try:
+        _tts_player.wait(timeout=2)
+    except subprocess.TimeoutExpired:
+        _tts_player.kill()
+
+
+class ClipPump:
+    """Streams finished MP3s through ffmpeg into the player, one at a time.
+
+    Driven from the watcher's epoll loop: ffmpeg's stdout and the player's
+    stdin are non-blocking and registered only while they have work, so a
+    long clip never holds up inotify handling and stop is immediate.
+    """
+
+    def __init__(self, ep):
+        self.ep = ep
+        self.clips = collections.deque()
+        self.decoder = None
+        self.buf = bytearray(256 * 1024)  # reused for every read
+        self.pending = memoryview(b"")  # decoded PCM not yet in the player
+        self.awaiting_player = False  # player stdin registered for EPOLLOUT
+
+    def add(self, mp3):
+        self.clips.append(mp3)
+        if self.decoder is None:
+            self._next_clip()
+
+    def handle(self, fd):
+        """Service a ready fd; returns False if it isn't one of ours."""
+        if self.decoder is not None and fd == self.decoder.stdout.fileno():
+            self._read()
+        elif self.pending and fd == _tts_player.stdin.fileno():
+            self._write()
+        else:
+            return False
+        return True
+
+    def close(self):
+        if self.decoder is not None:
+            self.decoder.kill()
+            self._finish_clip()
+
+    def _next_clip(self):
+        global _tts_play_count
+        while self.clips and self.decoder is None:
+            mp3 = self.clips.popleft()
+            # OpenClaw deletes its TTS files after use, so play a private copy
             stable_copy = os.path.join(TTS_PLAY_DIR, f"tts-{_tts_play_count:03d}.mp3")
             try:
-                shutil.copy2(mp3, stable_copy)
+                size = _fastcopy(mp3, stable_copy)
             except (FileNotFoundError, OSError) as exc:
                 print(f"  [tts] Copy failed: {exc}")
                 continue
-            size = os.path.getsize(stable_copy)
             dur_est = size / 6000
             print(f"  [tts] Playing #{_tts_play_count} ({size}B, ~{dur_est:.0f}s)")
             try:
-                subprocess.run(
-                    ["pw-play", stable_copy],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                    timeout=120,
-                )
-            except subprocess.TimeoutExpired:
-                print(f"  [tts] Playback timeout #{_tts_play_count}")
-            except Exception as exc:
+                self.decoder = _start_decoder(stable_copy)
+            except OSError as exc:
                 print(f"  [tts] Playback error: {exc}")
-            _tts_play_count += 1
-        _tts_watcher_stop.wait(0.2)
+                _tts_play_count += 1
+                continue
+            os.set_blocking(self.decoder.stdout.fileno(), False)
+            self.ep.register(self.decoder.stdout.fileno(), select.EPOLLIN)
+
+    def _read(self):
+        n = self.decoder.stdout.readinto(self.buf)
+        if n is None:  # spurious wakeup
+            return
+        if n == 0:
+            self._finish_clip()
+            self._next_clip()
+            return
+        # Stop reading until this chunk is in the player
+        self.ep.unregister(self.decoder.stdout.fileno())
+        self.pending = memoryview(self.buf)[:n]
+        self._write()
+
+    def _write(self):
+        global _tts_player
+        fd = _tts_player.stdin.fileno()
+        try:
+            self.pending = self.pending[os.write(fd, self.pending) :]
+        except BlockingIOError:
+            pass
+        except OSError:
+            print("  [tts] Player exited, restarting")
+            self._stop_awaiting_player(fd)
+            _tts_player.kill()
+            _tts_player.wait()
+            _tts_player = _start_tts_player()
+            os.set_blocking(_tts_player.stdin.fileno(), False)
+            self.pending = memoryview(b"")
+        if self.pending:
+            if not self.awaiting_player:
+                self.ep.register(fd, select.EPOLLOUT)
+                self.awaiting_player = True
+            return
+        self._stop_awaiting_player(fd)
+        if self.decoder is not None:
+            self.ep.register(self.decoder.stdout.fileno(), select.EPOLLIN)
+
+    def _stop_awaiting_player(self, fd):
+        if self.awaiting_player:
+            self.ep.unregister(fd)
+            self.awaiting_player = False
+
+    def _finish_clip(self):
+        global _tts_play_count
+        try:
+            self.ep.unregister(self.decoder.stdout.fileno())
+        except FileNotFoundError:
+            pass  # mid-write, so not registered
+        self.decoder.stdout.close()
+        if self.decoder.wait() not in (0, -signal.SIGKILL):
+            print(f"  [tts] Decode failed #{_tts_play_count}")
+        self.decoder = None
+        self.pending = memoryview(b"")
+        _tts_play_count += 1
+
+
+def _tts_watcher_loop(inotify, stop_fd, signal_fd, seen):
+    """The single TTS thread: inotify, playback and stop on one epoll.
+
+    An MP3 is ready once its writer closes it (IN_CLOSE_WRITE) or it is
+    renamed into place (IN_MOVED_TO), so no size polling is needed. The epoll
+    wait has no timeout unless a catch-up file is waiting for its close
+    event. signal_fd receives signal numbers (signal.set_wakeup_fd), so ^C
+    cuts playback off immediately. seen is only touched by this thread.
+    """
+    ep = select.epoll()
+    ep.register(inotify.fd, select.EPOLLIN)
+    ep.register(stop_fd, select.EPOLLIN)
+    ep.register(signal_fd, select.EPOLLIN)
+    pump = ClipPump(ep)
+    pending = {}  # path -> deadline, for files seen before their dir's watch
+    try:
+        while True:
+            timeout = -1
+            if pending:
+                timeout = max(0.0, min(pending.values()) - time.monotonic())
+            ready = [fd for fd, _ in ep.poll(timeout)]
+            if stop_fd in ready:
+                return
+            if signal_fd in ready:
+                try:
+                    signums = os.read(signal_fd, 512)
+                except BlockingIOError:
+                    signums = b""
+                if signal.SIGINT in signums:
+                    print("  [tts] Interrupted, stopping playback")
+                    _tts_player.terminate()
+                    return
+            for fd in ready:
+                if fd not in (inotify.fd, signal_fd):
+                    pump.handle(fd)
+            new_files = []
+            if inotify.fd in ready:
+                for directory, mask, name in inotify.read_events():
+                    path = os.path.join(directory, name)
+                    if directory == TTS_WATCH_DIR:
+                        if mask & IN_ISDIR and name.startswith("tts-"):
+                            _watch_tts_subdir(inotify, path)
+                            # Files may have landed before the watch existed
+                            deadline = time.monotonic() + TTS_CLOSE_GRACE
+                            for mp3 in sorted(_list_mp3s(path)):
+                                pending.setdefault(mp3, deadline)
+                    elif name.endswith(".mp3"):
+                        pending.pop(path, None)
+                        new_files.append(path)
+            now = time.monotonic()
+            for mp3, deadline in list(pending.items()):
+                if deadline <= now:
+                    del pending[mp3]
+                    new_files.append(mp3)
+            for mp3 in new_files:
+                if mp3 not in seen:
+                    seen.add(mp3)
+                    pump.add(mp3)
+    finally:
+        pump.close()
+        ep.close()
+        inotify.close()
 
 
 def start_tts_watcher():
-    global _tts_played_files, _tts_play_count
+    global _tts_inotify, _tts_stop_fd, _tts_watcher_thread
+    global _tts_signal_pipe, _tts_prev_wakeup_fd
+    global _tts_player, _tts_play_count
     import shutil
 
     if os.path.exists(TTS_PLAY_DIR):
         shutil.rmtree(TTS_PLAY_DIR)
     os.makedirs(TTS_PLAY_DIR, exist_ok=True)
-    _tts_played_files = _collect_tts_files()
+    os.makedirs(TTS_WATCH_DIR, exist_ok=True)
+
+    # Watch before listing so nothing written in between is missed
+    _tts_inotify = Inotify()
+    _tts_inotify.add_watch(TTS_WATCH_DIR, IN_CREATE | IN_MOVED_TO | IN_ONLYDIR)
+    # The only full scan: from here on the set only grows by event paths
+    existing = set()
+    for entry in os.scandir(TTS_WATCH_DIR):
+        if entry.is_dir() and entry.name.startswith("tts-"):
+            _watch_tts_subdir(_tts_inotify, entry.path)
+            existing |= _list_mp3s(entry.path)
     _tts_play_count = 0
-    _tts_watcher_stop.clear()
-    t = threading.Thread(target=_tts_watcher_loop, daemon=True)
-    t.start()
-    print(f"  [tts] Watcher started (ignoring {len(_tts_played_files)} existing)")
-    return t
+    _tts_player = _start_tts_player()
+    os.set_blocking(_tts_player.stdin.fileno(), False)
+
+    _tts_stop_fd = os.eventfd(0, os.EFD_CLOEXEC)
+    # Python still raises KeyboardInterrupt in the main thread; the wakeup fd
+    # additionally lets the TTS thread see the signal without waiting on it
+    _tts_signal_pipe = os.pipe2(os.O_NONBLOCK | os.O_CLOEXEC)
+    _tts_prev_wakeup_fd = signal.set_wakeup_fd(_tts_signal_pipe[1])
+    _tts_watcher_thread = threading.Thread(
+        target=_tts_watcher_loop,
+        args=(_tts_inotify, _tts_stop_fd, _tts_signal_pipe[0], existing),
+        daemon=True,
+    )
+    _tts_watcher_thread.start()
+    print(f"  [tts] Watcher started (ignoring {len(existing)} existing)")
+    return _tts_watcher_thread
 
 
 def stop_tts_watcher():
-    _tts_watcher_stop.set()
-    time.sleep(0.5)
+    if _tts_watcher_thread is None:
+        return
+    os.eventfd_write(_tts_stop_fd, 1)
+    _tts_watcher_thread.join()
+    os.close(_tts_stop_fd)
+    signal.set_wakeup_fd(_tts_prev_wakeup_fd)
+    for fd in _tts_signal_pipe:
+        os.close(fd)
+    _stop_tts_player()
     print(f"  [tts] Watcher stopped ({_tts_play_count} files played)")
 
 
@@ -237,49 +610,196 @@ def stop_tts_watcher():
 # ---------------------------------------------------------------------------
 
 
-def _shell_quote(s):
-    return "'" + s.replace("'", "'\\''") + "'"
+_agent_env = None
+
+
+def _load_env_file(path):
+    """Read KEY=VALUE lines (optionally `export`-prefixed or quoted)."""
+    env = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                key, value = line.removeprefix("export ").split("=", 1)
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+                    value = value[1:-1]
+                env[key.strip()] = value
+    except FileNotFoundError:
+        print(f"  [agent] {path} not found, using current environment")
+    return env
+
+
+def _get_agent_env():
+    """Environment for openclaw: os.environ plus OPENCLAW_ENV, loaded once."""
+    global _agent_env
+    if _agent_env is None:
+        _agent_env = {**os.environ, **_load_env_file(OPENCLAW_ENV)}
+    return _agent_env
+
+
+class AgentSession:
+    """One long-lived `openclaw agent --stdin` process.
+
+    Each prompt is written as a JSON line on stdin and answered with one JSON
+    line on stdout, so agent startup is paid once per recording.
+    """
+
+    def __init__(self, env):
+        self.proc = subprocess.Popen(
+            ["openclaw", "agent", "--agent", "main", "--json", "--stdin"],
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self._buf = b""
+
+    def ask(self, prompt, timeout):
+        """Return the raw JSON response line; raises OSError on failure."""
+        request = json.dumps({"prompt": prompt, "timeout": timeout})
+        self.proc.stdin.write(request.encode() + b"\n")
+        fd = self.proc.stdout.fileno()
+        deadline = time.monotonic() + timeout + 30
+        while b"\n" not in self._buf:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                raise TimeoutError("openclaw agent session timed out")
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("openclaw agent session exited")
+            self._buf += chunk
+        line, _, self._buf = self._buf.partition(b"\n")
+        return line
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+                self.proc.wait()
+
+
+_agent_session = None
+_agent_session_probed = False
+_running_agents = set()  # one-shot openclaw processes still in flight
+
+
+def _get_agent_session():
+    """Start a persistent session if this openclaw supports --stdin."""
+    global _agent_session, _agent_session_probed
+    if not _agent_session_probed:
+        _agent_session_probed = True
+        try:
+            probe = subprocess.run(
+                ["openclaw", "agent", "--help"],
+                env=_get_agent_env(),
+                capture_output=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if b"--stdin" in probe.stdout + probe.stderr:
+            _agent_session = AgentSession(_get_agent_env())
+            print("  [agent] Using persistent openclaw session")
+    return _agent_session
+
+
+def close_agent_session():
+    """Close the persistent session and kill any in-flight agent calls.
+
+    A pipelined call can still be running on the executor thread after an
+    interrupt; it must not outlive the recording.
+    """
+    global _agent_session
+    for proc in list(_running_agents):
+        proc.kill()
+    if _agent_session is not None:
+        _agent_session.close()
+        _agent_session = None
+
+
+def _response_text(raw):
+    """Pull the first payload's text out of an `openclaw agent --json` reply."""
+    try:
+        # Agent output is UTF-8 JSON; parse the raw bytes without decoding
+        response = _json_loads(raw)
+        payloads = response.get("result", {}).get("payloads", [])
+        if payloads:
+            return payloads[0].get("text", "")
+    except ValueError:
+        pass
+    return None
 
 
 def call_agent(prompt, timeout=120):
     """Send a single focused prompt to OpenClaw and return response text."""
-    cmd = (
-        f"source {OPENCLAW_ENV} && "
-        f"openclaw agent --agent main "
-        f"-m {_shell_quote(prompt)} "
-        f"--json --timeout {timeout}"
-    )
+    global _agent_session
+    session = _get_agent_session()
+    if session is not None:
+        try:
+            return _response_text(session.ask(prompt, timeout))
+        except KeyboardInterrupt:
+            session.proc.kill()
+            _agent_session = None
+            raise
+        except (OSError, EOFError) as exc:
+            # Session state is unknown now; drop it and use one-shot calls
+            print(f"  [agent] Session failed ({exc}), falling back to per-call")
+            session.proc.kill()
+            _agent_session = None
+            return None
+
+    cmd = [
+        "openclaw",
+        "agent",
+        "--agent",
+        "main",
+        "-m",
+        prompt,
+        "--json",
+        "--timeout",
+        str(timeout),
+    ]
     proc = subprocess.Popen(
         cmd,
-        shell=True,
-        executable="/bin/bash",
+        env=_get_agent_env(),
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
     )
+    _running_agents.add(proc)
     try:
         stdout, stderr = proc.communicate(timeout=timeout + 30)
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
         return None
+    except KeyboardInterrupt:
+        proc.kill()
+        raise
+    finally:
+        _running_agents.discard(proc)
 
     if proc.returncode != 0:
         return None
+    return _response_text(stdout)
 
-    try:
-        response = json.loads(stdout.decode("utf-8", errors="replace"))
-        payloads = response.get("result", {}).get("payloads", [])
-        if payloads:
-            return payloads[0].get("text", "")
-    except json.JSONDecodeError:
-        pass
-    return None
 
+def run_step(step_num, total, instruction, wait_after=5, pending=None, on_response=None):
+    """Execute one recording step: agent does action + TTS, then we wait.
 
-def run_step(step_num, total, instruction, wait_after=5):
-    """Execute one recording step: agent does action + TTS, then we wait."""
+    pending is an already-submitted Future for this step's agent call;
+    on_response runs once the response is in, before the playback wait.
+    """
     print(f"\n  [{step_num}/{total}] {instruction[:80]}...")
-    resp = call_agent(instruction, timeout=120)
+    resp = pending.result() if pending else call_agent(instruction, timeout=120)
+    if on_response:
+        on_response()
     if resp:
         print(f"  [{step_num}/{total}] Agent: {resp[:120]}...")
     else:
@@ -288,6 +808,45 @@ def run_step(step_num, total, instruction, wait_after=5):
     time.sleep(wait_after)
 
 
+def _parse_step(step, default_wait):
+    """Return (instruction, wait, parallel) for a steps-file entry."""
+    if isinstance(step, str):
+        return step, default_wait, True
+    instruction = step.get("instruction", step.get("prompt", ""))
+    return instruction, step.get("wait", default_wait), step.get("parallel", True)
+
+
+def run_steps(steps, default_wait, pipeline=False):
+    """Run all steps in order.
+
+    With pipeline, step N+1's agent call is started as soon as step N's
+    response is in, so it overlaps step N's TTS playback wait. A step with
+    "parallel": false is never started early.
+    """
+    plan = [_parse_step(step, default_wait) for step in steps]
+    total = len(plan)
+    if not pipeline:
+        for i, (instruction, wait, _) in enumerate(plan, 1):
+            run_step(i, total, instruction, wait_after=wait)
+        return
+
+    agent = ThreadPoolExecutor(max_workers=1)
+    try:
+        prefetched = None
+        for i, (instruction, wait, _) in enumerate(plan, 1):
+            pending = prefetched or agent.submit(call_agent, instruction, 120)
+            prefetched = None
+
+            def start_next(i=i):
+                nonlocal prefetched
+                if i < total and plan[i][2]:
+                    prefetched = agent.submit(call_agent, plan[i][0], 120)
+
+            run_step(i, total, instruction, wait, pending, start_next)
+    finally:
+        agent.shutdown(wait=False, cancel_futures=True)
+
+
 # ---------------------------------------------------------------------------
 # Main orchestrator
 # ---------------------------------------------------------------------------
@@ -319,6 +878,12 @@ def main():
         default=5.0,
         help="Seconds to wait after each step for TTS playback",
     )
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="Start each step's agent call during the previous step's "
+        'playback wait (skip per step with "parallel": false)',
+    )
 
     args = parser.parse_args()
 
@@ -364,14 +929,7 @@ def main():
         print("\n[Phase 2] Recording...")
 
         if steps:
-            for i, step in enumerate(steps, 1):
-                if isinstance(step, str):
-                    instruction = step
-                    wait = args.step_wait
-                else:
-                    instruction = step.get("instruction", step.get("prompt", ""))
-                    wait = step.get("wait", args.step_wait)
-                run_step(i, len(steps), instruction, wait_after=wait)
+            run_steps(steps, args.step_wait, pipeline=args.pipeline)
         else:
             full_prompt = (
                 "You are recording a narrated screen tour. A screen recorder is "
@@ -399,6 +957,7 @@ def main():
     except Exception as e:
         print(f"  Error: {e}")
     finally:
+        close_agent_session()
         stop_tts_watcher()
         if recorder:
             stop_recorder(recorder)
@@ -12,33 +12,86 @@ Usage:
 """
 
 import argparse
+import hashlib
+import http.client
 import json
 import os
+import shutil
 import signal
 import subprocess
 import sys
 import time
+from fractions import Fraction
+from functools import lru_cache
 
 KOKORO_MODEL = os.path.expanduser("~/.openclaw/models/kokoro-v1.0.onnx")
+# Written by optimize-kokoro.py; the first one present is loaded instead of fp32
+KOKORO_MODEL_VARIANTS = [
+    os.path.expanduser("~/.openclaw/models/kokoro-v1.0.int8.opt.onnx"),
+    os.path.expanduser("~/.openclaw/models/kokoro-v1.0.int8.onnx"),
+    os.path.expanduser("~/.openclaw/models/kokoro-v1.0.opt.onnx"),
+]
 KOKORO_VOICES = os.path.expanduser("~/.openclaw/models/voices-v1.0.bin")
+# Tried in order; whichever this onnxruntime build has first wins
+ORT_PROVIDERS = [
+    "CUDAExecutionProvider",
+    "CoreMLExecutionProvider",
+    "CPUExecutionProvider",
+]
 AUDIO_MONITOR = "alsa_output.pci-0000_05_00.6.analog-stereo.monitor"
+SYNTH_CACHE_DIR = os.path.expanduser("~/.cache/narrated-record")
+VAAPI_DEVICE = "/dev/dri/renderD128"
+HYPRCTL_TTL = 0.1
+
+
+def _json_loads(data):
+    """Parse JSON from bytes, with orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+@lru_cache(maxsize=8)
+def _hyprctl_json_cached(query, bucket):
+    result = subprocess.run(["hyprctl", query, "-j"], capture_output=True)
+    return _json_loads(result.stdout)
+
+
+def _hyprctl_json(query, ttl=HYPRCTL_TTL):
+    """Return `hyprctl <query> -j`, reusing a reply from the same ttl window."""
+    return _hyprctl_json_cached(query, int(time.monotonic() / ttl))
+
+
+def _spawn_quiet(argv, wait=True):
+    """Start a helper with stdout/stderr on /dev/null via posix_spawn.
+
+    Skips fork()'s copy-on-write setup of this process. Exit status is
+    ignored, as with the capture_output=True calls this replaces.
+    """
+    devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+    pid = os.posix_spawnp(argv[0], argv, os.environ, file_actions=devnull)
+    if wait:
+        os.waitpid(pid, 0)
+    return pid
+
+
+def _hyprctl_dispatch(*args):
+    _spawn_quiet(["hyprctl", "dispatch", *args])
+    # Window state may have changed; don't serve stale replies
+    _hyprctl_json_cached.cache_clear()
 
 
 def get_active_geometry():
-    result = subprocess.run(
-        ["hyprctl", "activewindow", "-j"], capture_output=True, text=True
-    )
-    w = json.loads(result.stdout)
+    w = _hyprctl_json("activewindow")
     x, y = w["at"]
     width, height = w["size"]
     return f"{x},{y} {width}x{height}"
 
 
 def get_monitor_geometry():
-    result = subprocess.run(
-        ["hyprctl", "monitors", "-j"], capture_output=True, text=True
-    )
-    monitors = json.loads(result.stdout)
+    monitors = _hyprctl_json("monitors")
     for m in monitors:
         if m.get("focused"):
             x, y = m["x"], m["y"]
@@ -48,59 +101,49 @@ def get_monitor_geometry():
     return get_active_geometry()
 
 
-_idle_watchdog = None
-
-
-def _watchdog_loop():
-    while True:
-        subprocess.run(["killall", "-9", "hyprlock"], capture_output=True)
-        subprocess.run(["killall", "-9", "hypridle"], capture_output=True)
-        subprocess.run(
-            ["loginctl", "unlock-session"], capture_output=True
-        )
-        time.sleep(10)
+_idle_inhibitor = None
 
 
 def inhibit_idle():
-    global _idle_watchdog
-    import threading
-    subprocess.run(["killall", "-9", "hypridle"], capture_output=True)
-    subprocess.run(["killall", "-9", "hyprlock"], capture_output=True)
-    subprocess.run(["loginctl", "unlock-session"], capture_output=True)
-    subprocess.run(
-        ["hyprctl", "dispatch", "dpms", "on"], capture_output=True
+    global _idle_inhibitor
+    _spawn_quiet(["killall", "-9", "hypridle", "hyprlock"])
+    _spawn_quiet(["loginctl", "unlock-session"])
+    _hyprctl_dispatch("dpms", "on")
+    # Hold a logind inhibitor lock for the whole recording instead of
+    # re-killing the idle daemons on a timer
+    _idle_inhibitor = subprocess.Popen(
+        [
+            "systemd-inhibit",
+            "--what=idle:sleep",
+            "--who=narrated-record",
+            "--why=Screen recording in progress",
+            "sleep",
+            "infinity",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
-    _idle_watchdog = threading.Thread(target=_watchdog_loop, daemon=True)
-    _idle_watchdog.start()
-    print("  Idle inhibitor: hypridle/hyprlock killed, watchdog active")
+    print("  Idle inhibitor: hypridle/hyprlock killed, systemd-inhibit lock held")
 
 
 def restore_idle():
-    global _idle_watchdog
-    _idle_watchdog = None
-    subprocess.Popen(["hypridle"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    global _idle_inhibitor
+    if _idle_inhibitor is not None:
+        _idle_inhibitor.terminate()
+        _idle_inhibitor.wait()
+        _idle_inhibitor = None
+    _spawn_quiet(["hypridle"], wait=False)
     print("  Idle inhibitor: hypridle restarted")
 
 
 def ensure_fullscreen(window_selector, selector_type="pid"):
-    if selector_type == "pid":
-        subprocess.run(
-            ["hyprctl", "dispatch", "focuswindow", f"pid:{window_selector}"],
-            capture_output=True,
-        )
-    elif selector_type == "class":
-        subprocess.run(
-            ["hyprctl", "dispatch", "focuswindow", f"class:{window_selector}"],
-            capture_output=True,
-        )
+    if selector_type in ("pid", "class"):
+        _hyprctl_dispatch("focuswindow", f"{selector_type}:{window_selector}")
     time.sleep(0.3)
-    result = subprocess.run(
-        ["hyprctl", "activewindow", "-j"], capture_output=True, text=True
-    )
-    w = json.loads(result.stdout)
+    w = _hyprctl_json("activewindow")
     is_fullscreen = w.get("fullscreen", 0)
     if is_fullscreen == 0:
-        subprocess.run(["hyprctl", "dispatch", "fullscreen", "0"], capture_output=True)
+        _hyprctl_dispatch("fullscreen", "0")
         time.sleep(0.5)
 
 
@@ -108,38 +151,267 @@ def focus_and_maximize(pid):
     ensure_fullscreen(pid, "pid")
 
 
-def synthesize_segments(segments, voice, speed, lang, output_dir):
+def _kokoro_model_path():
+    for path in KOKORO_MODEL_VARIANTS:
+        if os.path.exists(path):
+            return path
+    return KOKORO_MODEL
+
+
+def _synth_cache_key(text, voice, speed, lang, model):
+    key = f"{text}|{voice}|{speed}|{lang}|{model}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _physical_cores():
+    try:
+        import psutil
+
+        cores = psutil.cpu_count(logical=False)
+    except ImportError:
+        cores = None
+    return cores or os.cpu_count() or 1
+
+
+def _load_kokoro():
+    """Load Kokoro on an ONNX Runtime session with pinned threads and provider.
+
+    One intra-op thread per physical core avoids hyper-threaded contention,
+    and a single inter-op thread suits the sequential model graph.
+    """
+    import onnxruntime as ort
     from kokoro_onnx import Kokoro
+
+    model_path = _kokoro_model_path()
+    opts = ort.SessionOptions()
+    opts.intra_op_num_threads = _physical_cores()
+    opts.inter_op_num_threads = 1
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    available = set(ort.get_available_providers())
+    providers = [p for p in ORT_PROVIDERS if p in available] or ["CPUExecutionProvider"]
+
+    print(
+        f"Loading Kokoro model {os.path.basename(model_path)} ({providers[0]}, "
+        f"{opts.intra_op_num_threads} threads)..."
+    )
+    session = ort.InferenceSession(
+        model_path, sess_options=opts, providers=providers
+    )
+    if hasattr(Kokoro, "from_session"):
+        return Kokoro.from_session(session, KOKORO_VOICES)
+    # Older kokoro-onnx has no session hook; swap ours in after loading
+    kokoro = Kokoro(model_path, KOKORO_VOICES)
+    kokoro.sess = session
+    return kokoro
+
+
+def synthesize_segments(segments, voice, speed, lang, output_dir):
+    """Synthesize every segment's narration to narration-NNN.wav.
+
+    Yields one wav_info dict per segment, in segment order, as soon as it
+    and every earlier segment are ready.
+
+    WAVs are cached under SYNTH_CACHE_DIR keyed on (text, voice, speed,
+    lang, model file) and hardlinked into output_dir, so unchanged narration
+    is never re-synthesized and the model is only loaded on a cache miss.
+
+    Inference is serialized on one shared Kokoro instance (ONNX Runtime
+    already uses all cores per call); WAV writing and per-segment Python
+    work overlap on a small thread pool. Results keep segment order.
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
     import soundfile as sf
 
-    print(f"Loading Kokoro model...")
-    kokoro = Kokoro(KOKORO_MODEL, KOKORO_VOICES)
+    os.makedirs(SYNTH_CACHE_DIR, exist_ok=True)
+    model = os.path.basename(_kokoro_model_path())
+    kokoro = None
+    synth_lock = threading.Semaphore(1)
 
-    wav_paths = []
-    for i, seg in enumerate(segments):
+    def synthesize(i, seg):
+        nonlocal kokoro
         text = seg["narration"]
         wav_path = os.path.join(output_dir, f"narration-{i:03d}.wav")
-
-        print(
-            f'  [{i + 1}/{len(segments)}] Synthesizing: "{text[:60]}{"..." if len(text) > 60 else ""}"'
-        )
-        samples, sr = kokoro.create(text, voice=voice, speed=speed, lang=lang)
-        sf.write(wav_path, samples, sr)
+        key = _synth_cache_key(text, voice, speed, lang, model)
+        cached = os.path.join(SYNTH_CACHE_DIR, f"{key}.wav")
+
+        if os.path.exists(cached):
+            _link_or_copy(cached, wav_path)
+            samples, sr = sf.read(wav_path, dtype="float32")
+            duration = len(samples) / sr
+            print(f"  [{i + 1}/{len(segments)}] Cached: {duration:.1f}s audio")
+            return {
+                "path": wav_path,
+                "samples": samples,
+                "sr": sr,
+                "duration": duration,
+            }
+
+        with synth_lock:
+            if kokoro is None:
+                kokoro = _load_kokoro()
+            print(
+                f'  [{i + 1}/{len(segments)}] Synthesizing: "{text[:60]}{"..." if len(text) > 60 else ""}"'
+            )
+            samples, sr = kokoro.create(text, voice=voice, speed=speed, lang=lang)
+        tmp_path = f"{cached[:-4]}.{os.getpid()}-{i}.tmp.wav"
+        sf.write(tmp_path, samples, sr)
+        os.replace(tmp_path, cached)
+        _link_or_copy(cached, wav_path)
 
         duration = len(samples) / sr
-        wav_paths.append({"path": wav_path, "duration": duration})
-        print(f"           -> {duration:.1f}s audio")
+        print(f"           -> [{i + 1}] {duration:.1f}s audio")
+        return {
+            "path": wav_path,
+            "samples": samples,
+            "sr": sr,
+            "duration": duration,
+        }
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield from pool.map(synthesize, range(len(segments)), segments)
+
 
-    return wav_paths
+def synthesize_in_background(segments, clip_ranges, voice, speed, lang, output_dir):
+    """Run synthesize_segments on a thread; return one Future per clip.
+
+    Each future resolves to that clip's wav_info list once all of its
+    segments are synthesized, so recording the first clip can start while
+    later narration is still being generated.
+    """
+    import threading
+    from concurrent.futures import Future
+
+    clip_futures = [Future() for _ in clip_ranges]
+    wavs = []
+
+    def resolve_ready():
+        for fut, (start, end) in zip(clip_futures, clip_ranges):
+            if not fut.done() and len(wavs) >= end:
+                fut.set_result(wavs[start:end])
+
+    def run():
+        try:
+            resolve_ready()
+            for info in synthesize_segments(segments, voice, speed, lang, output_dir):
+                wavs.append(info)
+                resolve_ready()
+        except BaseException as exc:
+            for fut in clip_futures:
+                if not fut.done():
+                    fut.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return clip_futures
 
 
-def play_audio(wav_path):
-    return subprocess.Popen(
-        ["pw-play", wav_path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+def _feed_player(proc, pcm):
+    try:
+        proc.stdin.write(pcm)
+        proc.stdin.close()
+    except (BrokenPipeError, ValueError):
+        pass
+
+
+def _load_pcm(wav_info):
+    """Fill wav_info["pcm"] with the raw f32 bytes pw-cat plays.
+
+    Segments reused via --skip-synth have no samples yet and are read from
+    their WAV here. Missing WAVs are left alone.
+    """
+    if "pcm" in wav_info:
+        return
+    samples = wav_info.get("samples")
+    if samples is None:
+        if not os.path.exists(wav_info["path"]):
+            return
+        import soundfile as sf
+
+        samples, wav_info["sr"] = sf.read(wav_info["path"], dtype="float32")
+        wav_info["samples"] = samples
+    wav_info["pcm"] = samples.astype("<f4", copy=False).tobytes()
+
+
+class NarrationPrefetcher:
+    """Prepare segment i+1's PCM on a worker thread while segment i plays."""
+
+    def __init__(self, narration_wavs):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self._wavs = narration_wavs
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        self._pending = {}
+        self._submit(0)
+
+    def _submit(self, index):
+        if index < len(self._wavs) and index not in self._pending:
+            self._pending[index] = self._pool.submit(_load_pcm, self._wavs[index])
+
+    def play(self, index):
+        self._submit(index)
+        self._pending.pop(index).result()
+        player = play_audio(self._wavs[index])
+        self._submit(index + 1)
+        return player
+
+    def close(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def play_audio(wav_info):
+    """Start playing a narration segment; returns the player process.
+
+    Segment samples are piped straight into pw-cat as raw f32 PCM, using
+    the bytes NarrationPrefetcher prepared when available. A segment with
+    no samples on disk or in memory falls back to pw-play.
+    """
+    _load_pcm(wav_info)
+    samples = wav_info.get("samples")
+    if samples is None:
+        return subprocess.Popen(
+            ["pw-play", wav_info["path"]],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    import threading
+
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    proc = subprocess.Popen(
+        [
+            "pw-cat",
+            "--playback",
+            "--raw",
+            "-",
+            "--format",
+            "f32",
+            "--rate",
+            str(wav_info["sr"]),
+            "--channels",
+            str(channels),
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
+    pcm = wav_info.pop("pcm")
+    threading.Thread(target=_feed_player, args=(proc, pcm), daemon=True).start()
+    return proc
 
 
-def wait_for_signal(signal_file, timeout=600):
+def _poll_for_signal(signal_file, timeout):
     for _ in range(timeout):
         if os.path.exists(signal_file):
             return True
@@ -147,6 +419,36 @@ def wait_for_signal(signal_file, timeout=600):
     return False
 
 
+def wait_for_signal(signal_file, timeout=600):
+    """Block until signal_file exists or timeout seconds pass.
+
+    Uses an inotify watch on the parent directory when inotify_simple is
+    installed, falling back to polling once a second.
+    """
+    if os.path.exists(signal_file):
+        return True
+    try:
+        from inotify_simple import INotify, flags
+    except ImportError:
+        return _poll_for_signal(signal_file, timeout)
+
+    directory, name = os.path.split(os.path.abspath(signal_file))
+    deadline = time.monotonic() + timeout
+    with INotify() as inotify:
+        try:
+            inotify.add_watch(directory, flags.CREATE | flags.MOVED_TO)
+        except OSError:
+            return _poll_for_signal(signal_file, timeout)
+        # The file may have appeared before the watch was in place
+        if os.path.exists(signal_file):
+            return True
+        while (remaining := deadline - time.monotonic()) > 0:
+            for event in inotify.read(timeout=int(remaining * 1000) + 1):
+                if event.name == name:
+                    return True
+    return False
+
+
 def start_recorder(geometry, output_path, with_audio=True):
     cmd = [
         "wf-recorder",
@@ -177,7 +479,75 @@ def stop_recorder(proc):
     time.sleep(0.5)
 
 
-def record_terminal_clip(clip_config, narration_wavs, output_dir):
+def mux_narration(video_path, placed, output_path):
+    """Add a narration track built from (offset, wav_info) pairs to a video.
+
+    Samples are laid out at their offsets with silence in between and
+    piped to ffmpeg as raw f32le, so no WAV or monitor capture is involved.
+    The video stream is copied and video_path is removed on success.
+    """
+    if not placed:
+        os.replace(video_path, output_path)
+        return
+
+    first = placed[0][1]
+    sr = first["sr"]
+    channels = 1 if first["samples"].ndim == 1 else first["samples"].shape[1]
+    chunks = []
+    cursor = 0
+    for offset, wav_info in placed:
+        start = max(int(offset * sr), cursor)
+        chunks.append(bytes(4 * channels * (start - cursor)))
+        chunks.append(wav_info["samples"].astype("<f4", copy=False).tobytes())
+        cursor = start + len(wav_info["samples"])
+
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-y",
+            "-i",
+            video_path,
+            "-f",
+            "f32le",
+            "-ar",
+            str(sr),
+            "-ac",
+            str(channels),
+            "-i",
+            "pipe:0",
+            "-map",
+            "0:v",
+            "-map",
+            "1:a",
+            "-c:v",
+            "copy",
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+            "-ar",
+            "48000",
+            "-ac",
+            "2",
+            output_path,
+        ],
+        input=b"".join(chunks),
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        print(f"  ffmpeg mux error: {result.stderr[-500:].decode(errors='replace')}")
+        print(f"  Keeping silent capture at {video_path}")
+        return
+    os.unlink(video_path)
+
+
+def record_terminal_clip(clip_config, narration_wavs, output_dir, direct_audio=False):
+    """Record a terminal clip, playing narration at each segment's trigger.
+
+    With direct_audio, the screen is captured without the audio monitor and
+    the in-memory narration samples are muxed in afterwards at the offsets
+    they were played, so the clip's audio cannot drift from the video.
+    """
     clip_name = clip_config["name"]
     script_path = clip_config["script"]
     segments = clip_config["segments"]
@@ -211,22 +581,33 @@ def record_terminal_clip(clip_config, narration_wavs, output_dir):
     geometry = get_monitor_geometry()
     print(f"  Geometry (fullscreen): {geometry}")
 
+    # Segments reused via --skip-synth have no samples to mux
+    direct_audio = direct_audio and all(
+        w.get("samples") is not None for w in narration_wavs
+    )
+    video_output = f"{clip_output[:-4]}.video.mp4" if direct_audio else clip_output
+    placed = []
+
+    prefetcher = NarrationPrefetcher(narration_wavs)
+
+    def narrate(index):
+        placed.append((time.monotonic() - recorder_started, narration_wavs[index]))
+        return prefetcher.play(index)
+
     print(f"  Starting recorder...")
-    recorder = start_recorder(geometry, clip_output, with_audio=True)
+    recorder = start_recorder(geometry, video_output, with_audio=not direct_audio)
+    recorder_started = time.monotonic()
     time.sleep(1)
 
     seg_index = 0
     for seg in segments:
         trigger = seg.get("trigger", "immediate")
-        wav_info = narration_wavs[seg_index]
-
-
 
         if trigger == "immediate":
             print(
                 f'  Playing narration segment {seg_index}: "{seg["narration"][:50]}..."'
             )
-            player = play_audio(wav_info["path"])
+            player = narrate(seg_index)
             player.wait()
             time.sleep(seg.get("pause_after", 1.0))
 
@@ -236,7 +617,7 @@ def record_terminal_clip(clip_config, narration_wavs, output_dir):
             print(f"  Waiting for signal: {sig_name}")
             if wait_for_signal(sig_path, timeout=120):
                 print(f"  Signal received, playing narration segment {seg_index}")
-                player = play_audio(wav_info["path"])
+                player = narrate(seg_index)
                 player.wait()
                 time.sleep(seg.get("pause_after", 1.0))
             else:
@@ -246,11 +627,12 @@ def record_terminal_clip(clip_config, narration_wavs, output_dir):
             delay = seg.get("delay", 0)
             print(f"  Waiting {delay}s before narration segment {seg_index}")
             time.sleep(delay)
-            player = play_audio(wav_info["path"])
+            player = narrate(seg_index)
             player.wait()
             time.sleep(seg.get("pause_after", 1.0))
 
         seg_index += 1
+    prefetcher.close()
 
     print(f"  Waiting for clip completion signal...")
     wait_for_signal(signal_file, timeout=300)
@@ -262,10 +644,73 @@ def record_terminal_clip(clip_config, narration_wavs, output_dir):
     term.wait()
     time.sleep(0.5)
 
+    if direct_audio:
+        print(f"  Muxing {len(placed)} narration segments...")
+        mux_narration(video_output, placed, clip_output)
+
     print(f"  Clip saved: {clip_output}")
     return clip_output
 
 
+# Scrolls the chat log and reports whether a response is still streaming.
+# Compiled once per page and re-run by scriptId in wait_for_response.
+_RESPONSE_POLL_JS = """
+(() => {
+    const l = document.querySelector('[role=log]');
+    if (l) l.scrollTop = l.scrollHeight;
+    const btns = Array.from(document.querySelectorAll('button'));
+    if (btns.find(b => b.textContent.includes('Stop'))) return 'streaming';
+    if (btns.find(b => b.textContent.includes('Send'))) return 'done';
+    return 'unknown';
+})()
+"""
+
+# Page functions run with Runtime.callFunctionOn. Values are passed as CDP
+# arguments rather than spliced into the source, so quotes in a message or
+# selector are safe and V8 compiles each function once.
+_TYPE_MESSAGE_JS = """
+function (message) {
+    const ta = document.querySelector('textarea');
+    if (!ta) return 'no textarea';
+    ta.focus(); ta.click();
+    const setter = Object.getOwnPropertyDescriptor(
+        window.HTMLTextAreaElement.prototype, 'value'
+    ).set;
+    setter.call(ta, message);
+    ta.dispatchEvent(new Event('input', { bubbles: true }));
+    return 'typed';
+}
+"""
+
+_SEND_MESSAGE_JS = """
+function () {
+    const ta = document.querySelector('textarea');
+    ta.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, bubbles: true}));
+    return 'sent';
+}
+"""
+
+_SCROLL_BY_JS = "function (top) { window.scrollBy({top, behavior: 'smooth'}); }"
+
+_SCROLL_TO_JS = "function (top) { window.scrollTo({top, behavior: 'smooth'}); }"
+
+_SCROLL_INTO_VIEW_JS = """
+function (selector) {
+    const el = document.querySelector(selector);
+    if (el) el.scrollIntoView({behavior: 'smooth', block: 'center'});
+    return 'ok';
+}
+"""
+
+_CLICK_JS = """
+function (selector) {
+    const el = document.querySelector(selector);
+    if (el) { el.click(); return 'clicked'; }
+    return 'not found';
+}
+"""
+
+
 def record_browser_clip(clip_config, narration_wavs, output_dir):
     clip_name = clip_config["name"]
     segments = clip_config["segments"]
@@ -278,12 +723,12 @@ def record_browser_clip(clip_config, narration_wavs, output_dir):
     print(f"\n=== Recording: {clip_name} ===")
 
     try:
-        page_ws = subprocess.run(
-            ["curl", "-s", f"http://localhost:{cdp_port}/json"],
-            capture_output=True,
-            text=True,
-        )
-        pages = json.loads(page_ws.stdout)
+        conn = http.client.HTTPConnection("127.0.0.1", cdp_port, timeout=2)
+        try:
+            conn.request("GET", "/json")
+            pages = json.loads(conn.getresponse().read())
+        finally:
+            conn.close()
         ws_url = None
         for p in pages:
             if url.split("#")[0].split("?")[0] in p.get("url", ""):
@@ -311,122 +756,122 @@ def record_browser_clip(clip_config, narration_wavs, output_dir):
     print(f"  Geometry (fullscreen): {geometry}")
 
     import asyncio
+    import itertools
     import websockets
 
     async def run_browser_recording():
         async with websockets.connect(ws_url, max_size=10 * 1024 * 1024) as ws:
+            msg_ids = itertools.count(1)
+            poll_script_id = None
+            global_object_id = None
+
+            async def cdp_call(method, params=None):
+                msg_id = next(msg_ids)
+                await ws.send(
+                    json.dumps({"id": msg_id, "method": method, "params": params or {}})
+                )
+                # Skip Page.* events and anything else until our reply arrives
+                while True:
+                    resp = json.loads(await ws.recv())
+                    if resp.get("id") == msg_id:
+                        return resp
+
+            async def cdp_eval(expr):
+                resp = await cdp_call(
+                    "Runtime.evaluate",
+                    {"expression": expr, "returnByValue": True, "awaitPromise": True},
+                )
+                return resp.get("result", {}).get("result", {}).get("value")
 
-            async def cdp_eval(expr, msg_id=1):
-                msg = json.dumps(
-                    {
-                        "id": msg_id,
-                        "method": "Runtime.evaluate",
-                        "params": {
-                            "expression": expr,
+            async def cdp_call_function(declaration, *args):
+                nonlocal global_object_id
+                for _ in range(2):
+                    if global_object_id is None:
+                        resp = await cdp_call(
+                            "Runtime.evaluate", {"expression": "globalThis"}
+                        )
+                        result = resp.get("result", {}).get("result", {})
+                        global_object_id = result.get("objectId")
+                    resp = await cdp_call(
+                        "Runtime.callFunctionOn",
+                        {
+                            "functionDeclaration": declaration,
+                            "objectId": global_object_id,
+                            "arguments": [{"value": arg} for arg in args],
                             "returnByValue": True,
                             "awaitPromise": True,
                         },
-                    }
+                    )
+                    if "error" not in resp:
+                        return resp.get("result", {}).get("result", {}).get("value")
+                    # The handle dies with its context (e.g. navigation)
+                    global_object_id = None
+                return None
+
+            async def poll_response():
+                nonlocal poll_script_id
+                if poll_script_id is None:
+                    resp = await cdp_call(
+                        "Runtime.compileScript",
+                        {
+                            "expression": _RESPONSE_POLL_JS,
+                            "sourceURL": "narrated-record-poll.js",
+                            "persistScript": True,
+                        },
+                    )
+                    poll_script_id = resp.get("result", {}).get("scriptId")
+                    if poll_script_id is None:
+                        return await cdp_eval(_RESPONSE_POLL_JS)
+                resp = await cdp_call(
+                    "Runtime.runScript",
+                    {"scriptId": poll_script_id, "returnByValue": True},
                 )
-                await ws.send(msg)
-                resp = json.loads(await ws.recv())
+                if "error" in resp:
+                    # Compiled scripts die with their context (e.g. navigation)
+                    poll_script_id = None
+                    return await cdp_eval(_RESPONSE_POLL_JS)
                 return resp.get("result", {}).get("result", {}).get("value")
 
-            enable_msg = json.dumps({"id": 0, "method": "Page.enable", "params": {}})
-            await ws.send(enable_msg)
+            await cdp_call("Page.enable")
             await asyncio.sleep(1)
 
             print(f"  Starting recorder...")
             recorder = start_recorder(geometry, clip_output, with_audio=True)
             await asyncio.sleep(2)
 
+            prefetcher = NarrationPrefetcher(narration_wavs)
             seg_index = 0
             for seg in segments:
-                wav_info = narration_wavs[seg_index]
                 action = seg.get("action")
 
-
-
                 print(f"  Playing narration segment {seg_index}")
-                player = play_audio(wav_info["path"])
+                player = prefetcher.play(seg_index)
 
                 if seg.get("play_before_action", True):
                     player.wait()
                     await asyncio.sleep(seg.get("pause_after_narration", 0.5))
 
                 if action == "type_and_send":
-                    message = seg["message"]
-                    await cdp_eval(
-                        f"""
-                        (() => {{
-                            const ta = document.querySelector('textarea');
-                            if (!ta) return 'no textarea';
-                            ta.focus(); ta.click();
-                            const setter = Object.getOwnPropertyDescriptor(
-                                window.HTMLTextAreaElement.prototype, 'value'
-                            ).set;
-                            setter.call(ta, '{message}');
-                            ta.dispatchEvent(new Event('input', {{ bubbles: true }}));
-                            return 'typed';
-                        }})()
-                    """,
-                        10 + seg_index,
-                    )
+                    await cdp_call_function(_TYPE_MESSAGE_JS, seg["message"])
                     await asyncio.sleep(1)
-                    await cdp_eval(
-                        """
-                        (() => {
-                            const ta = document.querySelector('textarea');
-                            ta.dispatchEvent(new KeyboardEvent('keydown', {key: 'Enter', code: 'Enter', keyCode: 13, bubbles: true}));
-                            return 'sent';
-                        })()
-                    """,
-                        20 + seg_index,
-                    )
+                    await cdp_call_function(_SEND_MESSAGE_JS)
 
                 elif action == "wait_for_response":
                     for i in range(60):
                         await asyncio.sleep(1)
-                        status = await cdp_eval(
-                            """
-                            (() => {
-                                const btns = Array.from(document.querySelectorAll('button'));
-                                if (btns.find(b => b.textContent.includes('Stop'))) return 'streaming';
-                                if (btns.find(b => b.textContent.includes('Send'))) return 'done';
-                                return 'unknown';
-                            })()
-                        """,
-                            50 + i,
-                        )
-                        await cdp_eval(
-                            """
-                            (() => { const l = document.querySelector('[role=log]'); if(l) l.scrollTop = l.scrollHeight; return 'ok'; })()
-                        """,
-                            80 + i,
-                        )
+                        status = await poll_response()
                         if status == "done" and i > 3:
                             break
 
                 elif action == "navigate":
                     nav_url = seg["url"]
                     print(f"  Navigating to: {nav_url}")
-                    nav_msg = json.dumps(
-                        {
-                            "id": 200 + seg_index,
-                            "method": "Page.navigate",
-                            "params": {"url": nav_url},
-                        }
-                    )
-                    await ws.send(nav_msg)
-                    await asyncio.sleep(1)
-                    for _ in range(30):
-                        try:
-                            resp_raw = await asyncio.wait_for(ws.recv(), timeout=1)
-                            resp_data = json.loads(resp_raw)
-                            if resp_data.get("id") == 200 + seg_index:
-                                break
-                        except asyncio.TimeoutError:
-                            pass
+                    try:
+                        await asyncio.wait_for(
+                            cdp_call("Page.navigate", {"url": nav_url}), timeout=30
+                        )
+                    except asyncio.TimeoutError:
+                        pass
                     load_wait = seg.get("load_wait", 3)
                     await asyncio.sleep(load_wait)
 
@@ -434,33 +879,17 @@ def record_browser_clip(clip_config, narration_wavs, output_dir):
                     scroll_to = seg.get("scroll_to", "bottom")
                     scroll_speed = seg.get("scroll_speed", 800)
                     if scroll_to == "bottom":
-                        await cdp_eval(
-                            f"window.scrollBy({{top: {scroll_speed}, behavior: 'smooth'}})",
-                            300 + seg_index,
-                        )
+                        await cdp_call_function(_SCROLL_BY_JS, scroll_speed)
                     elif scroll_to == "top":
-                        await cdp_eval(
-                            "window.scrollTo({top: 0, behavior: 'smooth'})",
-                            300 + seg_index,
-                        )
+                        await cdp_call_function(_SCROLL_TO_JS, 0)
                     elif isinstance(scroll_to, int):
-                        await cdp_eval(
-                            f"window.scrollTo({{top: {scroll_to}, behavior: 'smooth'}})",
-                            300 + seg_index,
-                        )
+                        await cdp_call_function(_SCROLL_TO_JS, scroll_to)
                     else:
-                        await cdp_eval(
-                            f"(() => {{ const el = document.querySelector('{scroll_to}'); if(el) el.scrollIntoView({{behavior: 'smooth', block: 'center'}}); return 'ok'; }})()",
-                            300 + seg_index,
-                        )
+                        await cdp_call_function(_SCROLL_INTO_VIEW_JS, scroll_to)
                     await asyncio.sleep(seg.get("scroll_pause", 1.5))
 
                 elif action == "click":
-                    selector = seg["selector"]
-                    await cdp_eval(
-                        f"(() => {{ const el = document.querySelector('{selector}'); if(el) {{ el.click(); return 'clicked'; }} return 'not found'; }})()",
-                        400 + seg_index,
-                    )
+                    await cdp_call_function(_CLICK_JS, seg["selector"])
                     await asyncio.sleep(seg.get("click_wait", 2))
 
                 elif action == "wait":
@@ -472,6 +901,7 @@ def record_browser_clip(clip_config, narration_wavs, output_dir):
 
                 await asyncio.sleep(seg.get("pause_after", 1.0))
                 seg_index += 1
+            prefetcher.close()
 
             await asyncio.sleep(3)
 
@@ -483,38 +913,176 @@ def record_browser_clip(clip_config, narration_wavs, output_dir):
     return clip_output
 
 
+def _probe_streams(path):
+    """Return (video, audio) parameter tuples for a clip; audio is None if absent."""
+    probe = subprocess.run(
+        [
+            "ffprobe",
+            "-v",
+            "quiet",
+            "-show_entries",
+            "stream=codec_type,codec_name,profile,width,height,pix_fmt,"
+            "r_frame_rate,avg_frame_rate,sample_rate,channels",
+            "-of",
+            "json",
+            path,
+        ],
+        capture_output=True,
+        text=True,
+    )
+    video = audio = None
+    for stream in json.loads(probe.stdout or "{}").get("streams", []):
+        if stream.get("codec_type") == "video" and video is None:
+            video = tuple(
+                stream.get(k)
+                for k in (
+                    "codec_name",
+                    "profile",
+                    "width",
+                    "height",
+                    "pix_fmt",
+                    "r_frame_rate",
+                    "avg_frame_rate",
+                )
+            )
+        elif stream.get("codec_type") == "audio" and audio is None:
+            audio = tuple(
+                stream.get(k) for k in ("codec_name", "sample_rate", "channels")
+            )
+    return video, audio
+
+
+def _frame_rate(rate):
+    """ffprobe's "num/den" frame rate as a Fraction, or None if unknown."""
+    try:
+        rate = Fraction(rate)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return rate or None
+
+
+def _concat_copy(clip_paths, output_path):
+    """Join clips with the concat demuxer and no re-encode; returns success."""
+    list_path = f"{output_path}.concat.txt"
+    with open(list_path, "w") as f:
+        for path in clip_paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-y",
+                "-f",
+                "concat",
+                "-safe",
+                "0",
+                "-i",
+                list_path,
+                "-c",
+                "copy",
+                "-movflags",
+                "+faststart",
+                output_path,
+            ],
+            capture_output=True,
+            text=True,
+        )
+    finally:
+        os.unlink(list_path)
+    if result.returncode != 0:
+        print(f"  Stream copy failed, re-encoding: {result.stderr[-300:]}")
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=None)
+def _hw_video_encoder():
+    """Return the first usable hardware H.264 encoder ffmpeg was built with."""
+    try:
+        out = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"], capture_output=True, text=True
+        ).stdout
+    except OSError:
+        return None
+    if " h264_nvenc " in out:
+        return "h264_nvenc"
+    if " h264_vaapi " in out and os.path.exists(VAAPI_DEVICE):
+        return "h264_vaapi"
+    return None
+
+
+def _video_encode_args(encoder):
+    """Return (global args, filter suffix, codec args) for a video encoder."""
+    if encoder == "h264_nvenc":
+        return (
+            [],
+            "",
+            [
+                "-c:v",
+                "h264_nvenc",
+                "-preset",
+                "p5",
+                "-rc",
+                "vbr",
+                "-cq",
+                "22",
+                "-b:v",
+                "0",
+            ],
+        )
+    if encoder == "h264_vaapi":
+        return (
+            ["-vaapi_device", VAAPI_DEVICE],
+            "format=nv12,hwupload",
+            ["-c:v", "h264_vaapi", "-qp", "22"],
+        )
+    return [], "", ["-c:v", "libx264", "-preset", "medium", "-crf", "20"]
+
+
 def merge_clips(clip_paths, output_path, resolution="1280:720", fps=30):
+    """Concatenate clips into output_path.
+
+    When every clip already shares H.264/AAC stream parameters and is
+    constant-rate at `resolution` and `fps`, they are stream-copied.
+    Otherwise each clip is scaled and padded to `resolution` at `fps` and the
+    result re-encoded.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
     print(f"\n=== Merging {len(clip_paths)} clips ===")
 
+    with ThreadPoolExecutor(max_workers=min(16, len(clip_paths))) as pool:
+        streams = list(pool.map(_probe_streams, clip_paths))
+
+    video, audio = streams[0]
+    width, height = (int(n) for n in resolution.split(":"))
+    if (
+        video is not None
+        and video[0] == "h264"
+        and video[2:4] == (width, height)
+        and _frame_rate(video[5]) == _frame_rate(video[6]) == fps
+        and audio is not None
+        and audio[:2] == ("aac", "48000")
+        and all(s == streams[0] for s in streams)
+    ):
+        print(f"  Clips share stream parameters, joining without re-encode...")
+        if _concat_copy(clip_paths, output_path):
+            size = os.path.getsize(output_path)
+            print(f"  Output: {output_path} ({size / 1024 / 1024:.1f}MB)")
+            return
+
     inputs = []
     filter_parts = []
     concat_inputs = []
 
-    for i, path in enumerate(clip_paths):
+    for i, (path, (_, audio)) in enumerate(zip(clip_paths, streams)):
         inputs.extend(["-i", path])
         filter_parts.append(
             f"[{i}:v]scale={resolution}:force_original_aspect_ratio=decrease,"
             f"pad={resolution}:(ow-iw)/2:(oh-ih)/2,setsar=1,fps={fps}[v{i}]"
         )
-        probe = subprocess.run(
-            [
-                "ffprobe",
-                "-v",
-                "quiet",
-                "-select_streams",
-                "a",
-                "-show_entries",
-                "stream=codec_name",
-                "-of",
-                "csv=p=0",
-                path,
-            ],
-            capture_output=True,
-            text=True,
-        )
-        has_audio = bool(probe.stdout.strip())
 
-        if has_audio:
+        if audio is not None:
             filter_parts.append(
                 f"[{i}:a]aformat=sample_rates=48000:channel_layouts=stereo[a{i}]"
             )
@@ -527,40 +1095,39 @@ def merge_clips(clip_paths, output_path, resolution="1280:720", fps=30):
             concat_inputs.append(f"[v{i}][a{i}]")
 
     concat_str = "".join(concat_inputs)
-    filter_parts.append(f"{concat_str}concat=n={len(clip_paths)}:v=1:a=1[outv][outa]")
-
-    filter_complex = "; ".join(filter_parts)
-
-    cmd = [
-        "ffmpeg",
-        "-y",
-        *inputs,
-        "-filter_complex",
-        filter_complex,
-        "-map",
-        "[outv]",
-        "-map",
-        "[outa]",
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "128k",
-        output_path,
-    ]
-
-    print(f"  Running ffmpeg merge...")
-    result = subprocess.run(cmd, capture_output=True, text=True)
-    if result.returncode != 0:
+    filter_parts.append(f"{concat_str}concat=n={len(clip_paths)}:v=1:a=1[catv][outa]")
+
+    hw_encoder = _hw_video_encoder()
+    encoders = [hw_encoder, None] if hw_encoder else [None]
+    for encoder in encoders:
+        global_args, upload, codec_args = _video_encode_args(encoder)
+        filter_complex = "; ".join(filter_parts + [f"[catv]{upload or 'null'}[outv]"])
+        cmd = [
+            "ffmpeg",
+            "-y",
+            *global_args,
+            *inputs,
+            "-filter_complex",
+            filter_complex,
+            "-map",
+            "[outv]",
+            "-map",
+            "[outa]",
+            *codec_args,
+            "-c:a",
+            "aac",
+            "-b:a",
+            "128k",
+            output_path,
+        ]
+
+        print(f"  Running ffmpeg merge ({encoder or 'libx264'})...")
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode == 0:
+            size = os.path.getsize(output_path)
+            print(f"  Output: {output_path} ({size / 1024 / 1024:.1f}MB)")
+            return
         print(f"  ffmpeg error: {result.stderr[-500:]}")
-    else:
-        size = os.path.getsize(output_path)
-        print(f"  Output: {output_path} ({size / 1024 / 1024:.1f}MB)")
 
 
 def main():
@@ -577,6 +1144,12 @@ def main():
     parser.add_argument(
         "--skip-synth", action="store_true", help="Skip TTS synthesis (reuse existing)"
     )
+    parser.add_argument(
+        "--direct-audio",
+        action="store_true",
+        help="Mux narration into terminal clips from memory instead of "
+        "capturing the audio monitor",
+    )
     args = parser.parse_args()
 
     with open(args.config) as f:
@@ -595,34 +1168,47 @@ def main():
 
     if not args.skip_synth:
         print(f"\n=== Synthesizing {len(all_segments)} narration segments ===")
-        all_wavs = synthesize_segments(
-            all_segments, args.voice, args.speed, args.lang, output_dir
+        clip_wavs_futures = synthesize_in_background(
+            all_segments,
+            clip_segment_ranges,
+            args.voice,
+            args.speed,
+            args.lang,
+            output_dir,
         )
     else:
+        from concurrent.futures import Future
+
+        import soundfile as sf
+
         print(f"\n=== Reusing existing narration WAVs ===")
         all_wavs = []
         for i in range(len(all_segments)):
             wav_path = os.path.join(output_dir, f"narration-{i:03d}.wav")
             if os.path.exists(wav_path):
-                import soundfile as sf
-
-                data, sr = sf.read(wav_path)
-                duration = len(data) / sr
+                info = sf.info(wav_path)
+                duration = info.frames / info.samplerate
                 all_wavs.append({"path": wav_path, "duration": duration})
             else:
                 print(f"  WARNING: Missing {wav_path}")
                 all_wavs.append({"path": wav_path, "duration": 0})
+        clip_wavs_futures = [Future() for _ in clip_segment_ranges]
+        for fut, (start, end) in zip(clip_wavs_futures, clip_segment_ranges):
+            fut.set_result(all_wavs[start:end])
 
     inhibit_idle()
 
     try:
         clip_paths = []
         for i, clip in enumerate(config["clips"]):
-            start, end = clip_segment_ranges[i]
-            clip_wavs = all_wavs[start:end]
+            if not clip_wavs_futures[i].done():
+                print(f"\n  Waiting for narration of clip {i + 1}...")
+            clip_wavs = clip_wavs_futures[i].result()
 
             if clip["type"] == "terminal":
-                path = record_terminal_clip(clip, clip_wavs, output_dir)
+                path = record_terminal_clip(
+                    clip, clip_wavs, output_dir, direct_audio=args.direct_audio
+                )
             elif clip["type"] == "browser":
                 path = record_browser_clip(clip, clip_wavs, output_dir)
             else:
@@ -641,7 +1227,7 @@ def main():
             final_output = config.get(
                 "output", os.path.expanduser("~/demo-narrated.mp4")
             )
-            subprocess.run(["cp", clip_paths[0], final_output])
+            shutil.copyfile(clip_paths[0], final_output)
             print(f"\n  Single clip copied to: {final_output}")
     finally:
         restore_idle()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Prepare a faster Kokoro model for narrated-record.py.
+
+Writes an int8 dynamically-quantized copy of the fp32 Kokoro model next to
+it, then saves that graph again after ONNX Runtime's extended optimizations
+(node and attention fusion) so they aren't redone on every load.
+narrated-record.py loads the most optimized file present and falls back to
+fp32 otherwise. Only needs to run once per model.
+
+Usage:
+  python3 optimize-kokoro.py
+  python3 optimize-kokoro.py --no-quantize
+  python3 optimize-kokoro.py --force
+"""
+
+import argparse
+import os
+import sys
+
+KOKORO_MODEL = os.path.expanduser("~/.openclaw/models/kokoro-v1.0.onnx")
+
+
+def quantize(src, dst):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    tmp = f"{dst[:-5]}.tmp.onnx"
+    quantize_dynamic(src, tmp, weight_type=QuantType.QInt8)
+    os.replace(tmp, dst)
+
+
+def optimize(src, dst):
+    """Save src's graph after ORT_ENABLE_EXTENDED fusions.
+
+    ORT_ENABLE_ALL would also bake in CPU-specific layout transforms, which
+    make the saved file unportable; those are applied at load time instead.
+    """
+    import onnxruntime as ort
+
+    tmp = f"{dst[:-5]}.tmp.onnx"
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    opts.optimized_model_filepath = tmp
+    ort.InferenceSession(src, sess_options=opts, providers=["CPUExecutionProvider"])
+    os.replace(tmp, dst)
+
+
+def _report(label, src, dst):
+    src_mb = os.path.getsize(src) / 1024 / 1024
+    dst_mb = os.path.getsize(dst) / 1024 / 1024
+    print(f"  {label}: {dst} ({src_mb:.0f}MB -> {dst_mb:.0f}MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quantize and optimize Kokoro TTS")
+    parser.add_argument("--model", default=KOKORO_MODEL, help="fp32 source model")
+    parser.add_argument(
+        "--no-quantize", action="store_true", help="Only fuse the fp32 graph"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Rebuild outputs that already exist"
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.model):
+        print(f"Model not found: {args.model}")
+        sys.exit(1)
+
+    stem = args.model[:-5]
+    source = args.model
+    if not args.no_quantize:
+        quantized = f"{stem}.int8.onnx"
+        if os.path.exists(quantized) and not args.force:
+            print(f"Already quantized: {quantized}")
+        else:
+            print(f"Quantizing {source} to int8...")
+            quantize(source, quantized)
+            _report("Quantized", source, quantized)
+        source = quantized
+
+    optimized = f"{source[:-5]}.opt.onnx"
+    if os.path.exists(optimized) and not args.force:
+        print(f"Already optimized: {optimized} (use --force to rebuild)")
+        return
+    print(f"Fusing graph of {source}...")
+    optimize(source, optimized)
+    _report("Optimized", source, optimized)
+
+
+if __name__ == "__main__":
+    main()
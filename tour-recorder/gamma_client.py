@@ -14,11 +14,29 @@ import hashlib
 import time
 from pathlib import Path
 from typing import Optional
-import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+try:
+    import requests
+except ImportError:
+    requests = None
 
 
 GAMMA_API_BASE = "https://public-api.gamma.app"
 
+# Transport errors from whichever HTTP client is installed
+_HTTP_ERRORS = tuple(
+    err
+    for err in (
+        httpx.HTTPError if httpx else None,
+        requests.RequestException if requests else None,
+    )
+    if err is not None
+)
+
 
 class GammaError(Exception):
     """Raised when Gamma API calls fail."""
@@ -26,6 +44,15 @@ class GammaError(Exception):
     pass
 
 
+def _sorted_keys(value):
+    """Rebuild nested dicts in key order so their msgpack encoding is stable."""
+    if isinstance(value, dict):
+        return {k: _sorted_keys(value[k]) for k in sorted(value)}
+    if isinstance(value, (list, tuple)):
+        return [_sorted_keys(v) for v in value]
+    return value
+
+
 class GammaClient:
     """Client for Gamma API to generate presentations."""
 
@@ -47,13 +74,49 @@ class GammaClient:
         self.cache_dir = cache_dir or Path.home() / ".cache" / "gamma-slides"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.session = self._make_session(
             {"X-API-KEY": self.api_key, "Content-Type": "application/json"}
         )
 
+    @staticmethod
+    def _make_session(headers: dict):
+        """Create a pooled HTTP/2 httpx client, falling back to requests.
+
+        httpx needs the optional h2 package for HTTP/2; without it (or without
+        httpx at all) a requests.Session over HTTP/1.1 keep-alive is used.
+        """
+        if httpx is not None:
+            try:
+                return httpx.Client(
+                    http2=True,
+                    headers=headers,
+                    limits=httpx.Limits(max_keepalive_connections=8),
+                    timeout=120,
+                )
+            except ImportError:
+                pass
+        if requests is None:
+            raise GammaError("Gamma client needs httpx or requests installed.")
+        session = requests.Session()
+        session.headers.update(headers)
+        return session
+
     def _content_hash(self, content: dict) -> str:
-        """Generate a hash for content to use as cache key."""
+        """Generate a hash for content to use as cache key.
+
+        Uses blake3 over msgpack when both are installed, otherwise SHA-256
+        over sorted-key JSON.
+        """
+        try:
+            import blake3
+            import msgpack
+        except ImportError:
+            return self._sha256_content_hash(content)
+        packed = msgpack.packb(_sorted_keys(content), use_bin_type=True)
+        return blake3.blake3(packed).hexdigest()[:16]
+
+    def _sha256_content_hash(self, content: dict) -> str:
+        """SHA-256 cache key, also used to find slides cached before blake3."""
         content_str = json.dumps(content, sort_keys=True)
         return hashlib.sha256(content_str.encode()).hexdigest()[:16]
 
@@ -95,8 +158,10 @@ class GammaClient:
         }
         content_hash = self._content_hash(content_data)
 
-        # Check cache
-        cached = self._get_cached_path(content_hash)
+        # Check cache (including slides cached under the older SHA-256 key)
+        cached = self._get_cached_path(content_hash) or self._get_cached_path(
+            self._sha256_content_hash(content_data)
+        )
         if cached:
             print(f"[Gamma] Using cached slides: {cached}")
             return cached
@@ -132,38 +197,34 @@ class GammaClient:
             slides_dir = self._wait_and_export(gamma_id, content_hash)
             return slides_dir
 
-        except requests.RequestException as e:
+        except _HTTP_ERRORS as e:
             raise GammaError(f"Gamma API request failed: {e}")
 
     def _build_input_text(self, title: str, content: list[dict]) -> str:
         """Build input text for Gamma API from structured content."""
-        lines = [f"# {title}", ""]
+        parts = [f"# {title}", ""]
 
         for slide in content:
             slide_type = slide.get("type", "content")
+            heading = f"## {slide.get('title', '')}"
 
             if slide_type == "title":
-                lines.append(f"## {slide.get('title', '')}")
+                parts.append(heading)
                 if "subtitle" in slide:
-                    lines.append(slide["subtitle"])
+                    parts.append(slide["subtitle"])
 
             elif slide_type == "content":
-                lines.append(f"## {slide.get('title', '')}")
-                if "bullet_points" in slide:
-                    for point in slide["bullet_points"]:
-                        lines.append(f"- {point}")
+                parts.append(heading)
+                parts.extend(f"- {point}" for point in slide.get("bullet_points", ()))
                 if "text" in slide:
-                    lines.append(slide["text"])
+                    parts.append(slide["text"])
 
             elif slide_type == "code":
-                lines.append(f"## {slide.get('title', '')}")
-                lines.append("```java")
-                lines.append(slide.get("code", ""))
-                lines.append("```")
+                parts.extend((heading, "```java", slide.get("code", ""), "```"))
 
-            lines.append("")  # Empty line between slides
+            parts.append("")  # Empty line between slides
 
-        return "\n".join(lines)
+        return "\n".join(parts)
 
     def _wait_and_export(self, gamma_id: str, content_hash: str) -> Path:
         """
@@ -1,28 +1,66 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import errno
+import hashlib
 import json
 import os
+import queue
 import shutil
+import socket
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import urlsplit
 
 
+import numpy as np
+import onnxruntime as ort
 import soundfile as sf
 from kokoro_onnx import Kokoro
 from playwright.sync_api import Error as PlaywrightError
 from playwright.sync_api import sync_playwright
 
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 KOKORO_MODEL = os.path.expanduser("~/.openclaw/models/kokoro-v1.0.onnx")
+# Built from KOKORO_MODEL on first use; --fp32-tts loads the original instead
+KOKORO_MODEL_INT8 = os.path.expanduser("~/.openclaw/models/kokoro-v1.0.int8.onnx")
 KOKORO_VOICES = os.path.expanduser("~/.openclaw/models/voices-v1.0.bin")
+# Tried in order; providers missing from this onnxruntime build are skipped
+ORT_PROVIDERS: list[Any] = [
+    ("CUDAExecutionProvider", {"cudnn_conv_algo_search": "HEURISTIC"}),
+    "CPUExecutionProvider",
+]
 FFMPEG_BIN = "/usr/bin/ffmpeg"
 FFPROBE_BIN = "/usr/bin/ffprobe"
+SHELL_BIN = "/bin/sh"
+VAAPI_DEVICE = "/dev/dri/renderD128"
+X264_PRESET = "faster"
+TTS_CONCURRENCY = 2
+CAPTURE_WORKERS = 4
+TTS_CACHE_DIR = Path(os.path.expanduser("~/.cache/openclaw/tts"))
+TTS_SOCKET = "/tmp/openclaw-tts.sock"
+PROFILE_DIR = Path("/tmp/openclaw-profile")
 
 POPUP_SELECTORS = [
     "button:has-text('Accept')",
@@ -46,6 +84,60 @@ POPUP_SELECTORS = [
 ]
 
 
+def _is_css_selector(selector: str) -> bool:
+    """False for engine-prefixed selectors such as text=... or xpath=..."""
+    engine, sep, _ = selector.partition("=")
+    return not (sep and engine.isalpha())
+
+
+# Playwright's CSS engine (including :has-text) accepts selector lists, so all
+# of those go in one query; other engines like text= can't be joined
+_POPUP_COMBINED = ", ".join(s for s in POPUP_SELECTORS if _is_css_selector(s))
+_POPUP_RESIDUAL = [s for s in POPUP_SELECTORS if not _is_css_selector(s)]
+
+SPEC_REQUIRED_META = ("title", "target_duration_seconds", "max_duration_seconds")
+SPEC_REQUIRED_SETTINGS = (
+    "viewport",
+    "video_size",
+    "voice",
+    "speech_speed",
+    "language",
+    "default_step_timeout",
+    "max_retries_per_step",
+    "browser",
+)
+SPEC_REQUIRED_OUTPUT = (
+    "path",
+    "video_codec",
+    "video_preset",
+    "video_crf",
+    "audio_codec",
+    "audio_bitrate",
+)
+_SPEC_ITEMS_SCHEMA = {
+    "type": "array",
+    "minItems": 1,
+    "items": {"type": "object", "required": ["id", "narration"]},
+}
+# Structural checks only; value checks that coerce (float(), .lower()) and the
+# cross-field ones stay in load_tour_spec
+SPEC_SCHEMA = {
+    "type": "object",
+    "required": ["meta", "settings", "output"],
+    "properties": {
+        "meta": {"type": "object", "required": list(SPEC_REQUIRED_META)},
+        "settings": {"type": "object", "required": list(SPEC_REQUIRED_SETTINGS)},
+        "output": {"type": "object", "required": list(SPEC_REQUIRED_OUTPUT)},
+        "steps": _SPEC_ITEMS_SCHEMA,
+        "segments": _SPEC_ITEMS_SCHEMA,
+    },
+}
+# fastjsonschema generates a straight-line validator for the schema once
+_validate_spec_schema = (
+    fastjsonschema.compile(SPEC_SCHEMA) if fastjsonschema is not None else None
+)
+
+
 class TourError(Exception):
     pass
 
@@ -61,6 +153,7 @@ class StepResult:
     step_elapsed: float
     video_offset: float = 0.0
     step_end_offset: float | None = None
+    video_params: tuple[int, int, float, str] | None = None
 
 
 def log(message: str) -> None:
@@ -68,8 +161,12 @@ def log(message: str) -> None:
     print(f"[{now}] {message}", flush=True)
 
 
+# Commands are spawned with close_fds=False and an absolute executable path,
+# which lets subprocess use posix_spawn instead of forking; once Phase B has
+# loaded the Kokoro graph, fork()'s page-table copy is the costly part. Our
+# own fds are non-inheritable, so nothing leaks into the child.
 def run_cmd(cmd: list[str], description: str) -> subprocess.CompletedProcess[str]:
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(cmd, capture_output=True, text=True, close_fds=False)
     if result.returncode != 0:
         tail = (result.stderr or result.stdout)[-1200:]
         raise TourError(f"{description} failed: {tail}")
@@ -94,6 +191,116 @@ def ffprobe_duration(path: Path) -> float:
         raise TourError(f"Invalid duration from ffprobe for {path}") from exc
 
 
+def move_file(source: Path, destination: Path) -> None:
+    """Rename source over destination, copying only across filesystems."""
+    try:
+        os.replace(source, destination)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        shutil.copy2(source, destination)
+        source.unlink()
+
+
+def wav_duration(path: Path) -> float:
+    """Duration of a WAV from its header, without decoding samples."""
+    info = sf.info(str(path))
+    return float(info.frames) / float(info.samplerate)
+
+
+def media_duration(path: Path) -> float:
+    """Container duration via PyAV when installed, else ffprobe.
+
+    Cached per (path, mtime, size), so re-probing an unchanged output for
+    log lines and the report is free, while a file rewritten in place (zoom,
+    overlays) is probed again.
+    """
+    stat = path.stat()
+    return _media_duration(str(path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=256)
+def _media_duration(path_str: str, mtime_ns: int, size: int) -> float:
+    path = Path(path_str)
+    try:
+        import av
+    except ImportError:
+        return ffprobe_duration(path)
+    try:
+        with av.open(path_str) as container:
+            if container.duration is not None:
+                return float(container.duration) / av.time_base
+    except Exception:
+        # Anything PyAV can't parse still gets ffprobe's opinion
+        pass
+    return ffprobe_duration(path)
+
+
+def media_durations(paths: list[Path]) -> dict[Path, float]:
+    """media_duration for several files, probed concurrently."""
+    if len(paths) <= 1:
+        return {path: media_duration(path) for path in paths}
+    with ThreadPoolExecutor(max_workers=len(paths)) as pool:
+        return dict(zip(paths, pool.map(media_duration, paths)))
+
+
+def probe_video_params(path: Path) -> tuple[int, int, float, str]:
+    """(width, height, fps, pix_fmt) of the first video stream."""
+    cmd = [
+        FFPROBE_BIN,
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "stream=width,height,r_frame_rate,pix_fmt",
+        "-of",
+        "json",
+        str(path),
+    ]
+    result = run_cmd(cmd, f"ffprobe video stream for {path.name}")
+    try:
+        stream = json.loads(result.stdout)["streams"][0]
+        num, _, den = str(stream.get("r_frame_rate", "0")).partition("/")
+        fps = float(num) / float(den) if den and float(den) else float(num)
+        return (
+            int(stream["width"]),
+            int(stream["height"]),
+            fps,
+            str(stream.get("pix_fmt", "")),
+        )
+    except (ValueError, KeyError, IndexError) as exc:
+        raise TourError(f"Invalid video stream info from ffprobe for {path}") from exc
+
+
+@lru_cache(maxsize=1)
+def hw_video_encoder() -> str | None:
+    """Return the first usable hardware H.264 encoder ffmpeg was built with."""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BIN, "-hide_banner", "-encoders"], capture_output=True, text=True
+        )
+    except OSError:
+        return None
+    if " h264_nvenc " in result.stdout:
+        return "h264_nvenc"
+    if " h264_vaapi " in result.stdout and os.path.exists(VAAPI_DEVICE):
+        return "h264_vaapi"
+    return None
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_has_filter(name: str) -> bool:
+    """Whether the ffmpeg build provides the named filter (e.g. zscale)."""
+    try:
+        result = subprocess.run(
+            [FFMPEG_BIN, "-hide_banner", "-filters"], capture_output=True, text=True
+        )
+    except OSError:
+        return False
+    return f" {name} " in result.stdout
+
+
 def ensure_tooling() -> None:
     for binary in (FFMPEG_BIN, FFPROBE_BIN):
         if not Path(binary).exists():
@@ -111,7 +318,12 @@ def run_pre_setup(spec: dict[str, Any]) -> None:
     log(f"Phase A: running {len(commands)} pre-setup command(s)")
     for idx, cmd_str in enumerate(commands, start=1):
         log(f"Phase A: pre-setup [{idx}/{len(commands)}]: {cmd_str}")
-        result = subprocess.run(cmd_str, shell=True, capture_output=True, text=True)
+        result = subprocess.run(
+            [SHELL_BIN, "-c", cmd_str],
+            capture_output=True,
+            text=True,
+            close_fds=False,
+        )
         if result.returncode != 0:
             tail = (result.stderr or result.stdout)[-500:]
             raise TourError(f"Pre-setup command failed: {cmd_str}\n{tail}")
@@ -119,22 +331,11 @@ def run_pre_setup(spec: dict[str, Any]) -> None:
             log(f"Phase A: pre-setup output: {result.stdout.strip()[:200]}")
 
 
-def load_tour_spec(spec_path: Path) -> dict[str, Any]:
-    try:
-        with spec_path.open("r", encoding="utf-8") as handle:
-            spec = json.load(handle)
-    except FileNotFoundError as exc:
-        raise TourError(f"Spec not found: {spec_path}") from exc
-    except json.JSONDecodeError as exc:
-        raise TourError(f"Spec JSON is invalid: {exc}") from exc
-
-    # Allow either traditional 'steps' or new 'segments' format
+def _check_spec_structure(spec: dict[str, Any]) -> None:
+    """SPEC_SCHEMA's checks, for when fastjsonschema isn't installed."""
     has_steps = "steps" in spec
     has_segments = "segments" in spec
 
-    if not has_steps and not has_segments:
-        raise TourError("Spec must have either 'steps' or 'segments' field")
-
     if has_steps and (not isinstance(spec["steps"], list) or not spec["steps"]):
         raise TourError("Spec 'steps' must be a non-empty array")
 
@@ -143,39 +344,52 @@ def load_tour_spec(spec_path: Path) -> dict[str, Any]:
     ):
         raise TourError("Spec 'segments' must be a non-empty array")
 
-    meta = spec["meta"]
-    settings = spec["settings"]
-    output = spec["output"]
+    for section, required in (
+        ("meta", SPEC_REQUIRED_META),
+        ("settings", SPEC_REQUIRED_SETTINGS),
+        ("output", SPEC_REQUIRED_OUTPUT),
+    ):
+        if section not in spec:
+            raise TourError(f"Spec missing: {section}")
+        for key in required:
+            if key not in spec[section]:
+                raise TourError(f"Spec {section} missing: {key}")
 
-    required_meta = ("title", "target_duration_seconds", "max_duration_seconds")
-    required_settings = (
-        "viewport",
-        "video_size",
-        "voice",
-        "speech_speed",
-        "language",
-        "default_step_timeout",
-        "max_retries_per_step",
-        "browser",
-    )
-    required_output = (
-        "path",
-        "video_codec",
-        "video_preset",
-        "video_crf",
-        "audio_codec",
-        "audio_bitrate",
-    )
+    items = spec.get("steps") or spec.get("segments", [])
+    item_type = "step" if has_steps else "segment"
+    for idx, item in enumerate(items, start=1):
+        for field in ("id", "narration"):
+            if field not in item:
+                raise TourError(
+                    f"{item_type.capitalize()} {idx} missing required field: {field}"
+                )
+
+
+def load_tour_spec(spec_path: Path) -> dict[str, Any]:
+    try:
+        raw = spec_path.read_bytes()
+    except FileNotFoundError as exc:
+        raise TourError(f"Spec not found: {spec_path}") from exc
+    try:
+        spec = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as exc:
+        # Both orjson.JSONDecodeError and json.JSONDecodeError are ValueErrors
+        raise TourError(f"Spec JSON is invalid: {exc}") from exc
 
-    for key in required_meta:
-        if key not in meta:
-            raise TourError(f"Spec meta missing: {key}")
-    for key in required_settings:
-        if key not in settings:
-            raise TourError(f"Spec settings missing: {key}")
-    for key in required_output:
-        if key not in output:
-            raise TourError(f"Spec output missing: {key}")
+    # Allow either traditional 'steps' or new 'segments' format
+    if "steps" not in spec and "segments" not in spec:
+        raise TourError("Spec must have either 'steps' or 'segments' field")
+
+    if _validate_spec_schema is not None:
+        try:
+            _validate_spec_schema(spec)
+        except fastjsonschema.JsonSchemaException as exc:
+            raise TourError(f"Spec is invalid: {exc.message}") from exc
+    else:
+        _check_spec_structure(spec)
+
+    meta = spec["meta"]
+    settings = spec["settings"]
 
     mode = str(settings.get("mode", "independent")).strip().lower()
     if mode not in {"independent", "continuous"}:
@@ -197,13 +411,7 @@ def load_tour_spec(spec_path: Path) -> dict[str, Any]:
     # Validate step/segment IDs
     item_ids: set[str] = set()
     items = spec.get("steps") or spec.get("segments", [])
-    for idx, item in enumerate(items, start=1):
-        for field in ("id", "narration"):
-            if field not in item:
-                item_type = "step" if "steps" in spec else "segment"
-                raise TourError(
-                    f"{item_type.capitalize()} {idx} missing required field: {field}"
-                )
+    for item in items:
         item_id = str(item["id"])
         if item_id in item_ids:
             raise TourError(f"Duplicate id: {item_id}")
@@ -244,8 +452,52 @@ def create_work_dirs(base: Path | None = None) -> dict[str, Path]:
     }
 
 
-def write_wav_atomic(path: Path, samples: Any, sample_rate: int) -> None:
+def _wav_header(frame_count: int, sample_rate: int, channels: int) -> bytes:
+    """44-byte canonical RIFF header for 16-bit PCM."""
+    block_align = channels * 2
+    data_size = frame_count * block_align
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        16,
+        b"data",
+        data_size,
+    )
+
+
+# fdatasync skips flushing metadata such as mtime; macOS only has fsync
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+
+def to_pcm16(samples: Any) -> np.ndarray:
+    """Float samples in [-1, 1] as contiguous 16-bit PCM, in one vectorized pass."""
+    pcm = np.asarray(samples)
+    if pcm.dtype == np.int16:
+        return np.ascontiguousarray(pcm)
+    return np.ascontiguousarray(np.clip(pcm, -1.0, 1.0) * 32767.0, dtype=np.int16)
+
+
+def synthesize_pcm16(
+    kokoro: Kokoro, text: str, voice: Any, speed: float, lang: str
+) -> tuple[np.ndarray, int]:
+    """Run Kokoro and hand back 16-bit PCM, so the float buffer is dropped early."""
+    samples, sample_rate = kokoro.create(text, voice=voice, speed=speed, lang=lang)
+    return to_pcm16(samples), sample_rate
+
+
+def write_wav_atomic(path: Path, samples: np.ndarray, sample_rate: int) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    pcm = to_pcm16(samples)
+    channels = pcm.shape[1] if pcm.ndim == 2 else 1
     temp_path: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
@@ -256,11 +508,14 @@ def write_wav_atomic(path: Path, samples: Any, sample_rate: int) -> None:
             delete=False,
         ) as temp_file:
             temp_path = Path(temp_file.name)
-        sf.write(str(temp_path), samples, sample_rate)
-        with temp_path.open("rb") as reader:
-            os.fsync(reader.fileno())
+            temp_file.write(_wav_header(pcm.shape[0], int(sample_rate), channels))
+            temp_file.write(pcm.astype("<i2", copy=False).tobytes())
+            temp_file.flush()
+            # Only the data needs to be durable; the rename below is covered
+            # by the directory fsync
+            _fdatasync(temp_file.fileno())
         os.replace(temp_path, path)
-        parent_fd = os.open(str(path.parent), os.O_RDONLY)
+        parent_fd = os.open(str(path.parent), os.O_RDONLY | os.O_DIRECTORY)
         try:
             os.fsync(parent_fd)
         finally:
@@ -271,53 +526,356 @@ def write_wav_atomic(path: Path, samples: Any, sample_rate: int) -> None:
         raise
 
 
-def prerender_tts(
+def _quantized_model_path() -> str:
+    """Return KOKORO_MODEL_INT8, quantizing KOKORO_MODEL into it on first use.
+
+    Only MatMul/Gemm weights are quantized (dynamic int8); falls back to the
+    fp32 model if quantization fails.
+    """
+    if os.path.exists(KOKORO_MODEL_INT8):
+        return KOKORO_MODEL_INT8
+    log(f"Phase B: writing {Path(KOKORO_MODEL_INT8).name} (one-time int8 quantization)")
+    temp_path = f"{KOKORO_MODEL_INT8[:-5]}.tmp.onnx"
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantize_dynamic(
+            KOKORO_MODEL,
+            temp_path,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["MatMul", "Gemm"],
+        )
+        os.replace(temp_path, KOKORO_MODEL_INT8)
+    except Exception as exc:
+        Path(temp_path).unlink(missing_ok=True)
+        log(f"Phase B: warning: int8 quantization failed, using fp32 model: {exc}")
+        return KOKORO_MODEL
+    return KOKORO_MODEL_INT8
+
+
+def _session_providers() -> list[Any]:
+    """ORT_PROVIDERS filtered to what this onnxruntime build offers."""
+    available = set(ort.get_available_providers())
+    return [
+        p for p in ORT_PROVIDERS if (p[0] if isinstance(p, tuple) else p) in available
+    ] or ["CPUExecutionProvider"]
+
+
+def _optimized_model_path(model_path: str, providers: list[Any]) -> str:
+    """Return model_path's fused-graph copy, building it on first use.
+
+    The copy is saved at ORT_ENABLE_EXTENDED so it stays portable across
+    CPUs; ORT_ENABLE_ALL layout transforms are applied again at load time.
+    Extended fusions depend on the execution providers, so the graph is
+    built with the same providers it will run on and the file is named
+    after them (e.g. .opt-cuda-cpu.onnx).
+    """
+    names = [p[0] if isinstance(p, tuple) else p for p in providers]
+    tag = "-".join(n.removesuffix("ExecutionProvider").lower() for n in names)
+    optimized = f"{model_path[:-5]}.opt-{tag}.onnx"
+    if os.path.exists(optimized):
+        return optimized
+    log(f"Phase B: writing optimized graph {Path(optimized).name} (one-time)")
+    temp_path = f"{optimized[:-5]}.tmp.onnx"
+    try:
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        opts.optimized_model_filepath = temp_path
+        ort.InferenceSession(model_path, sess_options=opts, providers=providers)
+        os.replace(temp_path, optimized)
+    except Exception as exc:
+        Path(temp_path).unlink(missing_ok=True)
+        log(f"Phase B: warning: graph optimization failed, using {model_path}: {exc}")
+        return model_path
+    return optimized
+
+
+def _load_kokoro(fp32: bool = False) -> Kokoro:
+    """Load Kokoro on an ONNX Runtime session with explicit threads/providers."""
+    source = KOKORO_MODEL if fp32 else _quantized_model_path()
+    providers = _session_providers()
+    model_path = _optimized_model_path(source, providers)
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+    opts.inter_op_num_threads = 1
+    session = ort.InferenceSession(model_path, sess_options=opts, providers=providers)
+    log(
+        f"Phase B: loaded {Path(model_path).name} on {session.get_providers()[0]} "
+        f"({opts.intra_op_num_threads} threads)"
+    )
+    if hasattr(Kokoro, "from_session"):
+        return Kokoro.from_session(session, KOKORO_VOICES)
+    # Older kokoro-onnx has no session hook; swap ours in after loading
+    kokoro = Kokoro(model_path, KOKORO_VOICES)
+    kokoro.sess = session
+    return kokoro
+
+
+_KOKORO: dict[bool, Kokoro] = {}
+
+
+def _get_kokoro(fp32: bool = False) -> Kokoro:
+    """Process-wide Kokoro instance per precision, loaded on first use."""
+    if fp32 not in _KOKORO:
+        _KOKORO[fp32] = _load_kokoro(fp32=fp32)
+    return _KOKORO[fp32]
+
+
+def tts_daemon_running() -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(TTS_SOCKET)
+        except OSError:
+            return False
+    return True
+
+
+async def _daemon_synthesize(request: dict[str, Any]) -> float:
+    """Have the --persistent-tts daemon write request["path"]; return duration."""
+    reader, writer = await asyncio.open_unix_connection(TTS_SOCKET)
+    try:
+        writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await writer.drain()
+        reply = json.loads(await reader.readline() or b"{}")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+    if "duration" not in reply:
+        raise TourError(f"TTS daemon failed: {reply.get('error', 'no reply')}")
+    return float(reply["duration"])
+
+
+async def _handle_tts_request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    sem: asyncio.Semaphore,
+) -> None:
+    line = await reader.readline()
+    if not line:
+        # Liveness probe from tts_daemon_running()
+        writer.close()
+        return
+    try:
+        request = json.loads(line)
+        kokoro = await asyncio.to_thread(_get_kokoro, bool(request.get("fp32")))
+        voice = str(request["voice"])
+        if voice not in kokoro.get_voices():
+            raise TourError(f"Unknown Kokoro voice: {voice}")
+        async with sem:
+            samples, sample_rate = await asyncio.to_thread(
+                synthesize_pcm16,
+                kokoro,
+                str(request["narration"]),
+                kokoro.get_voice_style(voice),
+                float(request["speed"]),
+                str(request["lang"]),
+            )
+        wav_path = Path(request["path"])
+        await asyncio.to_thread(write_wav_atomic, wav_path, samples, sample_rate)
+        reply: dict[str, Any] = {
+            "path": str(wav_path),
+            "duration": float(len(samples)) / float(sample_rate),
+        }
+        log(f"TTS daemon: wrote {wav_path} ({reply['duration']:.2f}s)")
+    except Exception as exc:
+        reply = {"error": str(exc)}
+    try:
+        writer.write(json.dumps(reply).encode("utf-8") + b"\n")
+        await writer.drain()
+    except ConnectionError:
+        # The client gave up (e.g. another step failed first)
+        pass
+    finally:
+        writer.close()
+
+
+def serve_tts(fp32: bool, socket_path: str = TTS_SOCKET) -> int:
+    """Keep Kokoro loaded and synthesize for other runs over a Unix socket."""
+
+    async def serve() -> None:
+        await asyncio.to_thread(_get_kokoro, fp32)
+        sem = asyncio.Semaphore(TTS_CONCURRENCY)
+        Path(socket_path).unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(
+            lambda r, w: _handle_tts_request(r, w, sem), path=socket_path
+        )
+        log(f"TTS daemon: listening on {socket_path}")
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        log("TTS daemon: stopped")
+    finally:
+        Path(socket_path).unlink(missing_ok=True)
+    return 0
+
+
+class SynthesisCache:
+    """Narration WAVs keyed on text and voice settings, shared across runs.
+
+    Files live on disk under cache_dir; durations of recently used entries
+    are kept in memory so repeats within a run skip the header read.
+    """
+
+    def __init__(self, cache_dir: Path = TTS_CACHE_DIR, max_entries: int = 128):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._durations: OrderedDict[str, float] = OrderedDict()
+
+    @staticmethod
+    def key(
+        narration: str, voice: str, speed: float, language: str, precision: str
+    ) -> str:
+        raw = f"{narration}|{voice}|{speed}|{language}|{precision}"
+        return hashlib.md5(raw.encode("utf-8")).hexdigest()
+
+    def fetch(self, key: str, dest: Path) -> float | None:
+        """Place the cached WAV for key at dest and return its duration."""
+        cached = self.cache_dir / f"{key}.wav"
+        if not cached.exists():
+            self._durations.pop(key, None)
+            return None
+        _link_or_copy(cached, dest)
+        duration = self._durations.get(key)
+        if duration is None:
+            duration = wav_duration(cached)
+        self._remember(key, duration)
+        return duration
+
+    def store(self, key: str, src: Path, duration: float) -> None:
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(src, self.cache_dir / f"{key}.wav")
+        except OSError as exc:
+            log(f"Phase B: warning: could not cache {src.name}: {exc}")
+            return
+        self._remember(key, duration)
+
+    def _remember(self, key: str, duration: float) -> None:
+        self._durations[key] = duration
+        self._durations.move_to_end(key)
+        while len(self._durations) > self.max_entries:
+            self._durations.popitem(last=False)
+
+
+def _link_or_copy(src: Path, dest: Path) -> None:
+    """Atomically make dest a hardlink of src, copying across filesystems."""
+    temp_path = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+    temp_path.unlink(missing_ok=True)
+    try:
+        os.link(src, temp_path)
+    except OSError:
+        shutil.copy2(src, temp_path)
+    os.replace(temp_path, dest)
+
+
+async def prerender_tts(
     spec: dict[str, Any],
     audio_dir: Path,
     skip_tts: bool,
+    fp32_tts: bool = False,
 ) -> dict[str, dict[str, Any]]:
     settings = spec["settings"]
     target_duration = float(spec["meta"]["target_duration_seconds"])
     step_audio: dict[str, dict[str, Any]] = {}
 
-    kokoro: Kokoro | None = None
-    if not skip_tts:
-        log("Phase B: loading Kokoro model")
-        kokoro = Kokoro(KOKORO_MODEL, KOKORO_VOICES)
-
-    total_narration = 0.0
-    for idx, step in enumerate(spec["steps"], start=1):
+    # Validate every narration before loading the model so a bad step fails
+    # fast instead of after synthesizing the ones before it
+    jobs: list[tuple[str, Path, str]] = []
+    for step in spec["steps"]:
         step_id = str(step["id"])
-        wav_path = audio_dir / f"step-{step_id}.wav"
         narration = str(step["narration"]).strip()
         if not narration:
             raise TourError(f"Step {step_id} has empty narration")
+        jobs.append((step_id, audio_dir / f"step-{step_id}.wav", narration))
 
+    kokoro: Kokoro | None = None
+    voice_style: Any = None
+    voice = str(settings["voice"])
+    use_daemon = not skip_tts and tts_daemon_running()
+    if use_daemon:
+        log(f"Phase B: synthesizing through TTS daemon at {TTS_SOCKET}")
+    elif not skip_tts:
+        log("Phase B: loading Kokoro model")
+        kokoro = _get_kokoro(fp32=fp32_tts)
+        if voice not in kokoro.get_voices():
+            raise TourError(f"Unknown Kokoro voice: {voice}")
+        # Resolve the voice embedding once rather than on every create() call
+        voice_style = kokoro.get_voice_style(voice)
+    speed = float(settings["speech_speed"])
+    language = str(settings["language"])
+
+    # One inference already spreads across ORT's intra-op threads, so only a
+    # couple of steps run at once; the rest of each step (WAV write, fsync)
+    # overlaps with the next step's compute
+    sem = asyncio.Semaphore(TTS_CONCURRENCY)
+    cache = SynthesisCache()
+    # Steps with identical narration wait on each other so only one of them
+    # synthesizes and the rest hit the cache
+    key_locks: dict[str, asyncio.Lock] = {}
+    done = 0
+
+    async def render(step_id: str, wav_path: Path, narration: str) -> float:
+        nonlocal done
         if skip_tts:
             if not wav_path.exists():
                 raise TourError(
                     f"--skip-tts requested but missing audio file: {wav_path}"
                 )
-            data, sample_rate = sf.read(str(wav_path), always_2d=False)
-            sample_count = data.shape[0] if hasattr(data, "shape") else len(data)
-            duration = float(sample_count) / float(sample_rate)
-            log(
-                f"Phase B: [{idx}/{len(spec['steps'])}] reused {wav_path.name} ({duration:.2f}s)"
-            )
+            duration = wav_duration(wav_path)
+            action = "reused"
         else:
-            assert kokoro is not None
-            samples, sample_rate = kokoro.create(
-                narration,
-                voice=str(settings["voice"]),
-                speed=float(settings["speech_speed"]),
-                lang=str(settings["language"]),
-            )
-            write_wav_atomic(wav_path, samples, sample_rate)
-            duration = float(len(samples)) / float(sample_rate)
-            log(
-                f"Phase B: [{idx}/{len(spec['steps'])}] generated {wav_path.name} ({duration:.2f}s)"
+            key = SynthesisCache.key(
+                narration, voice, speed, language, "fp32" if fp32_tts else "int8"
             )
+            async with key_locks.setdefault(key, asyncio.Lock()):
+                cached = await asyncio.to_thread(cache.fetch, key, wav_path)
+                if cached is not None:
+                    duration = cached
+                    action = "cached"
+                elif use_daemon:
+                    duration = await _daemon_synthesize(
+                        {
+                            "narration": narration,
+                            "voice": voice,
+                            "speed": speed,
+                            "lang": language,
+                            "fp32": fp32_tts,
+                            "path": str(wav_path.resolve()),
+                        }
+                    )
+                    await asyncio.to_thread(cache.store, key, wav_path, duration)
+                    action = "generated"
+                else:
+                    assert kokoro is not None
+                    async with sem:
+                        samples, sample_rate = await asyncio.to_thread(
+                            synthesize_pcm16,
+                            kokoro,
+                            narration,
+                            voice_style,
+                            speed,
+                            language,
+                        )
+                    await asyncio.to_thread(
+                        write_wav_atomic, wav_path, samples, sample_rate
+                    )
+                    duration = float(len(samples)) / float(sample_rate)
+                    await asyncio.to_thread(cache.store, key, wav_path, duration)
+                    action = "generated"
+        done += 1
+        log(
+            f"Phase B: [{done}/{len(jobs)}] {action} {wav_path.name} ({duration:.2f}s)"
+        )
+        return duration
+
+    durations = await asyncio.gather(*(render(*job) for job in jobs))
 
+    total_narration = 0.0
+    for (step_id, wav_path, _), duration in zip(jobs, durations):
         step_audio[step_id] = {"path": wav_path, "duration": duration}
         total_narration += duration
 
@@ -357,39 +915,71 @@ def run_assertions(
             raise TourError(f"Unknown assertion type: {a_type}")
 
 
+def navigate_to(
+    page: Any,
+    url: str,
+    step: dict[str, Any],
+    settings: dict[str, Any],
+    timeout_ms: int,
+) -> None:
+    """Go to url and wait until the step's ready_selector is attached.
+
+    Navigation only waits for the response to commit; the selector (default
+    "body") is the readiness signal, since Chromium's load events can hold on
+    to subresources an SPA's shell doesn't need. A step or the spec settings
+    can set navigation_wait_until to restore a load-event wait.
+    """
+    wait_until = str(
+        step.get(
+            "navigation_wait_until",
+            settings.get("navigation_wait_until", "commit"),
+        )
+    )
+    page.goto(url, wait_until=wait_until, timeout=timeout_ms)
+    page.wait_for_selector(
+        str(step.get("ready_selector", "body")), state="attached", timeout=timeout_ms
+    )
+
+
+# Starts the scroll and resolves once it has had time to finish, so one
+# evaluate round trip covers both the scroll and the hold
+_SMOOTH_SCROLL_JS = """
+({ target, duration }) => new Promise((resolve) => {
+    if (target === 'bottom') {
+        const delta = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
+        window.scrollBy({ top: delta, behavior: 'smooth' });
+    } else if (target === 'top') {
+        window.scrollTo({ top: 0, behavior: 'smooth' });
+    } else {
+        const current = window.scrollY || window.pageYOffset || 0;
+        window.scrollBy({ top: target - current, behavior: 'smooth' });
+    }
+    setTimeout(resolve, duration);
+})
+"""
+
+
 def smooth_scroll(page: Any, target: Any, speed: str = "medium") -> None:
     speed_map = {"slow": 1600, "medium": 1100, "fast": 700}
     duration_ms = speed_map.get(str(speed).lower(), 1100)
 
-    if isinstance(target, str) and target.lower() == "bottom":
-        page.evaluate(
-            """
-            () => {
-                const delta = Math.max(document.body.scrollHeight, document.documentElement.scrollHeight);
-                window.scrollBy({ top: delta, behavior: 'smooth' });
-            }
-            """
-        )
-    elif isinstance(target, str) and target.lower() == "top":
-        page.evaluate("() => window.scrollTo({ top: 0, behavior: 'smooth' })")
+    if isinstance(target, str) and target.lower() in ("bottom", "top"):
+        target = target.lower()
     else:
-        top_value = int(target)
-        page.evaluate(
-            """
-            (y) => {
-                const current = window.scrollY || window.pageYOffset || 0;
-                const delta = y - current;
-                window.scrollBy({ top: delta, behavior: 'smooth' });
-            }
-            """,
-            top_value,
-        )
-    page.wait_for_timeout(duration_ms)
+        target = int(target)
+    page.evaluate(_SMOOTH_SCROLL_JS, {"target": target, "duration": duration_ms})
 
 
 def dismiss_popups(page: Any, timeout_ms: int) -> int:
     clicked = 0
-    for selector in POPUP_SELECTORS:
+    # One round trip answers "any CSS popup at all?"; only when something
+    # matches do the per-selector clicks run, in POPUP_SELECTORS priority
+    try:
+        any_css = page.locator(_POPUP_COMBINED).count() > 0
+    except PlaywrightError:
+        any_css = True
+    selectors = POPUP_SELECTORS if any_css else _POPUP_RESIDUAL
+    for selector in selectors:
         try:
             locator = page.locator(selector).first
             if locator.count() == 0:
@@ -402,193 +992,300 @@ def dismiss_popups(page: Any, timeout_ms: int) -> int:
     return clicked
 
 
-def execute_actions(page: Any, step: dict[str, Any], timeout_ms: int) -> None:
-    actions = step.get("actions", [])
-    for action in actions:
-        a_type = action.get("type")
-        if a_type == "wait_for_load":
-            page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
-            try:
-                page.wait_for_load_state("networkidle", timeout=min(15000, timeout_ms))
-            except PlaywrightError:
-                log(
-                    f"Step {step['id']}: networkidle timed out, continuing with domcontentloaded"
-                )
-        elif a_type == "dismiss_popups":
-            count = dismiss_popups(page, timeout_ms)
-            if count:
-                log(f"Step {step['id']}: dismissed {count} popup element(s)")
-        elif a_type == "pause":
-            duration = float(action.get("duration", 1))
-            page.wait_for_timeout(int(duration * 1000))
-        elif a_type == "wait_for_hidden":
-            selector = str(action.get("selector", ""))
-            if selector:
-                try:
-                    page.locator(selector).first.wait_for(
-                        state="hidden", timeout=min(10000, timeout_ms)
-                    )
-                    log(f"Step {step['id']}: preloader '{selector}' hidden")
-                except PlaywrightError:
-                    log(
-                        f"Step {step['id']}: preloader '{selector}' wait timed out, continuing"
-                    )
-        elif a_type == "scroll":
-            smooth_scroll(
-                page, action.get("to", "bottom"), action.get("speed", "medium")
+def _action_wait_for_load(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+    try:
+        page.wait_for_load_state("networkidle", timeout=min(15000, timeout_ms))
+    except PlaywrightError:
+        log(
+            f"Step {step['id']}: networkidle timed out, continuing with domcontentloaded"
+        )
+
+
+def _action_dismiss_popups(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    count = dismiss_popups(page, timeout_ms)
+    if count:
+        log(f"Step {step['id']}: dismissed {count} popup element(s)")
+
+
+def _action_pause(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    duration = float(action.get("duration", 1))
+    page.wait_for_timeout(int(duration * 1000))
+
+
+def _action_wait_for_hidden(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    selector = str(action.get("selector", ""))
+    if selector:
+        try:
+            page.locator(selector).first.wait_for(
+                state="hidden", timeout=min(10000, timeout_ms)
             )
-            pause_bottom = float(action.get("pause_at_bottom", 0))
-            if pause_bottom > 0:
-                page.wait_for_timeout(int(pause_bottom * 1000))
-        elif a_type == "type_text":
-            text = str(action.get("text", ""))
-            delay = int(action.get("delay", 50))
+            log(f"Step {step['id']}: preloader '{selector}' hidden")
+        except PlaywrightError:
             log(
-                f"Step {step['id']}: typing text ({len(text)} chars) with {delay}ms delay"
+                f"Step {step['id']}: preloader '{selector}' wait timed out, continuing"
             )
-            try:
-                page.keyboard.type(text, delay=delay)
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: type_text failed, continuing: {exc}")
-        elif a_type == "press_key":
-            key = str(action.get("key", "")).strip()
-            if key:
-                log(f"Step {step['id']}: pressing key '{key}'")
-                try:
-                    page.keyboard.press(key)
-                except PlaywrightError as exc:
-                    log(f"Step {step['id']}: press_key failed, continuing: {exc}")
-            else:
-                log(f"Step {step['id']}: press_key missing key, skipping")
-        elif a_type == "click_selector":
-            selector = str(action.get("selector", "")).strip()
-            click_timeout = action.get("timeout")
-            if selector:
-                timeout_for_click = (
-                    int(click_timeout) if click_timeout is not None else timeout_ms
-                )
-                log(
-                    f"Step {step['id']}: clicking selector '{selector}' "
-                    f"(timeout={timeout_for_click}ms)"
-                )
-                try:
-                    page.locator(selector).first.click(timeout=timeout_for_click)
-                except PlaywrightError as exc:
-                    log(f"Step {step['id']}: click_selector failed, continuing: {exc}")
-            else:
-                log(f"Step {step['id']}: click_selector missing selector, skipping")
-        elif a_type == "focus_editor":
-            log(f"Step {step['id']}: focusing editor area")
-            try:
-                page.locator(".monaco-editor .view-lines").first.click()
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: focus_editor failed, continuing: {exc}")
-        elif a_type == "command_palette":
-            command = str(action.get("command", ""))
-            log(f"Step {step['id']}: opening command palette and typing '{command}'")
-            try:
-                page.keyboard.press("Control+Shift+p")
-                page.wait_for_timeout(500)
-                if command:
-                    page.keyboard.type(command, delay=30)
-                page.keyboard.press("Enter")
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: command_palette failed, continuing: {exc}")
-        elif a_type == "terminal_type":
-            text = str(action.get("text", ""))
-            press_enter = bool(action.get("press_enter", True))
+
+
+def _action_scroll(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    smooth_scroll(
+        page, action.get("to", "bottom"), action.get("speed", "medium")
+    )
+    pause_bottom = float(action.get("pause_at_bottom", 0))
+    if pause_bottom > 0:
+        page.wait_for_timeout(int(pause_bottom * 1000))
+
+
+def _action_type_text(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    text = str(action.get("text", ""))
+    delay = int(action.get("delay", 50))
+    log(
+        f"Step {step['id']}: typing text ({len(text)} chars) with {delay}ms delay"
+    )
+    try:
+        page.keyboard.type(text, delay=delay)
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: type_text failed, continuing: {exc}")
+
+
+def _action_press_key(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    key = str(action.get("key", "")).strip()
+    if key:
+        log(f"Step {step['id']}: pressing key '{key}'")
+        try:
+            page.keyboard.press(key)
+        except PlaywrightError as exc:
+            log(f"Step {step['id']}: press_key failed, continuing: {exc}")
+    else:
+        log(f"Step {step['id']}: press_key missing key, skipping")
+
+
+def _action_click_selector(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    selector = str(action.get("selector", "")).strip()
+    click_timeout = action.get("timeout")
+    if selector:
+        timeout_for_click = (
+            int(click_timeout) if click_timeout is not None else timeout_ms
+        )
+        log(
+            f"Step {step['id']}: clicking selector '{selector}' "
+            f"(timeout={timeout_for_click}ms)"
+        )
+        try:
+            page.locator(selector).first.click(timeout=timeout_for_click)
+        except PlaywrightError as exc:
+            log(f"Step {step['id']}: click_selector failed, continuing: {exc}")
+    else:
+        log(f"Step {step['id']}: click_selector missing selector, skipping")
+
+
+def _action_focus_editor(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    log(f"Step {step['id']}: focusing editor area")
+    try:
+        page.locator(".monaco-editor .view-lines").first.click()
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: focus_editor failed, continuing: {exc}")
+
+
+def _action_command_palette(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    command = str(action.get("command", ""))
+    log(f"Step {step['id']}: opening command palette and typing '{command}'")
+    try:
+        page.keyboard.press("Control+Shift+p")
+        page.wait_for_timeout(500)
+        if command:
+            page.keyboard.type(command, delay=30)
+        page.keyboard.press("Enter")
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: command_palette failed, continuing: {exc}")
+
+
+def _action_terminal_type(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    text = str(action.get("text", ""))
+    press_enter = bool(action.get("press_enter", True))
+    log(
+        f"Step {step['id']}: typing terminal command '{text}' "
+        f"(press_enter={press_enter})"
+    )
+    try:
+        # Use JavaScript to directly focus the active terminal's textarea.
+        # Playwright .click() fails because editor folding icons intercept
+        # pointer events. page.evaluate bypasses all actionability checks.
+        focused = page.evaluate("""() => {
+            // Find the active terminal wrapper
+            const active = document.querySelector('.terminal-wrapper.active');
+            if (!active) return 'no-active-wrapper';
+            // Find xterm textarea inside the active terminal
+            const ta = active.querySelector('textarea.xterm-helper-textarea');
+            if (!ta) return 'no-textarea';
+            ta.focus();
+            return 'focused';
+        }""")
+        if focused != "focused":
             log(
-                f"Step {step['id']}: typing terminal command '{text}' "
-                f"(press_enter={press_enter})"
+                f"Step {step['id']}: JS terminal focus returned: {focused}, trying fallback"
             )
-            try:
-                # Use JavaScript to directly focus the active terminal's textarea.
-                # Playwright .click() fails because editor folding icons intercept
-                # pointer events. page.evaluate bypasses all actionability checks.
-                focused = page.evaluate("""() => {
-                    // Find the active terminal wrapper
-                    const active = document.querySelector('.terminal-wrapper.active');
-                    if (!active) return 'no-active-wrapper';
-                    // Find xterm textarea inside the active terminal
-                    const ta = active.querySelector('textarea.xterm-helper-textarea');
-                    if (!ta) return 'no-textarea';
-                    ta.focus();
-                    return 'focused';
-                }""")
-                if focused != "focused":
-                    log(
-                        f"Step {step['id']}: JS terminal focus returned: {focused}, trying fallback"
-                    )
-                    # Fallback: click the panel area with force
-                    page.locator(".terminal-wrapper.active").first.click(force=True)
-                page.wait_for_timeout(300)
-                page.keyboard.type(text, delay=0)
-                if press_enter:
-                    page.keyboard.press("Enter")
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: terminal_type failed, continuing: {exc}")
-        elif a_type == "wait_for_selector":
-            selector = str(action.get("selector", "")).strip()
-            state = str(action.get("state", "visible"))
-            wait_timeout = action.get("timeout")
-            if selector:
-                timeout_for_wait = (
-                    int(wait_timeout) if wait_timeout is not None else timeout_ms
-                )
-                log(
-                    f"Step {step['id']}: waiting for selector '{selector}' "
-                    f"state='{state}' (timeout={timeout_for_wait}ms)"
-                )
-                try:
-                    page.locator(selector).first.wait_for(
-                        state=state, timeout=timeout_for_wait
-                    )
-                except PlaywrightError as exc:
-                    log(
-                        f"Step {step['id']}: wait_for_selector failed, continuing: {exc}"
-                    )
-            else:
-                log(f"Step {step['id']}: wait_for_selector missing selector, skipping")
-        elif a_type == "select_all_and_delete":
-            log(f"Step {step['id']}: selecting all and deleting")
-            try:
-                page.keyboard.press("Control+a")
-                page.keyboard.press("Backspace")
-            except PlaywrightError as exc:
-                log(
-                    f"Step {step['id']}: select_all_and_delete failed, continuing: {exc}"
-                )
-        elif a_type == "highlight_lines":
-            from_line = int(action.get("from_line", 1))
-            to_line = int(action.get("to_line", from_line))
-            down_count = max(0, to_line - from_line)
-            log(f"Step {step['id']}: highlighting lines {from_line} to {to_line}")
-            try:
-                page.keyboard.press("Control+g")
-                page.wait_for_timeout(120)
-                page.keyboard.type(str(from_line), delay=0)
-                page.keyboard.press("Enter")
-                page.wait_for_timeout(120)
-                for _ in range(down_count):
-                    page.keyboard.press("Shift+ArrowDown")
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: highlight_lines failed, continuing: {exc}")
-        elif a_type == "hide_secondary_sidebar":
-            log(f"Step {step['id']}: hiding secondary sidebar (auxiliary bar)")
-            try:
-                page.evaluate(
-                    """() => {
-                        const aux = document.getElementById('workbench.parts.auxiliarybar');
-                        if (aux) aux.remove();
-                        document.querySelectorAll('.auxiliarybar').forEach(el => el.remove());
-                        window.dispatchEvent(new Event('resize'));
-                    }"""
-                )
-                page.wait_for_timeout(500)
-            except PlaywrightError as exc:
-                log(f"Step {step['id']}: hide_secondary_sidebar failed: {exc}")
-        else:
+            # Fallback: click the panel area with force
+            page.locator(".terminal-wrapper.active").first.click(force=True)
+        page.wait_for_timeout(300)
+        page.keyboard.type(text, delay=0)
+        if press_enter:
+            page.keyboard.press("Enter")
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: terminal_type failed, continuing: {exc}")
+
+
+def _action_wait_for_selector(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    selector = str(action.get("selector", "")).strip()
+    state = str(action.get("state", "visible"))
+    wait_timeout = action.get("timeout")
+    if selector:
+        timeout_for_wait = (
+            int(wait_timeout) if wait_timeout is not None else timeout_ms
+        )
+        log(
+            f"Step {step['id']}: waiting for selector '{selector}' "
+            f"state='{state}' (timeout={timeout_for_wait}ms)"
+        )
+        try:
+            page.locator(selector).first.wait_for(
+                state=state, timeout=timeout_for_wait
+            )
+        except PlaywrightError as exc:
+            log(
+                f"Step {step['id']}: wait_for_selector failed, continuing: {exc}"
+            )
+    else:
+        log(f"Step {step['id']}: wait_for_selector missing selector, skipping")
+
+
+def _action_select_all_and_delete(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    log(f"Step {step['id']}: selecting all and deleting")
+    try:
+        page.keyboard.press("Control+a")
+        page.keyboard.press("Backspace")
+    except PlaywrightError as exc:
+        log(
+            f"Step {step['id']}: select_all_and_delete failed, continuing: {exc}"
+        )
+
+
+# Same selection the Ctrl+G / Shift+ArrowDown fallback makes, set in one call;
+# returns false where Monaco isn't exposed as a global (e.g. code-server)
+_MONACO_SELECT_LINES_JS = """
+([fromLine, toLine]) => {
+    const m = globalThis.monaco;
+    if (!m || !m.editor || !m.editor.getEditors) return false;
+    const editors = m.editor.getEditors();
+    const editor = editors.find((e) => e.hasTextFocus()) || editors[0];
+    if (!editor) return false;
+    editor.setSelection(new m.Range(fromLine, 1, Math.max(fromLine, toLine), 1));
+    editor.revealLinesInCenterIfOutsideViewport(fromLine, toLine);
+    editor.focus();
+    return true;
+}
+"""
+
+
+def _action_highlight_lines(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    from_line = int(action.get("from_line", 1))
+    to_line = int(action.get("to_line", from_line))
+    down_count = max(0, to_line - from_line)
+    log(f"Step {step['id']}: highlighting lines {from_line} to {to_line}")
+    try:
+        if page.evaluate(_MONACO_SELECT_LINES_JS, [from_line, to_line]):
+            return
+    except PlaywrightError:
+        pass
+    try:
+        page.keyboard.press("Control+g")
+        page.wait_for_timeout(120)
+        page.keyboard.type(str(from_line), delay=0)
+        page.keyboard.press("Enter")
+        page.wait_for_timeout(120)
+        for _ in range(down_count):
+            page.keyboard.press("Shift+ArrowDown")
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: highlight_lines failed, continuing: {exc}")
+
+
+def _action_hide_secondary_sidebar(
+    page: Any, step: dict[str, Any], action: dict[str, Any], timeout_ms: int
+) -> None:
+    log(f"Step {step['id']}: hiding secondary sidebar (auxiliary bar)")
+    try:
+        # Resolves after the workbench has had 500ms to relayout
+        page.evaluate(
+            """() => new Promise((resolve) => {
+                const aux = document.getElementById('workbench.parts.auxiliarybar');
+                if (aux) aux.remove();
+                document.querySelectorAll('.auxiliarybar').forEach(el => el.remove());
+                window.dispatchEvent(new Event('resize'));
+                setTimeout(resolve, 500);
+            })"""
+        )
+    except PlaywrightError as exc:
+        log(f"Step {step['id']}: hide_secondary_sidebar failed: {exc}")
+
+
+# (page, step, action, timeout_ms)
+ActionHandler = Callable[[Any, dict[str, Any], dict[str, Any], int], None]
+
+_ACTION_HANDLERS: dict[str, ActionHandler] = {
+    "wait_for_load": _action_wait_for_load,
+    "dismiss_popups": _action_dismiss_popups,
+    "pause": _action_pause,
+    "wait_for_hidden": _action_wait_for_hidden,
+    "scroll": _action_scroll,
+    "type_text": _action_type_text,
+    "press_key": _action_press_key,
+    "click_selector": _action_click_selector,
+    "focus_editor": _action_focus_editor,
+    "command_palette": _action_command_palette,
+    "terminal_type": _action_terminal_type,
+    "wait_for_selector": _action_wait_for_selector,
+    "select_all_and_delete": _action_select_all_and_delete,
+    "highlight_lines": _action_highlight_lines,
+    "hide_secondary_sidebar": _action_hide_secondary_sidebar,
+}
+
+
+def execute_actions(page: Any, step: dict[str, Any], timeout_ms: int) -> None:
+    actions = step.get("actions", [])
+    for action in actions:
+        a_type = action.get("type")
+        handler = _ACTION_HANDLERS.get(a_type)
+        if handler is None:
             raise TourError(f"Unknown action type: {a_type}")
+        handler(page, step, action, timeout_ms)
 
     if "scroll" in step:
         s = step["scroll"]
@@ -598,34 +1295,169 @@ def execute_actions(page: Any, step: dict[str, Any], timeout_ms: int) -> None:
             page.wait_for_timeout(int(pause_bottom * 1000))
 
 
+def launch_capture_context(
+    playwright: Any,
+    dirs: dict[str, Path],
+    screen_display: str | None,
+    profile_dir: Path,
+) -> Any:
+    """Launch Chromium on a persistent profile; each page gets its own video.
+
+    Reusing the profile keeps Chromium's HTTP and V8 code caches, so heavy
+    bundles such as code-server's Monaco load warm after the first run.
+    """
+    options: dict[str, Any] = {
+        "viewport": {"width": 1920, "height": 1080},
+        "java_script_enabled": True,
+    }
+    if screen_display is None:
+        options["headless"] = True
+        options["record_video_dir"] = str(dirs["clips"])
+        options["record_video_size"] = {"width": 1920, "height": 1080}
+    else:
+        # Screen capture needs a real window filling the grabbed display
+        options["headless"] = False
+        options["env"] = {**os.environ, "DISPLAY": screen_display}
+        options["args"] = [
+            "--kiosk",
+            "--window-position=0,0",
+            "--window-size=1920,1080",
+        ]
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    context = playwright.chromium.launch_persistent_context(str(profile_dir), **options)
+    # A persistent context opens with a blank page that would otherwise be
+    # recorded for the whole run; steps always open their own
+    for page in list(context.pages):
+        video = page.video
+        page.close()
+        if video is not None:
+            video.delete()
+    return context
+
+
+# Everything an origin keeps between visits except the HTTP, Cache Storage
+# and compiled-code caches the persistent profile is there to keep warm
+_ORIGIN_STORAGE_TYPES = (
+    "cookies,local_storage,indexeddb,websql,file_systems,service_workers"
+)
+
+
+def clear_origin_storage(context: Any, page: Any, url: str) -> None:
+    """Give a step a clean slate on a reused profile.
+
+    Clears cookies everywhere and the step origin's localStorage, IndexedDB
+    and service workers, so independent steps stay repeatable no matter which
+    worker's profile runs them or what an earlier run left behind.
+    """
+    context.clear_cookies()
+    parts = urlsplit(url)
+    if not parts.scheme.startswith("http"):
+        return
+    cdp = context.new_cdp_session(page)
+    try:
+        cdp.send(
+            "Storage.clearDataForOrigin",
+            {
+                "origin": f"{parts.scheme}://{parts.netloc}",
+                "storageTypes": _ORIGIN_STORAGE_TYPES,
+            },
+        )
+    finally:
+        cdp.detach()
+
+
+def start_screen_capture(display: str, destination: Path) -> subprocess.Popen[bytes]:
+    """Grab an X display into an H.264 MP4 on the GPU encoder when available.
+
+    The hardware encoder runs off the CPU, so capture doesn't compete with
+    page rendering the way Playwright's in-process VP8 recorder does.
+    """
+    encoder = hw_video_encoder()
+    if encoder == "h264_nvenc":
+        global_args: list[str] = []
+        codec = [*build_video_codec_args("nvenc"), "-pix_fmt", "yuv420p"]
+    elif encoder == "h264_vaapi":
+        global_args = ["-vaapi_device", VAAPI_DEVICE]
+        codec = ["-vf", "format=nv12,hwupload", "-c:v", "h264_vaapi", "-qp", "23"]
+    else:
+        global_args = []
+        codec = [
+            "-c:v",
+            "libx264",
+            "-preset",
+            "ultrafast",
+            "-crf",
+            "23",
+            "-pix_fmt",
+            "yuv420p",
+        ]
+    cmd = [
+        FFMPEG_BIN,
+        "-y",
+        "-loglevel",
+        "error",
+        *global_args,
+        "-f",
+        "x11grab",
+        "-framerate",
+        "30",
+        "-video_size",
+        "1920x1080",
+        "-i",
+        display,
+        *codec,
+        str(destination),
+    ]
+    return subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
+def stop_screen_capture(proc: subprocess.Popen[bytes], step_id: str) -> None:
+    try:
+        # "q" on stdin makes ffmpeg finalize the MP4 before exiting
+        _, stderr = proc.communicate(b"q", timeout=15)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        _, stderr = proc.communicate()
+    if proc.returncode != 0:
+        tail = stderr.decode("utf-8", "replace")[-1200:]
+        raise TourError(f"Screen capture failed for step {step_id}: {tail}")
+
+
 def capture_step_video(
-    browser: Any,
+    context: Any,
     step: dict[str, Any],
     audio_duration: float,
     settings: dict[str, Any],
     dirs: dict[str, Path],
     attempt: int,
+    screen_display: str | None = None,
 ) -> Path:
     timeout_ms = int(float(settings["default_step_timeout"]) * 1000)
-    context = None
     page = None
     video_obj = None
+    capture: subprocess.Popen[bytes] | None = None
     step_id = str(step["id"])
-    destination = dirs["clips"] / f"step-{step_id}.webm"
+    suffix = "webm" if screen_display is None else "mp4"
+    destination = dirs["clips"] / f"step-{step_id}.{suffix}"
 
     try:
-        context = browser.new_context(
-            viewport={"width": 1920, "height": 1080},
-            record_video_dir=str(dirs["clips"]),
-            record_video_size={"width": 1920, "height": 1080},
-            java_script_enabled=True,
-        )
+        # Playwright records one video per page, so a fresh page on the shared
+        # context gives this step its own clip without a context cold start
         page = context.new_page()
+        clear_origin_storage(context, page, str(step["url"]))
         page.set_default_timeout(timeout_ms)
         page.set_default_navigation_timeout(timeout_ms)
+        if screen_display is not None:
+            page.bring_to_front()
+            capture = start_screen_capture(screen_display, destination)
 
         log(f"Phase C: step {step_id} attempt {attempt} navigating to {step['url']}")
-        page.goto(str(step["url"]), wait_until="domcontentloaded", timeout=timeout_ms)
+        navigate_to(page, str(step["url"]), step, settings, timeout_ms)
 
         run_assertions(page, step.get("assertions", []), timeout_ms)
         execute_actions(page, step, timeout_ms)
@@ -633,9 +1465,16 @@ def capture_step_video(
         hold_seconds = audio_duration + 1.4
         page.wait_for_timeout(int(hold_seconds * 1000))
 
+        if capture is not None:
+            stop_screen_capture(capture, step_id)
+            capture = None
+            page.close()
+            if not destination.exists() or destination.stat().st_size == 0:
+                raise TourError(f"Recorded clip missing or empty for step {step_id}")
+            return destination
+
         video_obj = page.video
-        if context is not None:
-            context.close()
+        page.close()
 
         if video_obj is None:
             raise TourError(f"No video handle created for step {step_id}")
@@ -644,7 +1483,7 @@ def capture_step_video(
             video_obj.save_as(str(destination))
         except PlaywrightError as save_error:
             log(
-                f"Phase C: save_as after context close failed for step {step_id}: {save_error}"
+                f"Phase C: save_as after page close failed for step {step_id}: {save_error}"
             )
             source_path = Path(video_obj.path())
             if not source_path.exists():
@@ -667,16 +1506,52 @@ def capture_step_video(
         raise
 
     finally:
-        if page is not None:
+        if capture is not None:
+            capture.kill()
+            capture.wait()
+        if page is not None and not page.is_closed():
             try:
                 page.close()
             except PlaywrightError:
                 pass
-        if context is not None:
-            try:
-                context.close()
-            except PlaywrightError:
-                pass
+
+
+class CaptureSession:
+    """A Playwright driver and persistent recording context owned by one thread."""
+
+    def __init__(
+        self, dirs: dict[str, Path], screen_display: str | None, profile_dir: Path
+    ) -> None:
+        self.dirs = dirs
+        self.screen_display = screen_display
+        self.profile_dir = profile_dir
+        self.playwright = sync_playwright().start()
+        self._launch()
+
+    def _launch(self) -> None:
+        self.closed = False
+        self.context = launch_capture_context(
+            self.playwright, self.dirs, self.screen_display, self.profile_dir
+        )
+        self.context.on("close", lambda _: setattr(self, "closed", True))
+
+    def restart(self) -> None:
+        """Relaunch only if Chromium has gone away.
+
+        A failed step leaves the context usable (its page is closed and the
+        next attempt opens a fresh one), and a relaunch costs seconds.
+        """
+        if not self.closed:
+            return
+        log("Phase C: browser disconnected, relaunching")
+        self._launch()
+
+    def close(self) -> None:
+        try:
+            self.context.close()
+        except Exception:
+            pass
+        self.playwright.stop()
 
 
 def run_capture_phase(
@@ -684,6 +1559,8 @@ def run_capture_phase(
     step_audio: dict[str, dict[str, Any]],
     dirs: dict[str, Path],
     dry_run: bool,
+    screen_display: str | None = None,
+    clean_profile: bool = False,
 ) -> list[StepResult]:
     if dry_run:
         log("Phase C: dry-run enabled, skipping browser capture")
@@ -700,87 +1577,116 @@ def run_capture_phase(
             for step in spec["steps"]
         ]
 
-    results: list[StepResult] = []
     max_retries = int(spec["settings"]["max_retries_per_step"])
     browser_name = str(spec["settings"].get("browser", "chromium")).lower()
     if browser_name != "chromium":
         raise TourError("This pipeline currently supports browser=chromium only")
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
-        try:
-            for step in spec["steps"]:
-                step_id = str(step["id"])
-                audio_info = step_audio[step_id]
-                audio_duration = float(audio_info["duration"])
-                attempts = 0
-                step_start = time.time()
-                last_error: Exception | None = None
+    record_video = screen_display is None
+    if not record_video:
+        log(f"Phase C: capturing display {screen_display} with {hw_video_encoder()}")
+
+    # Each step starts with its origin's storage cleared (the HTTP and code
+    # caches survive), so several run at once, one browser per worker.
+    # A grabbed X display can only show one step at a time.
+    steps = list(spec["steps"])
+    workers = 1 if screen_display else min(CAPTURE_WORKERS, os.cpu_count() or 1)
+    workers = max(1, min(workers, len(steps)))
+    pending: queue.SimpleQueue[dict[str, Any]] = queue.SimpleQueue()
+    for step in steps:
+        pending.put(step)
+    results_by_id: dict[str, StepResult] = {}
+    results_lock = threading.Lock()
+    failed = threading.Event()
+
+    def capture_with_retries(session: CaptureSession, step: dict[str, Any]) -> None:
+        step_id = str(step["id"])
+        audio_info = step_audio[step_id]
+        audio_duration = float(audio_info["duration"])
+        attempts = 0
+        step_start = time.time()
+        last_error: Exception | None = None
+
+        while attempts <= max_retries:
+            attempts += 1
+            try:
+                clip_path = capture_step_video(
+                    context=session.context,
+                    step=step,
+                    audio_duration=audio_duration,
+                    settings=spec["settings"],
+                    dirs=dirs,
+                    attempt=attempts,
+                    screen_display=screen_display,
+                )
+                elapsed = time.time() - step_start
+                log(
+                    f"Phase C: step {step_id} succeeded in {elapsed:.2f}s after {attempts} attempt(s)"
+                )
+                with results_lock:
+                    results_by_id[step_id] = StepResult(
+                        step_id=step_id,
+                        attempt_count=attempts,
+                        success=True,
+                        clip_path=clip_path,
+                        audio_path=audio_info["path"],
+                        audio_duration=audio_duration,
+                        step_elapsed=elapsed,
+                    )
+                return
+            except Exception as exc:
+                last_error = exc
+                log(f"Phase C: step {step_id} failed attempt {attempts}: {exc}")
 
-                while attempts <= max_retries:
-                    attempts += 1
-                    try:
-                        clip_path = capture_step_video(
-                            browser=browser,
-                            step=step,
+                if attempts <= max_retries:
+                    log(f"Phase C: retrying step {step_id} ({attempts}/{max_retries})")
+                    session.restart()
+                else:
+                    elapsed = time.time() - step_start
+                    with results_lock:
+                        results_by_id[step_id] = StepResult(
+                            step_id=step_id,
+                            attempt_count=attempts,
+                            success=False,
+                            clip_path=None,
+                            audio_path=audio_info["path"],
                             audio_duration=audio_duration,
-                            settings=spec["settings"],
-                            dirs=dirs,
-                            attempt=attempts,
-                        )
-                        elapsed = time.time() - step_start
-                        log(
-                            f"Phase C: step {step_id} succeeded in {elapsed:.2f}s after {attempts} attempt(s)"
+                            step_elapsed=elapsed,
                         )
-                        results.append(
-                            StepResult(
-                                step_id=step_id,
-                                attempt_count=attempts,
-                                success=True,
-                                clip_path=clip_path,
-                                audio_path=audio_info["path"],
-                                audio_duration=audio_duration,
-                                step_elapsed=elapsed,
-                            )
-                        )
-                        break
-                    except Exception as exc:
-                        last_error = exc
-                        log(f"Phase C: step {step_id} failed attempt {attempts}: {exc}")
-
-                        if attempts <= max_retries:
-                            log(
-                                f"Phase C: retrying step {step_id} ({attempts}/{max_retries})"
-                            )
-                            if attempts > 1:
-                                try:
-                                    browser.close()
-                                except Exception:
-                                    pass
-                                browser = playwright.chromium.launch(headless=True)
-                        else:
-                            elapsed = time.time() - step_start
-                            results.append(
-                                StepResult(
-                                    step_id=step_id,
-                                    attempt_count=attempts,
-                                    success=False,
-                                    clip_path=None,
-                                    audio_path=audio_info["path"],
-                                    audio_duration=audio_duration,
-                                    step_elapsed=elapsed,
-                                )
-                            )
-                            raise TourError(
-                                f"Step {step_id} failed after {attempts} attempts: {last_error}"
-                            )
+                    raise TourError(
+                        f"Step {step_id} failed after {attempts} attempts: {last_error}"
+                    )
+
+    def worker(index: int) -> None:
+        # Playwright's sync API is bound to the thread that started it, so
+        # each worker owns its driver and context, and Chromium locks a
+        # profile to one process, so each worker has its own profile too
+        session = CaptureSession(dirs, screen_display, PROFILE_DIR / f"worker-{index}")
+        try:
+            while not failed.is_set():
+                try:
+                    step = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    capture_with_retries(session, step)
+                except Exception:
+                    failed.set()
+                    raise
         finally:
-            try:
-                browser.close()
-            except Exception:
-                pass
+            session.close()
 
-    return results
+    if clean_profile:
+        log(f"Phase C: removing browser profile {PROFILE_DIR}")
+        shutil.rmtree(PROFILE_DIR, ignore_errors=True)
+    if workers > 1:
+        log(f"Phase C: capturing {len(steps)} steps on {workers} browsers")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(worker, index) for index in range(workers)]
+    for future in futures:
+        future.result()
+
+    return [results_by_id[str(step["id"])] for step in steps]
 
 
 def run_continuous_capture(
@@ -788,7 +1694,14 @@ def run_continuous_capture(
     step_audio: dict[str, dict[str, Any]],
     dirs: dict[str, Path],
     dry_run: bool,
+    screen_display: str | None = None,
 ) -> list[StepResult]:
+    """Record every step into one clip on a single page.
+
+    With screen_display, ffmpeg grabs the X display straight into an H.264
+    MP4 for the whole session, so no WebM is written by Playwright and read
+    back by Phase D.
+    """
     if dry_run:
         log("Phase C: dry-run enabled, skipping browser capture")
         return [
@@ -810,24 +1723,39 @@ def run_continuous_capture(
 
     timeout_ms = int(float(spec["settings"]["default_step_timeout"]) * 1000)
     results: list[StepResult] = []
-    destination = dirs["clips"] / "continuous.webm"
+    suffix = "webm" if screen_display is None else "mp4"
+    destination = dirs["clips"] / f"continuous.{suffix}"
+    context_options: dict[str, Any] = {
+        "viewport": {"width": 1920, "height": 1080},
+        "java_script_enabled": True,
+    }
+    if screen_display is None:
+        browser_options: dict[str, Any] = {"headless": True}
+        context_options["record_video_dir"] = str(dirs["clips"])
+        context_options["record_video_size"] = {"width": 1920, "height": 1080}
+    else:
+        browser_options = {
+            "headless": False,
+            "env": {**os.environ, "DISPLAY": screen_display},
+            "args": ["--kiosk", "--window-position=0,0", "--window-size=1920,1080"],
+        }
 
     with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
+        browser = playwright.chromium.launch(**browser_options)
         context = None
         page = None
         video_obj = None
+        capture: subprocess.Popen[bytes] | None = None
         try:
-            context = browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                record_video_dir=str(dirs["clips"]),
-                record_video_size={"width": 1920, "height": 1080},
-                java_script_enabled=True,
-            )
+            context = browser.new_context(**context_options)
             page = context.new_page()
             page.set_default_timeout(timeout_ms)
             page.set_default_navigation_timeout(timeout_ms)
-            video_obj = page.video
+            if screen_display is None:
+                video_obj = page.video
+            else:
+                page.bring_to_front()
+                capture = start_screen_capture(screen_display, destination)
 
             recording_started = time.time()
             for idx, step in enumerate(spec["steps"]):
@@ -852,10 +1780,8 @@ def run_continuous_capture(
                             f"Phase C: step {step_id} navigating to {target_url} "
                             "(continuous mode)"
                         )
-                        page.goto(
-                            target_url,
-                            wait_until="domcontentloaded",
-                            timeout=timeout_ms,
+                        navigate_to(
+                            page, target_url, step, spec["settings"], timeout_ms
                         )
                     else:
                         log(
@@ -907,6 +1833,9 @@ def run_continuous_capture(
                     )
                 )
 
+            if capture is not None:
+                stop_screen_capture(capture, "continuous")
+                capture = None
             if page is not None:
                 page.close()
                 page = None
@@ -914,19 +1843,16 @@ def run_continuous_capture(
                 context.close()
                 context = None
 
-            if video_obj is None:
-                raise TourError("No video handle created for continuous capture")
+            if screen_display is None:
+                if video_obj is None:
+                    raise TourError("No video handle created for continuous capture")
 
-            try:
-                video_obj.save_as(str(destination))
-            except PlaywrightError as save_error:
-                log(
-                    f"Phase C: save_as after context close failed in continuous mode: {save_error}"
-                )
+                # The context is closed, so Playwright has finished writing the
+                # WebM; move it into place rather than copying it with save_as
                 source_path = Path(video_obj.path())
                 if not source_path.exists():
-                    raise TourError("Continuous video file unavailable") from save_error
-                shutil.copy2(source_path, destination)
+                    raise TourError("Continuous video file unavailable")
+                move_file(source_path, destination)
 
             if not destination.exists() or destination.stat().st_size == 0:
                 raise TourError("Continuous recorded clip missing or empty")
@@ -936,6 +1862,9 @@ def run_continuous_capture(
 
             return results
         finally:
+            if capture is not None:
+                capture.kill()
+                capture.wait()
             if page is not None:
                 try:
                     page.close()
@@ -952,27 +1881,52 @@ def run_continuous_capture(
                 pass
 
 
-def transcode_step_clip(webm_path: Path, output_mp4_path: Path) -> None:
-    cmd = [
-        FFMPEG_BIN,
-        "-y",
-        "-i",
-        str(webm_path),
-        "-an",
-        "-vf",
-        "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=30,format=yuv420p",
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
-        str(output_mp4_path),
-    ]
-    run_cmd(cmd, f"Normalize clip {webm_path.name}")
+def build_video_codec_args(hwaccel: str = "none") -> list[str]:
+    """Video encoder arguments for Phase D/E encodes.
+
+    hwaccel="nvenc" swaps libx264 for h264_nvenc at a comparable quality
+    target. Filters still run on the CPU, so inputs and filter graphs are the
+    same for both encoders.
+    """
+    if hwaccel == "nvenc":
+        return [
+            "-c:v",
+            "h264_nvenc",
+            "-preset",
+            "p4",
+            "-rc",
+            "vbr",
+            "-cq",
+            "23",
+            "-b:v",
+            "0",
+        ]
+    return ["-c:v", "libx264", "-preset", X264_PRESET, "-crf", "20"]
+
+
+NORMALIZE_VF = (
+    "scale=1920:1080:force_original_aspect_ratio=decrease,"
+    "pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=30,format=yuv420p"
+)
+
+
+def normalize_filter(params: tuple[int, int, float, str]) -> str:
+    """NORMALIZE_VF, or just the frame-rate lock if the clip already conforms.
+
+    Recordings are made at the 1920x1080 viewport in yuv420p, so the
+    scale/pad/format pass is usually skippable. fps=30 always stays: it
+    converts Playwright's 25 fps WebM and keeps every step on the same
+    timebase for the stream-copy concat.
+    """
+    width, height, _, pix_fmt = params
+    if (width, height) == (1920, 1080) and pix_fmt == "yuv420p":
+        return "fps=30"
+    return NORMALIZE_VF
 
 
-def normalize_overlay_clip(input_path: Path, output_path: Path) -> None:
+def normalize_overlay_clip(
+    input_path: Path, output_path: Path, hwaccel: str = "none", threads: int = 0
+) -> None:
     """Normalize an intro/outro MP4 overlay to match the recording format.
 
     Overlays are pre-rendered by Remotion at 1920x1080. We normalize to ensure
@@ -989,13 +1943,8 @@ def normalize_overlay_clip(input_path: Path, output_path: Path) -> None:
         "-i",
         "anullsrc=r=24000:cl=mono",
         "-vf",
-        "scale=1920:1080:force_original_aspect_ratio=decrease,pad=1920:1080:(ow-iw)/2:(oh-ih)/2,setsar=1,fps=30,format=yuv420p",
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
+        NORMALIZE_VF,
+        *build_video_codec_args(hwaccel),
         "-ac",
         "1",
         "-ar",
@@ -1007,53 +1956,108 @@ def normalize_overlay_clip(input_path: Path, output_path: Path) -> None:
         "-shortest",
         "-movflags",
         "+faststart",
+        "-threads",
+        str(threads),
         str(output_path),
     ]
     run_cmd(cmd, f"Normalize overlay {input_path.name}")
 
 
-def apply_overlays(
+def prepare_overlays(
     spec: dict[str, Any],
-    main_video: Path,
     assembly_dir: Path,
-) -> Path:
-    """Prepend intro and/or append outro overlay clips to the main video.
-
-    Reads intro_clip and outro_clip paths from spec['output'].
-    If neither is set, returns main_video unchanged.
+    hwaccel: str = "none",
+    threads: int = 0,
+) -> dict[str, Path]:
+    """Normalize the spec's intro/outro clips, keyed by "intro" / "outro"."""
+    prepared: dict[str, Path] = {}
+    for kind in ("intro", "outro"):
+        raw = spec["output"].get(f"{kind}_clip")
+        if not raw:
+            continue
+        source = Path(os.path.expanduser(str(raw))).resolve()
+        if not source.exists():
+            raise TourError(f"{kind.capitalize()} overlay clip not found: {source}")
+        normalized = assembly_dir / f"{kind}-normalized.mp4"
+        normalize_overlay_clip(source, normalized, hwaccel, threads)
+        prepared[kind] = normalized
+    return prepared
+
+
+def start_overlay_prep(
+    spec: dict[str, Any], assembly_dir: Path, hwaccel: str = "none"
+) -> Future | None:
+    """Normalize overlays on a background thread while Phase C runs.
+
+    Capture spends most of its time holding for narration, so the overlay
+    encodes finish there instead of on the Phase D critical path. Two ffmpeg
+    threads keep it from competing with Chromium's recorder for the CPU.
     """
-    intro_raw = spec["output"].get("intro_clip")
-    outro_raw = spec["output"].get("outro_clip")
+    output = spec["output"]
+    if not output.get("intro_clip") and not output.get("outro_clip"):
+        return None
+    pool = ThreadPoolExecutor(max_workers=1)
+    future = pool.submit(prepare_overlays, spec, assembly_dir, hwaccel, 2)
+    pool.shutdown(wait=False)
+    return future
 
-    if not intro_raw and not outro_raw:
-        return main_video
 
-    clips_to_concat: list[Path] = []
+def probe_streams(path: Path) -> dict[str, dict[str, Any]]:
+    """Concat-relevant parameters of the first video and audio stream."""
+    cmd = [
+        FFPROBE_BIN,
+        "-v",
+        "error",
+        "-show_entries",
+        "stream=codec_type,codec_name,profile,width,height,pix_fmt,"
+        "r_frame_rate,sample_rate,channels,channel_layout",
+        "-of",
+        "json",
+        str(path),
+    ]
+    result = run_cmd(cmd, f"ffprobe streams for {path.name}")
+    try:
+        streams = json.loads(result.stdout)["streams"]
+    except (ValueError, KeyError) as exc:
+        raise TourError(f"Invalid stream info from ffprobe for {path}") from exc
+    found: dict[str, dict[str, Any]] = {}
+    for stream in streams:
+        found.setdefault(str(stream.pop("codec_type", "")), stream)
+    return found
+
 
-    if intro_raw:
-        intro_path = Path(os.path.expanduser(str(intro_raw))).resolve()
-        if not intro_path.exists():
-            raise TourError(f"Intro overlay clip not found: {intro_path}")
-        intro_normalized = assembly_dir / "intro-normalized.mp4"
-        normalize_overlay_clip(intro_path, intro_normalized)
-        clips_to_concat.append(intro_normalized)
-        log(f"Phase D: intro overlay added ({ffprobe_duration(intro_normalized):.2f}s)")
+def _match_overlay_format(
+    main_video: Path, reference: Path, assembly_dir: Path, hwaccel: str
+) -> Path:
+    """Return main_video, or a copy re-encoded only as far as concat needs.
+
+    The main video comes out of our own encoder settings, so usually it
+    already matches the normalized overlays and goes into the concat as-is.
+    Otherwise only the streams that differ are re-encoded.
+    """
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        main_streams, reference_streams = pool.map(
+            probe_streams, (main_video, reference)
+        )
+    if main_streams == reference_streams:
+        log("Phase D: main video already matches overlay format")
+        return main_video
 
-    # Normalize main video to match overlay format for reliable concat
+    if main_streams.get("video") == reference_streams.get("video"):
+        video_args = ["-c:v", "copy"]
+    else:
+        video_args = [
+            "-vf",
+            "fps=30,format=yuv420p",
+            *build_video_codec_args(hwaccel),
+        ]
     main_normalized = assembly_dir / "main-for-concat.mp4"
-    cmd_norm = [
+    cmd = [
         FFMPEG_BIN,
         "-y",
         "-i",
         str(main_video),
-        "-vf",
-        "fps=30,format=yuv420p",
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
+        *video_args,
         "-ac",
         "1",
         "-ar",
@@ -1066,21 +2070,49 @@ def apply_overlays(
         "+faststart",
         str(main_normalized),
     ]
-    run_cmd(cmd_norm, "Normalize main video for overlay concat")
-    clips_to_concat.append(main_normalized)
-
-    if outro_raw:
-        outro_path = Path(os.path.expanduser(str(outro_raw))).resolve()
-        if not outro_path.exists():
-            raise TourError(f"Outro overlay clip not found: {outro_path}")
-        outro_normalized = assembly_dir / "outro-normalized.mp4"
-        normalize_overlay_clip(outro_path, outro_normalized)
-        clips_to_concat.append(outro_normalized)
-        log(f"Phase D: outro overlay added ({ffprobe_duration(outro_normalized):.2f}s)")
-
-    if len(clips_to_concat) == 1:
+    run_cmd(cmd, "Normalize main video for overlay concat")
+    return main_normalized
+
+
+def apply_overlays(
+    spec: dict[str, Any],
+    main_video: Path,
+    assembly_dir: Path,
+    hwaccel: str = "none",
+    prepared: dict[str, Path] | None = None,
+) -> Path:
+    """Prepend intro and/or append outro overlay clips to the main video.
+
+    Reads intro_clip and outro_clip paths from spec['output'].
+    If neither is set, returns main_video unchanged. prepared holds the
+    output of prepare_overlays() when it already ran during capture.
+    """
+    intro_raw = spec["output"].get("intro_clip")
+    outro_raw = spec["output"].get("outro_clip")
+
+    if not intro_raw and not outro_raw:
         return main_video
 
+    if prepared is None:
+        prepared = prepare_overlays(spec, assembly_dir, hwaccel)
+    intro_normalized = prepared.get("intro")
+    outro_normalized = prepared.get("outro")
+    durations = media_durations(list(prepared.values()))
+    if intro_normalized is not None:
+        log(f"Phase D: intro overlay added ({durations[intro_normalized]:.2f}s)")
+    if outro_normalized is not None:
+        log(f"Phase D: outro overlay added ({durations[outro_normalized]:.2f}s)")
+
+    reference = intro_normalized or outro_normalized
+    main_for_concat = _match_overlay_format(
+        main_video, reference, assembly_dir, hwaccel
+    )
+    clips_to_concat = [
+        clip
+        for clip in (intro_normalized, main_for_concat, outro_normalized)
+        if clip is not None
+    ]
+
     concat_list = assembly_dir / "overlay-concat.txt"
     with concat_list.open("w", encoding="utf-8") as handle:
         for clip in clips_to_concat:
@@ -1108,30 +2140,37 @@ def apply_overlays(
 
     # Replace the original output with the overlay version
     os.replace(final_with_overlays, main_video)
-    log(f"Phase D: final video with overlays ({ffprobe_duration(main_video):.2f}s)")
+    log(f"Phase D: final video with overlays ({media_duration(main_video):.2f}s)")
     return main_video
 
 
-def mux_audio_with_offset(
-    video_mp4: Path, audio_wav: Path, output_mp4: Path, audio_duration: float
+def transcode_and_mux(
+    webm_path: Path,
+    audio_wav: Path,
+    output_mp4: Path,
+    audio_duration: float,
+    threads: int = 0,
+    hwaccel: str = "none",
+    video_filter: str = NORMALIZE_VF,
 ) -> None:
-    base_duration = ffprobe_duration(video_mp4)
-    required_duration = audio_duration + 1.0
-    extra = max(0.0, required_duration - base_duration)
-    filter_parts: list[str] = []
-    if extra > 0:
-        filter_parts.append(f"[0:v]tpad=stop_mode=clone:stop_duration={extra:.3f}[v0]")
-        video_input = "[v0]"
-    else:
-        video_input = "[0:v]"
-    filter_parts.append(f"{video_input}setpts=PTS-STARTPTS[v]")
-    filter_parts.append("[1:a]adelay=1000|1000,asetpts=PTS-STARTPTS[a]")
+    """Normalize a step recording and lay its narration on it in one encode.
+
+    The narration starts one second in. The last frame is held for
+    audio_duration + 1s and -shortest trims to the end of the narration, so
+    the clip's own length never needs probing.
+    """
+    hold = audio_duration + 1.0
+    filter_parts = [
+        f"[0:v]{video_filter},tpad=stop_mode=clone:stop_duration={hold:.3f},"
+        "setpts=PTS-STARTPTS[v]",
+        "[1:a]adelay=1000|1000,asetpts=PTS-STARTPTS[a]",
+    ]
 
     cmd = [
         FFMPEG_BIN,
         "-y",
         "-i",
-        str(video_mp4),
+        str(webm_path),
         "-i",
         str(audio_wav),
         "-filter_complex",
@@ -1140,12 +2179,7 @@ def mux_audio_with_offset(
         "[v]",
         "-map",
         "[a]",
-        "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
+        *build_video_codec_args(hwaccel),
         "-c:a",
         "aac",
         "-b:a",
@@ -1153,9 +2187,11 @@ def mux_audio_with_offset(
         "-movflags",
         "+faststart",
         "-shortest",
+        "-threads",
+        str(threads),
         str(output_mp4),
     ]
-    run_cmd(cmd, f"Mux narration for {video_mp4.name}")
+    run_cmd(cmd, f"Encode step clip {webm_path.name}")
 
 
 def concat_step_clips(
@@ -1170,6 +2206,8 @@ def concat_step_clips(
         for clip in step_mp4s:
             handle.write(f"file '{clip.as_posix()}'\n")
 
+    # Every step clip comes out of the same encoder settings, so the video is
+    # stream-copied; only the audio is re-encoded when loudnorm is applied.
     cmd = [
         FFMPEG_BIN,
         "-y",
@@ -1180,21 +2218,24 @@ def concat_step_clips(
         "-i",
         str(concat_list),
         "-c:v",
-        "libx264",
-        "-preset",
-        "medium",
-        "-crf",
-        "20",
-        "-c:a",
-        "aac",
-        "-b:a",
-        "192k",
+        "copy",
         "-movflags",
         "+faststart",
     ]
 
     if use_loudnorm:
-        cmd.extend(["-af", "loudnorm=I=-16:TP=-1.5:LRA=11"])
+        cmd.extend(
+            [
+                "-af",
+                "loudnorm=I=-16:TP=-1.5:LRA=11",
+                "-c:a",
+                "aac",
+                "-b:a",
+                "192k",
+            ]
+        )
+    else:
+        cmd.extend(["-c:a", "copy"])
 
     cmd.extend(["-t", f"{target_duration:.3f}", str(final_output)])
     run_cmd(cmd, "Concatenate final tour video")
@@ -1204,23 +2245,39 @@ def assemble_video(
     spec: dict[str, Any],
     results: list[StepResult],
     dirs: dict[str, Path],
+    hwaccel: str = "none",
 ) -> Path:
     log("Phase D: assembling clips with ffmpeg")
     assembly_dir = dirs["assembly"]
-    per_step_muxed: list[Path] = []
 
     for result in results:
         if not result.success or result.clip_path is None:
             raise TourError(f"Cannot assemble failed step {result.step_id}")
 
-        normalized = assembly_dir / f"step-{result.step_id}-normalized.mp4"
-        muxed = assembly_dir / f"step-{result.step_id}-muxed.mp4"
+    # Each step is an independent x264 encode, so run several steps at once
+    # and split the cores between them instead of oversubscribing.
+    cpus = os.cpu_count() or 1
+    workers = max(1, min(len(results), cpus))
+    threads = max(1, cpus // workers)
 
-        transcode_step_clip(result.clip_path, normalized)
-        mux_audio_with_offset(
-            normalized, result.audio_path, muxed, result.audio_duration
+    def _process_step(result: StepResult) -> Path:
+        muxed = assembly_dir / f"step-{result.step_id}-muxed.mp4"
+        if result.video_params is None:
+            result.video_params = probe_video_params(result.clip_path)
+        transcode_and_mux(
+            result.clip_path,
+            result.audio_path,
+            muxed,
+            result.audio_duration,
+            threads=threads,
+            hwaccel=hwaccel,
+            video_filter=normalize_filter(result.video_params),
         )
-        per_step_muxed.append(muxed)
+        return muxed
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_process_step, result) for result in results]
+        per_step_muxed = [future.result() for future in futures]
 
     final_path = Path(os.path.expanduser(str(spec["output"]["path"]))).resolve()
     final_path.parent.mkdir(parents=True, exist_ok=True)
@@ -1243,6 +2300,7 @@ def assemble_continuous_video(
     spec: dict[str, Any],
     results: list[StepResult],
     dirs: dict[str, Path],
+    hwaccel: str = "none",
 ) -> Path:
     log("Phase D: assembling continuous capture with ffmpeg")
     if not results:
@@ -1252,13 +2310,12 @@ def assemble_continuous_video(
     if source_clip is None:
         raise TourError("Missing continuous capture clip for assembly")
 
-    assembly_dir = dirs["assembly"]
-    normalized = assembly_dir / "continuous-normalized.mp4"
-    transcode_step_clip(source_clip, normalized)
-
-    filter_parts: list[str] = []
+    # The recording goes straight into the final encode; the normalize chain
+    # (just fps=30 for an x11grab capture) runs inside the same filter graph
+    video_filter = normalize_filter(probe_video_params(source_clip))
+    filter_parts: list[str] = [f"[0:v]{video_filter}[v]"]
     delayed_labels: list[str] = []
-    cmd: list[str] = [FFMPEG_BIN, "-y", "-i", str(normalized)]
+    cmd: list[str] = [FFMPEG_BIN, "-y", "-i", str(source_clip)]
 
     for index, result in enumerate(results, start=1):
         cmd.extend(["-i", str(result.audio_path)])
@@ -1284,15 +2341,10 @@ def assemble_continuous_video(
             "-filter_complex",
             ";".join(filter_parts),
             "-map",
-            "0:v",
+            "[v]",
             "-map",
             "[aout]",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "medium",
-            "-crf",
-            "20",
+            *build_video_codec_args(hwaccel),
             "-c:a",
             "aac",
             "-b:a",
@@ -1337,7 +2389,7 @@ def print_report(
 
     if final_path and final_path.exists():
         size_mb = final_path.stat().st_size / (1024 * 1024)
-        duration = ffprobe_duration(final_path)
+        duration = media_duration(final_path)
         log(f"Output: {final_path}")
         log(f"Output duration: {duration:.2f}s")
         log(f"Output size: {size_mb:.2f} MB")
@@ -1422,7 +2474,7 @@ def _maybe_nvenc_reencode(
     nvenc_path = results.get(output_name)
     if nvenc_path and nvenc_path.exists():
         os.replace(nvenc_path, video_path)
-        log(f"Phase D: NVENC re-encode complete ({ffprobe_duration(video_path):.2f}s)")
+        log(f"Phase D: NVENC re-encode complete ({media_duration(video_path):.2f}s)")
     else:
         log("Phase D: NVENC re-encode failed, keeping local encode")
 
@@ -1572,122 +2624,120 @@ def build_camera_path(
 
 
 
+def _crop_window(
+    zoom: float, cx: float, cy: float, src_w: int, src_h: int
+) -> tuple[int, int, int, int]:
+    """Even-sized crop (w, h, x, y) for a camera state, clamped to the frame."""
+    w = max(2, int(src_w / zoom) // 2 * 2)
+    h = max(2, int(src_h / zoom) // 2 * 2)
+    x = max(0, min(int(cx - w / 2), src_w - w))
+    y = max(0, min(int(cy - h / 2), src_h - h))
+    return w, h, x, y
+
+
 def _build_zoom_filter_complex(
     keyframes: list[CameraKeyframe],
+    command_file: Path,
     fps: int = 30,
     src_w: int = 1920,
     src_h: int = 1080,
-) -> str:
-    """Build FFmpeg filter_complex for segment-based zoom.
-
-    Strategy: split the video into segments at each keyframe, apply a static
-    crop+scale per segment, and concat them back.  Transition segments get a
-    linear interpolation of crop parameters from the previous state to the
-    current state using the 'n' frame counter.  This is orders of magnitude
-    faster than zoompan because crop+scale is a trivial per-frame operation.
+    scaler: str = "zscale",
+) -> tuple[str, str]:
+    """Build the zoom filter graph and the sendcmd script that drives it.
+
+    Strategy: one crop+scale over the whole stream.  The crop window is
+    computed in Python for every point it changes — once per held keyframe,
+    once per frame while easing (smoothstep over transition_ms) from the
+    previous state — and sendcmd retargets the crop at those timestamps.
+    crop only evaluates w/h at configuration, so the commands are what lets
+    the window size animate; the scaler after it absorbs the size changes.
+
+    scaler picks the upscale back to full frame: "zscale" (libzimg Lanczos,
+    much cheaper than swscale's at the same quality) or "lanczos" (swscale,
+    for ffmpeg builds without libzimg).
+
+    Returns ("", "") when there is nothing to animate.
     """
     if not keyframes or len(keyframes) < 2:
-        return ""
+        return "", ""
 
-    parts: list[str] = []
-    seg_labels: list[str] = []
+    windows: list[tuple[float, tuple[int, int, int, int]]] = []
+
+    def _add(time_s: float, window: tuple[int, int, int, int]) -> None:
+        if not windows or windows[-1][1] != window:
+            windows.append((time_s, window))
 
     for i in range(1, len(keyframes)):
         prev = keyframes[i - 1]
         curr = keyframes[i]
-        t0 = prev.time
-        t1 = curr.time
-        seg_dur = t1 - t0
+        seg_dur = curr.time - prev.time
         if seg_dur <= 0:
             continue
 
         trans_dur = min(curr.transition_ms / 1000.0, seg_dur)
         trans_frames = max(1, int(trans_dur * fps))
-        seg_frames = max(1, int(seg_dur * fps))
-
-        # Trim this segment from the input
-        seg_label = f"seg{i}"
-        aseg_label = f"aseg{i}"
-        parts.append(
-            f"[0:v]trim=start={t0:.4f}:end={t1:.4f},setpts=PTS-STARTPTS[{seg_label}_raw]"
-        )
-        parts.append(
-            f"[0:a]atrim=start={t0:.4f}:end={t1:.4f},asetpts=PTS-STARTPTS[{aseg_label}]"
-        )
-
-        # Compute crop parameters — zoom determines crop window size
-        # During the transition region (first trans_frames), interpolate
-        # from prev state to curr state.  After that, hold at curr state.
-        # crop w/h: floor(src_dim / zoom / 2) * 2  (even dimensions)
-        # crop x/y: clip(cx - w/2, 0, src_dim - w)
-        #
-        # Use 'n' (frame count in the segment, 0-indexed) for interpolation.
         if abs(prev.zoom - curr.zoom) < 0.001 and abs(prev.cx - curr.cx) < 1 and abs(prev.cy - curr.cy) < 1:
-            # Static segment — no interpolation needed (fastest path)
-            w = max(2, int(src_w / curr.zoom) // 2 * 2)
-            h = max(2, int(src_h / curr.zoom) // 2 * 2)
-            x = max(0, min(int(curr.cx - w / 2), src_w - w))
-            y = max(0, min(int(curr.cy - h / 2), src_h - h))
-            parts.append(
-                f"[{seg_label}_raw]crop={w}:{h}:{x}:{y},"
-                f"scale={src_w}:{src_h}:flags=lanczos,setsar=1[{seg_label}]"
-            )
-        else:
-            # Animated segment — smoothstep interpolation via 'n' frame counter
-            # Commas inside expressions must be escaped as \, in filter_complex
-            # p = clip(n / trans_frames, 0, 1)
-            p = f"clip(n/{trans_frames}\\,0\\,1)"
-            # Smoothstep: s = p*p*(3-2*p)
-            s = f"({p}*{p}*(3-2*{p}))"
-
-            z_expr = f"{prev.zoom:.3f}+{curr.zoom - prev.zoom:.3f}*{s}"
-            cx_expr = f"{prev.cx:.1f}+{curr.cx - prev.cx:.1f}*{s}"
-            cy_expr = f"{prev.cy:.1f}+{curr.cy - prev.cy:.1f}*{s}"
-
-            w_expr = f"max(2\\,floor({src_w}/({z_expr})/2)*2)"
-            h_expr = f"max(2\\,floor({src_h}/({z_expr})/2)*2)"
-            x_expr = f"clip(({cx_expr})-({w_expr})/2\\,0\\,{src_w}-({w_expr}))"
-            y_expr = f"clip(({cy_expr})-({h_expr})/2\\,0\\,{src_h}-({h_expr}))"
-
-            parts.append(
-                f"[{seg_label}_raw]crop=w='{w_expr}':h='{h_expr}':x='{x_expr}':y='{y_expr}',"
-                f"scale={src_w}:{src_h}:flags=lanczos,setsar=1[{seg_label}]"
+            _add(prev.time, _crop_window(curr.zoom, curr.cx, curr.cy, src_w, src_h))
+            continue
+        for n in range(trans_frames + 1):
+            p = n / trans_frames
+            s = p * p * (3 - 2 * p)
+            _add(
+                prev.time + n / fps,
+                _crop_window(
+                    prev.zoom + (curr.zoom - prev.zoom) * s,
+                    prev.cx + (curr.cx - prev.cx) * s,
+                    prev.cy + (curr.cy - prev.cy) * s,
+                    src_w,
+                    src_h,
+                ),
             )
 
-        seg_labels.append(f"[{seg_label}][{aseg_label}]")
+    if not windows:
+        return "", ""
 
-    if not seg_labels:
-        return ""
-
-    # Concat all segments back together
-    concat_inputs = "".join(seg_labels)
-    parts.append(
-        f"{concat_inputs}concat=n={len(seg_labels)}:v=1:a=1[vout][aout]"
+    script = "".join(
+        f"{time_s:.4f} crop w {w}, crop h {h}, crop x {x}, crop y {y};\n"
+        for time_s, (w, h, x, y) in windows[1:]
     )
-
-    return ";".join(parts)
+    if scaler == "zscale":
+        upscale = f"zscale=w={src_w}:h={src_h}:f=lanczos"
+    else:
+        upscale = f"scale={src_w}:{src_h}:flags=lanczos"
+    w, h, x, y = windows[0][1]
+    graph = (
+        f"[0:v]sendcmd=f='{command_file.as_posix()}',"
+        f"crop=w={w}:h={h}:x={x}:y={y},{upscale},setsar=1[vout]"
+    )
+    return graph, script
 
 
 def apply_zoom_pan(
     video_path: Path,
     keyframes: list[CameraKeyframe],
     assembly_dir: Path,
+    hwaccel: str = "none",
 ) -> Path:
-    """Apply dynamic zoom/pan to assembled video using segment-based crop+scale.
+    """Apply dynamic zoom/pan to assembled video with a sendcmd-driven crop.
 
-    Splits the video at keyframe boundaries, applies static or interpolated
-    crop+scale per segment, then concatenates them back.  Much faster than
-    zoompan because crop+scale is a trivial per-frame operation.
+    A single crop+scale pass over the video follows the keyframes; the audio
+    is copied through untouched.  Much faster than zoompan because
+    crop+scale is a trivial per-frame operation.
     """
     if not keyframes or len(keyframes) < 2:
         log("Phase E: skipping zoom (no keyframes)")
         return video_path
 
-    fc_expr = _build_zoom_filter_complex(keyframes)
+    command_file = assembly_dir / "zoom-commands.txt"
+    scaler = "zscale" if ffmpeg_has_filter("zscale") else "lanczos"
+    fc_expr, commands = _build_zoom_filter_complex(
+        keyframes, command_file, scaler=scaler
+    )
     if not fc_expr:
         return video_path
+    command_file.write_text(commands, encoding="utf-8")
 
-    # Write filter_complex to a script file (can be very long)
+    # Write filter_complex to a script file (keeps argv free of quoting)
     filter_script = assembly_dir / "zoom-filter.txt"
     filter_script.write_text(fc_expr, encoding="utf-8")
 
@@ -1697,12 +2747,9 @@ def apply_zoom_pan(
         "-i", str(video_path),
         "-/filter_complex", str(filter_script),
         "-map", "[vout]",
-        "-map", "[aout]",
-        "-c:v", "libx264",
-        "-preset", "medium",
-        "-crf", "20",
-        "-c:a", "aac",
-        "-b:a", "192k",
+        "-map", "0:a",
+        *build_video_codec_args(hwaccel),
+        "-c:a", "copy",
         "-movflags", "+faststart",
         str(zoomed_path),
     ]
@@ -1711,7 +2758,7 @@ def apply_zoom_pan(
     # Replace original with zoomed version (may cross filesystem boundaries)
     shutil.copy2(zoomed_path, video_path)
     zoomed_path.unlink(missing_ok=True)
-    log(f"Phase E: zoom/pan applied ({ffprobe_duration(video_path):.2f}s)")
+    log(f"Phase E: zoom/pan applied ({media_duration(video_path):.2f}s)")
     return video_path
 
 
@@ -1728,7 +2775,7 @@ def _maybe_apply_zoom(
         return video_path
 
     log(f"Phase E: generating camera path (zoom={zoom_mode})")
-    total_duration = ffprobe_duration(video_path)
+    total_duration = media_duration(video_path)
     keyframes = build_camera_path(spec, results, total_duration)
 
     if zoom_mode == "mobile":
@@ -1738,7 +2785,9 @@ def _maybe_apply_zoom(
                 kf.zoom = min(kf.zoom * 1.15, 3.0)
 
     log(f"Phase E: {len(keyframes)} keyframes over {total_duration:.1f}s")
-    return apply_zoom_pan(video_path, keyframes, assembly_dir)
+    return apply_zoom_pan(
+        video_path, keyframes, assembly_dir, getattr(args, "hwaccel", "none")
+    )
 
 def _coerce_audio_paths(step_audio: dict[str, Any]) -> dict[str, Path]:
     audio_paths: dict[str, Path] = {}
@@ -1774,7 +2823,7 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Shot-based autonomous narrated website tour recorder"
     )
-    parser.add_argument("spec", help="Path to tour spec JSON")
+    parser.add_argument("spec", nargs="?", help="Path to tour spec JSON")
     parser.add_argument(
         "--dry-run", action="store_true", help="Validate and prerender TTS only"
     )
@@ -1787,6 +2836,29 @@ def parse_args() -> argparse.Namespace:
         "--work-dir",
         help="Use an existing work directory (required for --skip-tts reuse)",
     )
+    parser.add_argument(
+        "--x11-capture",
+        metavar="DISPLAY",
+        help="Record steps by grabbing this X display (e.g. :99) with ffmpeg and "
+        "a hardware H.264 encoder instead of Playwright's WebM recorder; "
+        "Chromium runs headed on that display",
+    )
+    parser.add_argument(
+        "--clean-profile",
+        action="store_true",
+        help=f"Delete the reused Chromium profile ({PROFILE_DIR}) before capture",
+    )
+    parser.add_argument(
+        "--persistent-tts",
+        action="store_true",
+        help=f"Run a TTS daemon on {TTS_SOCKET} that keeps Kokoro loaded; "
+        "later runs synthesize through it instead of loading the model",
+    )
+    parser.add_argument(
+        "--fp32-tts",
+        action="store_true",
+        help="Use the fp32 Kokoro model instead of the int8-quantized one",
+    )
     parser.add_argument(
         "--tts-backend",
         choices=["local", "colab", "colab-f5"],
@@ -1809,6 +2881,13 @@ def parse_args() -> argparse.Namespace:
         default="local",
         help="Video encoding backend: 'local' (libx264 CPU) or 'colab-nvenc' (T4 GPU NVENC)",
     )
+    parser.add_argument(
+        "--hwaccel",
+        choices=["none", "nvenc"],
+        default="none",
+        help="Local hardware encoder for assembly, zoom and overlay encodes: "
+        "'none' (libx264) or 'nvenc' (h264_nvenc on this machine's GPU)",
+    )
     parser.add_argument(
         "--nvenc-drive-path",
         help="Path to Google Drive sync dir for NVENC encoding jobs (default: ~/gdrive/autonomous-recording/encode-jobs)",
@@ -1825,7 +2904,10 @@ def parse_args() -> argparse.Namespace:
         default="off",
         help="Dynamic zoom/pan: 'off' (disabled), 'auto' (standard zoom), 'mobile' (stronger zoom for phones)",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.spec is None and not args.persistent_tts:
+        parser.error("the following arguments are required: spec")
+    return args
 
 
 def main() -> int:
@@ -1834,6 +2916,10 @@ def main() -> int:
 
     try:
         ensure_tooling()
+        if args.persistent_tts:
+            return serve_tts(fp32=args.fp32_tts)
+        if args.hwaccel == "nvenc" and hw_video_encoder() != "h264_nvenc":
+            raise TourError("--hwaccel nvenc needs an ffmpeg build with h264_nvenc")
         spec_path = Path(args.spec).resolve()
         spec = load_tour_spec(spec_path)
         selected_work_dir = (
@@ -1877,9 +2963,15 @@ def main() -> int:
                 )
             else:
                 step_audio = prerender_tts_mixed(
-                    spec, dirs["audio"], skip_tts=args.skip_tts
+                    spec,
+                    dirs["audio"],
+                    skip_tts=args.skip_tts,
+                    fp32_tts=args.fp32_tts,
                 )
 
+            overlay_prep = None
+            if not args.dry_run:
+                overlay_prep = start_overlay_prep(spec, dirs["assembly"], args.hwaccel)
             log("Phase C: running mixed capture (slides + demos)")
             results = run_mixed_capture(
                 spec, step_audio, dirs, slides_dir, dry_run=args.dry_run
@@ -1887,7 +2979,9 @@ def main() -> int:
 
             final_path: Path | None = None
             if not args.dry_run:
-                final_path = assemble_mixed_video(spec, results, step_audio, dirs)
+                final_path = assemble_mixed_video(
+                    spec, results, step_audio, dirs, hwaccel=args.hwaccel
+                )
                 if final_path is not None:
                     final_path = _maybe_apply_zoom(
                         final_path, spec, results, args, dirs["assembly"]
@@ -1898,7 +2992,13 @@ def main() -> int:
                     )
                 # Apply intro/outro overlays if configured
                 if final_path is not None:
-                    final_path = apply_overlays(spec, final_path, dirs["assembly"])
+                    final_path = apply_overlays(
+                        spec,
+                        final_path,
+                        dirs["assembly"],
+                        hwaccel=args.hwaccel,
+                        prepared=overlay_prep.result() if overlay_prep else None,
+                    )
         else:
             # Traditional step-based workflow
             for step in spec["steps"]:
@@ -1913,25 +3013,48 @@ def main() -> int:
             elif args.tts_backend == "colab-f5":
                 step_audio = _dispatch_colab_f5_tts(spec, dirs["audio"], args)
             else:
-                step_audio = prerender_tts(spec, dirs["audio"], skip_tts=args.skip_tts)
+                step_audio = asyncio.run(
+                    prerender_tts(
+                        spec,
+                        dirs["audio"],
+                        skip_tts=args.skip_tts,
+                        fp32_tts=args.fp32_tts,
+                    )
+                )
+            overlay_prep = None
+            if not args.dry_run:
+                overlay_prep = start_overlay_prep(spec, dirs["assembly"], args.hwaccel)
             mode = str(spec["settings"].get("mode", "independent"))
             if mode == "continuous":
                 log("Phase C: running in continuous capture mode")
                 results = run_continuous_capture(
-                    spec, step_audio, dirs, dry_run=args.dry_run
+                    spec,
+                    step_audio,
+                    dirs,
+                    dry_run=args.dry_run,
+                    screen_display=args.x11_capture,
                 )
             else:
                 log("Phase C: running in independent capture mode")
                 results = run_capture_phase(
-                    spec, step_audio, dirs, dry_run=args.dry_run
+                    spec,
+                    step_audio,
+                    dirs,
+                    dry_run=args.dry_run,
+                    screen_display=args.x11_capture,
+                    clean_profile=args.clean_profile,
                 )
 
             final_path: Path | None = None
             if not args.dry_run:
                 if mode == "continuous":
-                    final_path = assemble_continuous_video(spec, results, dirs)
+                    final_path = assemble_continuous_video(
+                        spec, results, dirs, hwaccel=args.hwaccel
+                    )
                 else:
-                    final_path = assemble_video(spec, results, dirs)
+                    final_path = assemble_video(
+                        spec, results, dirs, hwaccel=args.hwaccel
+                    )
                 if final_path is not None:
                     final_path = _maybe_apply_zoom(
                         final_path, spec, results, args, dirs["assembly"]
@@ -1942,7 +3065,13 @@ def main() -> int:
                     )
                 # Apply intro/outro overlays if configured
                 if final_path is not None:
-                    final_path = apply_overlays(spec, final_path, dirs["assembly"])
+                    final_path = apply_overlays(
+                        spec,
+                        final_path,
+                        dirs["assembly"],
+                        hwaccel=args.hwaccel,
+                        prepared=overlay_prep.result() if overlay_prep else None,
+                    )
 
         print_report(spec, results, final_path, started)
         return 0
@@ -2088,10 +3217,7 @@ def record_slide_segment(
         page.evaluate("window.slideViewer.startAutoAdvance()")
 
         # Wait for audio duration + padding
-        import soundfile as sf
-
-        audio_duration, _ = sf.read(audio_path)
-        duration = len(audio_duration) / sf.info(audio_path).samplerate
+        duration = wav_duration(audio_path)
 
         page.wait_for_timeout(int(duration * 1000) + 1000)
 
@@ -2204,10 +3330,7 @@ def record_demo_segment(
             run_action(page, action)
 
         # Wait for audio to finish
-        import soundfile as sf
-
-        audio_duration, _ = sf.read(audio_path)
-        duration = len(audio_duration) / sf.info(audio_path).samplerate
+        duration = wav_duration(audio_path)
         page.wait_for_timeout(int(duration * 1000))
 
         context.close()
@@ -2284,7 +3407,10 @@ def run_action(page, action: dict[str, Any]) -> None:
 
 
 def prerender_tts_mixed(
-    spec: dict[str, Any], audio_dir: Path, skip_tts: bool = False
+    spec: dict[str, Any],
+    audio_dir: Path,
+    skip_tts: bool = False,
+    fp32_tts: bool = False,
 ) -> dict[str, Path]:
     """Prerender TTS audio for segment-based specs."""
     segments = spec.get("segments", [])
@@ -2293,7 +3419,7 @@ def prerender_tts_mixed(
     voice = spec["settings"].get("voice", "am_michael")
     speed = float(spec["settings"].get("speech_speed", 1.0))
 
-    kokoro = Kokoro(KOKORO_MODEL, KOKORO_VOICES)
+    kokoro = _get_kokoro(fp32=fp32_tts)
 
     for segment in segments:
         seg_id = segment["id"]
@@ -2310,10 +3436,10 @@ def prerender_tts_mixed(
         else:
             log(f"Phase B: generating TTS for segment {seg_id}")
             try:
-                samples, sample_rate = kokoro.create(
-                    narration, voice=voice, speed=speed, lang="en-us"
+                samples, sample_rate = synthesize_pcm16(
+                    kokoro, narration, voice, speed, "en-us"
                 )
-                sf.write(output_path, samples, sample_rate)
+                write_wav_atomic(output_path, samples, sample_rate)
                 log(f"Phase B: saved {output_path.name}")
             except Exception as exc:
                 raise TourError(f"TTS failed for segment {seg_id}: {exc}") from exc
@@ -2328,6 +3454,7 @@ def assemble_mixed_video(
     results: list[StepResult],
     step_audio: dict[str, Path],
     dirs: dict[str, Path],
+    hwaccel: str = "none",
 ) -> Path:
     """Assemble mixed slide/demo segments with audio into final video."""
     log("Phase D: assembling mixed segment video with audio")
@@ -2385,12 +3512,7 @@ def assemble_mixed_video(
             str(audio_path),
             "-vf",
             "fps=30,format=yuv420p",
-            "-c:v",
-            "libx264",
-            "-preset",
-            "medium",
-            "-crf",
-            "20",
+            *build_video_codec_args(hwaccel),
             "-ac",
             "1",
             "-ar",
@@ -2438,7 +3560,7 @@ def assemble_mixed_video(
     for clip in normalized_clips:
         clip.unlink(missing_ok=True)
 
-    log(f"Phase D: final video assembled ({ffprobe_duration(final_path):.2f}s)")
+    log(f"Phase D: final video assembled ({media_duration(final_path):.2f}s)")
     return final_path
 
 